@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import dtype, fromfile, memmap, prod, uint8, zeros
+
+from .schedule import toposort
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy import dtype as DType
+    from numpy.typing import NDArray
+
+    from .input import Input
+    from .node import Node
+    from .output import Output
+
+
+class Arena:
+    """
+    The single contiguous buffer for the data of the graph.
+
+    The not yet allocated outputs and inputs of the nodes are assigned the aligned views
+    into the arena, placed in the topological order. The buffer may be memory mapped to a file,
+    which makes it possible to share the state of the graph between the processes.
+
+    The outputs, which were created with data (e.g. `Array` in the "store" mode),
+    keep their own buffers and are not the part of the arena.
+    """
+
+    __slots__ = ("_buffer", "_nodes", "_edges", "_filename")
+
+    alignment: int = 64
+
+    _buffer: NDArray
+    _nodes: list[Node]
+    _edges: list[tuple[Input | Output, bool, int, DType, tuple[int, ...]]]
+    _filename: str | None
+
+    def __init__(self, nodes: Iterable[Node], *, filename: str | None = None):
+        nodes = list(nodes)
+        nodeset = set(nodes)
+        self._filename = filename
+        self._nodes = []
+        self._edges = []
+
+        offset = 0
+        for node in toposort(nodes):
+            if node not in nodeset:
+                continue
+            nedges = len(self._edges)
+            for edge, is_output, dd in self._iter_unallocated(node):
+                edge_dtype = dtype(dd.dtype)
+                nbytes = int(prod(dd.shape)) * edge_dtype.itemsize
+                self._edges.append((edge, is_output, offset, edge_dtype, tuple(dd.shape)))
+                offset += -(-nbytes // self.alignment) * self.alignment
+            if len(self._edges) > nedges:
+                self._nodes.append(node)
+
+        size = max(offset, self.alignment)
+        if filename is None:
+            raw = zeros(size + self.alignment, dtype=uint8)
+            start = -raw.ctypes.data % self.alignment
+            self._buffer = raw[start : start + size]
+        else:
+            self._buffer = memmap(filename, dtype=uint8, mode="w+", shape=(size,))
+
+        for edge, is_output, offset, edge_dtype, shape in self._edges:
+            nbytes = int(prod(shape)) * edge_dtype.itemsize
+            view = self._buffer[offset : offset + nbytes].view(edge_dtype).reshape(shape)
+            if is_output:
+                edge._set_data(view, owns_buffer=True)
+            else:
+                edge.set_own_data(view, owns_buffer=True)
+        for node in self._nodes:
+            node.fd.needs_postallocate = True
+
+    @staticmethod
+    def _iter_unallocated(node: Node):
+        for input in node.inputs.iter_all():
+            dd = input.own_dd
+            if (
+                input.allocatable
+                and input.own_data is None
+                and dd.shape is not None
+                and dd.dtype is not None
+            ):
+                yield input, False, dd
+        for output in node.outputs.iter_all():
+            dd = output.dd
+            if (
+                output.allocatable
+                and not output.has_data
+                and output._allocating_input is None
+                and dd.shape is not None
+                and dd.dtype is not None
+            ):
+                yield output, True, dd
+
+    @property
+    def buffer(self) -> NDArray:
+        return self._buffer
+
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+
+    @property
+    def filename(self) -> str | None:
+        return self._filename
+
+    @property
+    def nodes(self) -> list[Node]:
+        """The nodes, which have data in the arena"""
+        return self._nodes
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def flush(self) -> None:
+        if isinstance(self._buffer, memmap):
+            self._buffer.flush()
+
+    def snapshot(self) -> NDArray:
+        """Returns the copy of the arena"""
+        return self._buffer.copy()
+
+    def restore(self, data: NDArray, *, assume_valid: bool = False) -> None:
+        """
+        Copies the `data` (see `snapshot()`) into the arena.
+
+        By default the nodes with the data in the arena are tainted and will be recomputed.
+        With `assume_valid=True` the caller guarantees the snapshot corresponds to the current
+        values of the sources, and the nodes are marked as evaluated.
+        """
+        self._buffer[:] = data.view(uint8)
+        for node in self._nodes:
+            if assume_valid:
+                node.fd.tainted = False
+                node.fd.tainted_outputs = None
+            else:
+                node.taint()
+
+    def dump(self, filename: str) -> None:
+        """Writes the arena to a file"""
+        self._buffer.tofile(filename)
+
+    def load(self, filename: str, **kwargs) -> None:
+        """Reads the arena from a file, see `restore()`"""
+        self.restore(fromfile(filename, dtype=uint8, count=self._buffer.size), **kwargs)
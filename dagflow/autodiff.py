@@ -0,0 +1,174 @@
+"""
+The reverse-mode differentiation of the graph.
+
+The nodes, which set `_vjp_supported = True`, provide the vector-Jacobian product `_vjp()`:
+the cotangents of the inputs for the given cotangents of the outputs. The backward pass
+propagates the cotangent of the output from the output to the parameters in the reverse
+topological order, so the gradient of a scalar output (e.g. χ²) with respect to all
+the parameters costs a single evaluation and a single backward pass.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import asarray, broadcast_to, moveaxis, ones, zeros
+
+from .exception import DagflowError
+from .node import Node
+from .parameters import ParametersSetter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import ArrayLike, NDArray
+
+    from .input import Input
+    from .output import Output
+    from .parameters import Parameter
+    from .storage import NodeStorage
+    from .types import ShapeLike
+
+
+def reduce_to_shape(grad: NDArray, shape: ShapeLike) -> NDArray:
+    """Sums the cotangent over the dimensions, broadcasted by the forward evaluation"""
+    shape = tuple(shape)
+    if grad.shape == shape:
+        return grad
+    ndim = grad.ndim - len(shape)
+    if ndim:
+        grad = grad.sum(axis=tuple(range(ndim)))
+    axes = tuple(i for i, (n, m) in enumerate(zip(shape, grad.shape)) if n == 1 and m != 1)
+    if axes:
+        grad = grad.sum(axis=axes, keepdims=True)
+    return grad
+
+
+class Gradient:
+    """
+    The gradient of the `output` with respect to the `parameters` (the iterable or the storage,
+    see `ParametersSetter`), computed with the reverse-mode differentiation.
+
+    The nodes between the parameters and the output are found once: each of them must support
+    the vector-Jacobian product (`Node._vjp_supported`). The call evaluates the output and
+    returns the gradient for the current values of the parameters: the array of shape
+    `(npars,)`, or `(B, npars)` in the batch mode.
+
+    The parameters, linked by `NormalizeCorrelatedVars2`, are differentiated in the direction
+    of the last assignment: for the values after the values are set and for the normalized
+    values after the normalized values are set.
+    """
+
+    __slots__ = ("_output", "_parameters", "_nodes", "_inputs")
+
+    _output: Output
+    _parameters: list[Parameter]
+    # the nodes in the reverse topological order and the inputs, depending on the parameters
+    _nodes: list[Node]
+    _inputs: dict[Node, frozenset[Input]]
+
+    def __init__(self, output: Node | Output, parameters: NodeStorage | Iterable[Parameter]):
+        if isinstance(output, Node):
+            if len(output.outputs) != 1:
+                raise ValueError(f"The node {output} must have a single output")
+            output = output.outputs[0]
+        self._output = output
+        self._parameters = ParametersSetter(parameters).parameters
+
+        sources = {par._common_output for par in self._parameters}
+        self._nodes, self._inputs = _backward_schedule(output, sources)
+        for node in self._nodes:
+            if not node._vjp_supported:
+                raise DagflowError(
+                    "The node does not support the reverse-mode differentiation", node=node
+                )
+
+    @property
+    def output(self) -> Output:
+        return self._output
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        return self._parameters
+
+    def __call__(self, cotangent: ArrayLike | None = None) -> NDArray:
+        """
+        Returns the gradient of the output. For the output of size above 1 returns
+        the vector-Jacobian product with the `cotangent` of the shape of the output.
+        """
+        output = self._output
+        output.touch()
+        shape = output.dd.shape
+        if cotangent is None:
+            if output.dd.size != 1:
+                raise ValueError(f"The cotangent is required for the output of shape {shape}")
+            grad = ones(shape, dtype=output.dd.dtype)
+        else:
+            grad = broadcast_to(asarray(cotangent, dtype=output.dd.dtype), shape)
+
+        grads = {output: grad}
+        for node in self._nodes:
+            node_grads = {out: grads[out] for out in node.outputs.iter_all() if out in grads}
+            if not node_grads:
+                continue
+            for input, input_grad in node._vjp(node_grads, self._inputs[node]):
+                parent = input.parent_output
+                input_grad = reduce_to_shape(input_grad, parent.dd.shape)
+                # the cotangents may be shared between the inputs, do not add inplace
+                grads[parent] = grads[parent] + input_grad if parent in grads else input_grad
+
+        ret = [
+            grads[par._common_output][par._idx]
+            if par._common_output in grads
+            else zeros(asarray(par.value).shape, dtype=output.dd.dtype)
+            for par in self._parameters
+        ]
+        return moveaxis(asarray(ret), 0, -1)
+
+
+def gradient(
+    output: Node | Output,
+    parameters: NodeStorage | Iterable[Parameter],
+    cotangent: ArrayLike | None = None,
+) -> NDArray:
+    """Returns the gradient of the `output` with respect to the `parameters`, see `Gradient`"""
+    return Gradient(output, parameters)(cotangent)
+
+
+def _backward_schedule(
+    output: Output, sources: set[Output]
+) -> tuple[list[Node], dict[Node, frozenset[Input]]]:
+    """
+    Returns the nodes between the `sources` and the `output` in the reverse topological order
+    and the inputs of each node, which depend on the sources
+    """
+    order = []
+    inputs = {}
+    visited = set()
+
+    def depends(out: Output | None) -> bool:
+        return out is not None and (out in sources or bool(inputs.get(out.node)))
+
+    stack = [(output.node, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            inputs[node] = active = frozenset(
+                input for input in node.inputs.iter_all() if depends(input.parent_output)
+            )
+            if active:
+                order.append(node)
+            continue
+        if node in visited:
+            continue
+        visited.add(node)
+        stack.append((node, True))
+        for input in node.inputs.iter_all():
+            parent = input.parent_output
+            if parent is not None and parent not in sources and parent.node not in visited:
+                stack.append((parent.node, False))
+
+    if output not in sources and not inputs.get(output.node):
+        raise DagflowError("The output does not depend on the parameters", output=output)
+    order.reverse()
+    return order, inputs
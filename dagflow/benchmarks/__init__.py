@@ -0,0 +1,12 @@
+from .harness import Benchmark, benchmark, benchmarks, compare, format_comparison, read, run, save
+
+__all__ = [
+    "Benchmark",
+    "benchmark",
+    "benchmarks",
+    "compare",
+    "format_comparison",
+    "read",
+    "run",
+    "save",
+]
@@ -0,0 +1,50 @@
+"""
+Runs the benchmarks of the core engine and compares them with the baseline:
+
+    python -m dagflow.benchmarks -o results.json
+    python -m dagflow.benchmarks --quick -b baseline.json --tolerance 0.3
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+
+from .harness import benchmarks, compare, format_comparison, read, run, save
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m dagflow.benchmarks", description=__doc__)
+    parser.add_argument("-k", "--pattern", help="run only the benchmarks matching the pattern")
+    parser.add_argument("-l", "--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("-q", "--quick", action="store_true", help="run only the smallest sizes")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="the number of rounds")
+    parser.add_argument("-o", "--output", help="save the results to the JSON file")
+    parser.add_argument("-b", "--baseline", help="compare with the baseline JSON file")
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=0.2, help="the allowed relative slowdown"
+    )
+    opts = parser.parse_args(args)
+
+    if opts.list:
+        for bench in benchmarks(opts.pattern):
+            print(f"{bench.name:<30s} sizes={bench.sizes}")
+        return 0
+
+    results = run(opts.pattern, quick=opts.quick, repeat=opts.repeat, verbose=True)
+    if opts.output:
+        save(results, opts.output)
+        print(f"Save results: {opts.output}")
+
+    if not opts.baseline:
+        return 0
+
+    comparison = compare(results, read(opts.baseline), tolerance=opts.tolerance)
+    print(format_comparison(comparison))
+    nslower = sum(status == "slower" for *_, status in comparison)
+    if nslower:
+        print(f"{nslower} benchmark(s) are slower than the baseline")
+    return 1 if nslower else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from datetime import datetime
+from fnmatch import fnmatch
+from json import dump, load
+from platform import platform, python_version
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+# the registered benchmarks by name
+_benchmarks: dict[str, Benchmark] = {}
+
+
+class Benchmark:
+    """
+    A benchmark scenario.
+
+    The function `fcn(size)` prepares the state and returns the callable to be timed.
+    If `fresh=True`, the state is prepared again before each call (e.g. for `Graph.close()`),
+    otherwise the callable is called repeatedly.
+    """
+
+    __slots__ = ("name", "fcn", "sizes", "quick_sizes", "fresh")
+
+    name: str
+    fcn: Callable[[int], Callable[[], Any]]
+    sizes: tuple[int, ...]
+    quick_sizes: tuple[int, ...]
+    fresh: bool
+
+    def __init__(
+        self,
+        name: str,
+        fcn: Callable[[int], Callable[[], Any]],
+        sizes: Sequence[int],
+        *,
+        quick_sizes: Sequence[int] | None = None,
+        fresh: bool = False,
+    ):
+        self.name = name
+        self.fcn = fcn
+        self.sizes = tuple(sizes)
+        self.quick_sizes = tuple(quick_sizes) if quick_sizes is not None else self.sizes[:1]
+        self.fresh = fresh
+
+    def run(
+        self, size: int, *, repeat: int = 5, min_time: float = 0.05, max_number: int = 10000
+    ) -> dict[str, Any]:
+        """Returns the minimal time per call over `repeat` rounds"""
+        if self.fresh:
+            times = []
+            for _ in range(repeat):
+                call = self.fcn(size)
+                start = perf_counter()
+                call()
+                times.append(perf_counter() - start)
+            return {"time": min(times), "repeat": repeat, "number": 1}
+
+        call = self.fcn(size)
+        # calibrate the number of calls per round
+        number = 1
+        while True:
+            start = perf_counter()
+            for _ in range(number):
+                call()
+            elapsed = perf_counter() - start
+            if elapsed >= min_time or number >= max_number:
+                break
+            number = min(number * 10, max_number)
+
+        times = [elapsed / number]
+        for _ in range(repeat - 1):
+            start = perf_counter()
+            for _ in range(number):
+                call()
+            times.append((perf_counter() - start) / number)
+        return {"time": min(times), "repeat": repeat, "number": number}
+
+
+def benchmark(
+    name: str,
+    sizes: Sequence[int] = (0,),
+    **kwargs,
+) -> Callable:
+    """The decorator to register the benchmark function, see `Benchmark`"""
+
+    def register(fcn: Callable[[int], Callable[[], Any]]) -> Callable:
+        if name in _benchmarks:
+            raise RuntimeError(f"Benchmark {name} is already registered")
+        _benchmarks[name] = Benchmark(name, fcn, sizes, **kwargs)
+        return fcn
+
+    return register
+
+
+def benchmarks(pattern: str | None = None) -> list[Benchmark]:
+    """Returns the registered benchmarks, matching the shell-style `pattern`"""
+    from . import scenarios  # noqa: F401 (registers the benchmarks)
+
+    return [
+        bench for name, bench in _benchmarks.items() if pattern is None or fnmatch(name, pattern)
+    ]
+
+
+def result_key(name: str, size: int) -> str:
+    return f"{name}[{size}]"
+
+
+def run(
+    pattern: str | None = None,
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Runs the benchmarks and returns the results, suitable for `save()`"""
+    results = {}
+    for bench in benchmarks(pattern):
+        for size in bench.quick_sizes if quick else bench.sizes:
+            key = result_key(bench.name, size)
+            results[key] = bench.run(size, repeat=repeat, min_time=min_time)
+            if verbose:
+                print(f"{key:<40s} {results[key]['time'] * 1e6:14.3f} μs")
+
+    return {"meta": _meta(quick=quick, repeat=repeat), "results": results}
+
+
+def _meta(**kwargs) -> dict[str, Any]:
+    import numpy
+
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform(),
+        **kwargs,
+    }
+
+
+def save(results: dict[str, Any], filename: str) -> None:
+    with open(filename, "w") as file:
+        dump(results, file, indent=2)
+
+
+def read(filename: str) -> dict[str, Any]:
+    with open(filename) as file:
+        return load(file)
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], *, tolerance: float = 0.2
+) -> list[tuple[str, float | None, float | None, str]]:
+    """
+    Compares the results with the baseline.
+
+    Returns the list of `(key, baseline time, time, status)`, where the status is
+    `slower`/`faster` if the relative difference exceeds the `tolerance`, `ok` otherwise,
+    or `new`/`missing` if the benchmark is absent in the baseline/results.
+    """
+    current = results["results"]
+    base = baseline["results"]
+    ret = []
+    for key in {**base, **current}:
+        time = current[key]["time"] if key in current else None
+        time_base = base[key]["time"] if key in base else None
+        if time is None:
+            status = "missing"
+        elif time_base is None:
+            status = "new"
+        elif time > time_base * (1.0 + tolerance):
+            status = "slower"
+        elif time < time_base * (1.0 - tolerance):
+            status = "faster"
+        else:
+            status = "ok"
+        ret.append((key, time_base, time, status))
+    return ret
+
+
+def format_comparison(comparison: list[tuple[str, float | None, float | None, str]]) -> str:
+    def fmt(time: float | None) -> str:
+        return f"{time * 1e6:14.3f}" if time is not None else f"{'-':>14s}"
+
+    header = f"{'benchmark':<40s} {'baseline, μs':>14s} {'current, μs':>14s} {'ratio':>7s}  status"
+    lines = [header]
+    for key, time_base, time, status in comparison:
+        ratio = f"{time / time_base:7.3f}" if time and time_base else f"{'-':>7s}"
+        lines.append(f"{key:<40s} {fmt(time_base)} {fmt(time)} {ratio}  {status}")
+    return "\n".join(lines)
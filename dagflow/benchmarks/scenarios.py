@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from numpy import linspace, pi
+from numpy.random import default_rng
+
+from ..graph import Graph
+from ..lib import Array, Copy, Integrator, IntegratorSampler, Interpolator, SegmentIndex, Sin, Sum
+from .harness import benchmark
+
+if TYPE_CHECKING:
+    from ..node import Node
+
+_rng = default_rng(0)
+
+
+def _make_tree(nsums: int, *, width: int = 4, close: bool = True) -> tuple[Graph, list[Node], Node]:
+    """
+    The balanced tree of `nsums` nodes `Sum` with `width` inputs each.
+    Returns the graph, the sources and the head.
+    """
+    graph = Graph(close_on_exit=close)
+    with graph:
+        nsources = (width - 1) * nsums + 1
+        sources = [Array(f"source {i}", _rng.uniform(size=10)) for i in range(nsources)]
+        queue = deque(sources)
+        for i in range(nsums):
+            head = Sum(f"sum {i}")
+            tuple(queue.popleft() for _ in range(width)) >> head
+            queue.append(head)
+    return graph, sources, head
+
+
+@benchmark("graph.build", sizes=(100, 1000, 10000), fresh=True)
+def graph_build(size: int):
+    return lambda: _make_tree(size, close=False)
+
+
+@benchmark("graph.close", sizes=(100, 1000, 10000), fresh=True)
+def graph_close(size: int):
+    graph, _, _ = _make_tree(size, close=False)
+    return graph.close
+
+
+def _evaluate_sources(size: int, nsources: int | None = None):
+    """Modify `nsources` sources (all by default) and evaluate the head"""
+    graph, sources, head = _make_tree(size)
+    outputs = [source.outputs[0] for source in sources[:nsources]]
+
+    def evaluate():
+        for output in outputs:
+            output.seti(0, 1.0)
+        graph.touch()
+
+    return evaluate
+
+
+@benchmark("graph.evaluate", sizes=(100, 1000, 10000))
+def graph_evaluate(size: int):
+    return _evaluate_sources(size)
+
+
+@benchmark("graph.reevaluate_one", sizes=(100, 1000, 10000))
+def graph_reevaluate_one(size: int):
+    return _evaluate_sources(size, 1)
+
+
+@benchmark("node.touch", sizes=(1000,))
+def node_touch(size: int):
+    """The overhead of the evaluation of the chain of the trivial nodes"""
+    with Graph(close_on_exit=True) as graph:
+        source = Array("source", [1.0])
+        nodes = [Copy(f"copy {i}") for i in range(size)]
+        source >> nodes[0]
+        for prev, node in zip(nodes[:-1], nodes[1:]):
+            prev >> node
+    output = source.outputs[0]
+
+    def evaluate():
+        output.seti(0, 1.0)
+        graph.touch()
+
+    return evaluate
+
+
+@benchmark("makefcn.call", sizes=(10, 100))
+def makefcn_call(size: int):
+    from ..makefcn import makefcn
+    from ..parameters import Parameters
+    from ..storage import NodeStorage
+
+    names = tuple(f"par{i}" for i in range(size))
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0] * size, names=names)
+        head = Sum("sum")
+        tuple(par.output for par in pars.parameters) >> head
+    storage = NodeStorage(dict(zip(names, pars.parameters)))
+    fcn = makefcn(head, storage, safe=False, par_names=names)
+    kwargs = {names[0]: 2.0}
+    return lambda: fcn(**kwargs)
+
+
+@benchmark("kernel.integrator", sizes=(100, 1000, 10000))
+def kernel_integrator(size: int):
+    with Graph(close_on_exit=True):
+        edges = Array("edges", linspace(0, pi, size + 1))
+        orders = Array("orders", [10] * size, edges=edges["array"])
+        sampler = IntegratorSampler("sampler", mode="gl")
+        integrator = Integrator("integrator")
+        fsin = Sin("sin")
+        orders >> sampler("ordersX")
+        sampler.outputs["x"] >> fsin
+        sampler.outputs["weights"] >> integrator("weights")
+        fsin.outputs[0] >> integrator
+        orders >> integrator("ordersX")
+    integrator.touch()
+    return lambda: integrator.touch(force_computation=True)
+
+
+@benchmark("kernel.interpolator", sizes=(100, 1000, 10000))
+def kernel_interpolator(size: int):
+    coarse_x = linspace(0, 10, size + 1)
+    fine_x = _rng.uniform(-1, 11, size=10 * size)
+    with Graph(close_on_exit=True):
+        coarse = Array("coarse", coarse_x)
+        fine = Array("fine", fine_x)
+        y = Array("y", coarse_x**2)
+        indexer = SegmentIndex("indexer")
+        interpolator = Interpolator("interpolator", method="linear")
+        (coarse, fine) >> indexer
+        y >> interpolator
+        coarse >> interpolator("coarse")
+        fine >> interpolator("fine")
+        indexer.outputs[0] >> interpolator("indices")
+    interpolator.touch()
+
+    def evaluate():
+        indexer.touch(force_computation=True)
+        interpolator.touch(force_computation=True)
+
+    return evaluate
+
+
+@benchmark("load_parameters", sizes=(100, 1000), fresh=True)
+def load_parameters_large(size: int):
+    from ..bundles.load_parameters import load_parameters
+
+    cfg = {
+        "parameters": {
+            f"group{j // 10}": {f"par{i}": (1.0, 1.0, 0.1) for i in range(j, j + 10)}
+            for j in range(0, size, 10)
+        },
+        "format": ("value", "central", "sigma_absolute"),
+        "state": "variable",
+        "labels": {},
+    }
+
+    def load():
+        with Graph(close_on_exit=True):
+            load_parameters(cfg)
+
+    return load
@@ -138,6 +138,7 @@ class FileReaderMeta(type):
 
 class FileReader(metaclass=FileReaderMeta):
     _extension: str = ""
+    _fallback: type[FileReader] | None = None
     _file: Any = None
     _file_name: Path = Path("")
     _opened_files: dict[str, FileReader] = FileReaderMeta._opened_files
@@ -160,11 +161,21 @@ class FileReader(metaclass=FileReaderMeta):
                 f" {', '.join(file_readers)}"
             ) from e
 
+        while not cls._available():
+            if cls._fallback is None:
+                raise ValueError(f"The file reader for ext {ext} is not available")
+            cls = cls._fallback
+
         try:
             return cls(file_name)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Can not open file {file_name!s} (loader {ext})") from e
 
+    @classmethod
+    def _available(cls) -> bool:
+        """Checks whether the optional dependencies of the reader are available"""
+        return True
+
     def _close(self) -> None:
         self._read_objects = {}
 
@@ -396,81 +407,88 @@ class FileReaderROOTUpROOT(FileReader):
         return tuple(key.split(";", 1)[0] for key in self._file.GetListOfKeys())
 
 
-with suppress(ImportError):
-    import ROOT
+class FileReaderROOTROOT(FileReader):
+    _extension: str = ".root"
+    _reader_uproot: FileReaderROOTUpROOT | None = None
+    # ROOT is imported only when the file is opened, uproot is used if ROOT is not available
+    _fallback: type[FileReader] | None = FileReaderROOTUpROOT
 
-    class FileReaderROOTROOT(FileReader):
-        _extension: str = ".root"
-        _reader_uproot: FileReaderROOTUpROOT | None = None
+    @classmethod
+    def _available(cls) -> bool:
+        try:
+            import ROOT  # noqa: F401
+        except ImportError:
+            return False
+        return True
 
-        def __init__(self, file_name: str | Path) -> None:
-            super().__init__(file_name)
-            from ROOT import TFile
+    def __init__(self, file_name: str | Path) -> None:
+        super().__init__(file_name)
+        from ROOT import TFile
 
-            self._file = TFile(file_name)
-            if self._file.IsZombie():
-                raise FileNotFoundError(file_name)
+        self._file = TFile(file_name)
+        if self._file.IsZombie():
+            raise FileNotFoundError(file_name)
 
-        @property
-        def reader_uproot(self) -> FileReaderROOTUpROOT:
-            if self._reader_uproot is None:
-                self._reader_uproot = FileReaderROOTUpROOT(self._file_name)
+    @property
+    def reader_uproot(self) -> FileReaderROOTUpROOT:
+        if self._reader_uproot is None:
+            self._reader_uproot = FileReaderROOTUpROOT(self._file_name)
 
-            return self._reader_uproot
+        return self._reader_uproot
 
-        def _close(self) -> None:
-            super()._close()
-            self._file.Close()
+    def _close(self) -> None:
+        super()._close()
+        self._file.Close()
 
-            if self._reader_uproot is not None:
-                self._reader_uproot._close()
+        if self._reader_uproot is not None:
+            self._reader_uproot._close()
 
-        def _get_object_impl(self, object_name: str, **kwargs) -> Any:
-            assert not kwargs
-            ret = self._file.Get(object_name)
-            if not ret:
-                raise KeyError(object_name)
-            return ret
+    def _get_object_impl(self, object_name: str, **kwargs) -> Any:
+        assert not kwargs
+        ret = self._file.Get(object_name)
+        if not ret:
+            raise KeyError(object_name)
+        return ret
 
-        def _get_hist(self, object_name: str) -> tuple[NDArray, NDArray]:
-            import ROOT
+    def _get_hist(self, object_name: str) -> tuple[NDArray, NDArray]:
+        import ROOT
 
-            obj = self._get_object(object_name)
-            if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
-                return _get_bin_edges(obj.GetXaxis()), _get_buffer_hist1(obj, flows=False)
+        obj = self._get_object(object_name)
+        if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
+            return _get_bin_edges(obj.GetXaxis()), _get_buffer_hist1(obj, flows=False)
 
-            raise ValueError(f"Do not know ho to convert {obj} to hist")
+        raise ValueError(f"Do not know ho to convert {obj} to hist")
 
-        def _get_graph(self, object_name: str) -> tuple[NDArray, NDArray]:
-            import ROOT
+    def _get_graph(self, object_name: str) -> tuple[NDArray, NDArray]:
+        import ROOT
 
-            obj = self._get_object(object_name)
-            if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
-                return _get_bin_left_edges(obj.GetXaxis()), _get_buffer_hist1(obj, flows=False)
-            if isinstance(obj, ROOT.TGraph):
-                return _get_buffers_graph(obj)
+        obj = self._get_object(object_name)
+        if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
+            return _get_bin_left_edges(obj.GetXaxis()), _get_buffer_hist1(obj, flows=False)
+        if isinstance(obj, ROOT.TGraph):
+            return _get_buffers_graph(obj)
 
-            raise ValueError(f"Do not know ho to convert {obj} to graph")
+        raise ValueError(f"Do not know ho to convert {obj} to graph")
 
-        def _get_array(self, object_name: str) -> NDArray:
-            import ROOT
+    def _get_array(self, object_name: str) -> NDArray:
+        import ROOT
 
-            obj = self._get_object(object_name)
+        obj = self._get_object(object_name)
 
-            if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
-                return _get_buffer_hist1(obj)
-            if isinstance(obj, ROOT.TH2) and obj.GetDimension() == 2:
-                return _get_buffer_hist2(obj)
-            if isinstance(obj, (ROOT.TMatrixD, ROOT.TMatrixF)):
-                return _get_buffer_matrix(obj)
+        if isinstance(obj, ROOT.TH1) and obj.GetDimension() == 1:
+            return _get_buffer_hist1(obj)
+        if isinstance(obj, ROOT.TH2) and obj.GetDimension() == 2:
+            return _get_buffer_hist2(obj)
+        if isinstance(obj, (ROOT.TMatrixD, ROOT.TMatrixF)):
+            return _get_buffer_matrix(obj)
 
-            raise ValueError(f"Do not know ho to convert {obj} to array")
+        raise ValueError(f"Do not know ho to convert {obj} to array")
 
-        def _get_record(self, object_name: str) -> dict[str, NDArray]:
-            return self.reader_uproot.get_record(object_name)
+    def _get_record(self, object_name: str) -> dict[str, NDArray]:
+        return self.reader_uproot.get_record(object_name)
 
-        def keys(self) -> tuple[str, ...]:
-            return tuple(key.GetName().split(";", 1)[0] for key in self._file.GetListOfKeys())
+    def keys(self) -> tuple[str, ...]:
+        return tuple(key.GetName().split(";", 1)[0] for key in self._file.GetListOfKeys())
 
 
 def iterate_filenames(
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from numpy import array_equal, ascontiguousarray, copyto
+
+from .schedule import parent_nodes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from numpy.typing import NDArray
+
+    from .node import Node
+    from .output import Output
+
+
+class EarlyCutoff:
+    """
+    Detects whether the outputs of a node were changed by the last evaluation.
+
+    The `compare` mode keeps a copy of the outputs and compares them bitwise,
+    the `hash` mode keeps only the digests of the outputs (less memory, more computations).
+    """
+
+    __slots__ = ("_mode", "_previous")
+
+    modes = ("compare", "hash")
+
+    _mode: str
+    _previous: list[NDArray | bytes] | None
+
+    def __init__(self, mode: str = "compare"):
+        if mode not in self.modes:
+            raise ValueError(f"Invalid early cutoff mode {mode}, expect one of {self.modes}")
+        self._mode = mode
+        self._previous = None
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def reset(self) -> None:
+        self._previous = None
+
+    def changed(self, outputs: Iterable[Output]) -> bool:
+        """Returns `True` if any of the outputs differs from the previous evaluation"""
+        datas = [output.data_unsafe for output in outputs]
+        previous = self._previous
+        if self._mode == "hash":
+            digests = [blake2b(ascontiguousarray(data), digest_size=16).digest() for data in datas]
+            self._previous = digests
+            return previous != digests
+
+        if previous is None:
+            self._previous = [data.copy() for data in datas]
+            return True
+        changed = False
+        for prev, data in zip(previous, datas):
+            if not array_equal(prev, data):
+                copyto(prev, data)
+                changed = True
+        return changed
+
+
+def _child_nodes(node: Node) -> Iterator[Node]:
+    for output in node.outputs.iter_all():
+        for input in output.child_inputs:
+            yield input.node
+
+
+def update_cutoff_checks(nodes: Iterable[Node]) -> None:
+    """
+    Updates the `_cutoff_check` of the nodes downstream of the `nodes`: the check is enabled
+    for every node, which has a parent with the early cutoff or with the check, so the nodes
+    are not evaluated if the cutoff has fired anywhere upstream and no other parent is changed
+    """
+    visited = set()
+    stack = [child for node in nodes for child in _child_nodes(node)]
+    while stack:
+        node = stack.pop()
+        check = any(
+            parent._early_cutoff is not None or parent._cutoff_check
+            for parent in parent_nodes(node)
+        )
+        if node in visited and check == node._cutoff_check:
+            continue
+        visited.add(node)
+        node._cutoff_check = check
+        node._parent_versions = None
+        stack.extend(_child_nodes(node))
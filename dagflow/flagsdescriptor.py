@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .taint import invalidate_upstream, taint_downstream
+
 if TYPE_CHECKING:
     from .input import Inputs
-    from .output import Outputs
+    from .output import Output, Outputs
 
 
 class FlagsDescriptor:
@@ -23,6 +25,8 @@ class FlagsDescriptor:
         "needs_postallocate",
         "being_evaluated",
         "types_tainted",
+        "taint_generation",
+        "tainted_outputs",
         "_children",
         "_parents",
     )
@@ -38,6 +42,10 @@ class FlagsDescriptor:
     needs_postallocate: bool
     being_evaluated: bool
     types_tainted: bool
+    # the stamp of the last taint propagation, visited the node
+    taint_generation: int
+    # the tainted outputs of the partially tainted node, `None` means all the outputs
+    tainted_outputs: set[Output] | None
     # observers and observed
     # _node: Node
     _children: Outputs  # TODO: List[FlagsDescriptor]?
@@ -61,9 +69,18 @@ class FlagsDescriptor:
         self.types_tainted = True
         self.needs_reallocation = False
         self.needs_postallocate = False
+        self.taint_generation = 0
+        self.tainted_outputs = None
+
+    def __setstate__(self, state: tuple[None, dict]) -> None:
+        _, slots = state
+        for slot, value in slots.items():
+            setattr(self, slot, value)
+        # the generation stamps are valid only within the process, see `taint_downstream()`
+        self.taint_generation = 0
 
     def __str__(self) -> str:
-        return ", ".join(f"{slot}={getattr(self, slot)}" for slot in self.__slots__)
+        return ", ".join(f"{slot}={getattr(self, slot)}" for slot in FlagsDescriptor.__slots__)
 
     @property
     def children(self) -> Outputs:
@@ -87,30 +104,29 @@ class FlagsDescriptor:
         self.frozen_tainted = False
         self.frozen = False
         self.tainted = True
+        self.tainted_outputs = None
 
     def invalidate_children(self, invalid: bool = True) -> None:
         for child in self.children:
             child.invalid = invalid
 
     def invalidate_parents(self, invalid: bool = True) -> None:
-        for parent in self.parents.iter_all():
-            node = parent.parent_node
-            node.invalidate(invalid)
-            node.invalidate_parents(invalid)
+        invalidate_upstream(self.parents, invalid)
 
     def freeze(self) -> None:
         self.frozen = True
         self.frozen_tainted = False
 
-    def taint_children(self, **kwargs) -> None:
-        for child in self.children:
-            child.taint_children(**kwargs)
+    def taint_children(self, **kwargs) -> int:
+        """Taints the nodes downstream, returns the number of tainted nodes"""
+        return taint_downstream(self.children, **kwargs)
 
     def taint_type(self, force: bool = False):
         if self.types_tainted and not force:
             return
         self.types_tainted = True
         self.tainted = True
+        self.tainted_outputs = None
         self.frozen = False
         for child in self.children:
             child.taint_children_type(force=force)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import arange, array, concatenate, cumsum, flatnonzero, repeat, unique, zeros
+
+from .flagsdescriptor import FlagsDescriptor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from numpy.typing import NDArray
+
+    from .node import Node
+
+
+class FlagsStore:
+    """
+    The graph level storage of the node flags.
+
+    The flags `tainted`, `frozen`, `frozen_tainted`, `closed` and `allocated` of all the nodes
+    are kept in the numpy bool arrays, indexed by the node id. The node flags descriptors
+    are replaced by `StoredFlagsDescriptor`, which read and write the arrays, so the usual
+    Python API keeps working, while the graph-wide operations are vectorized.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_index",
+        "_children_indptr",
+        "_children_indices",
+        "tainted",
+        "frozen",
+        "frozen_tainted",
+        "closed",
+        "allocated",
+    )
+
+    flags = ("tainted", "frozen", "frozen_tainted", "closed", "allocated")
+
+    _nodes: list[Node]
+    _index: dict[Node, int]
+    _children_indptr: NDArray
+    _children_indices: NDArray
+
+    tainted: NDArray
+    frozen: NDArray
+    frozen_tainted: NDArray
+    closed: NDArray
+    allocated: NDArray
+
+    def __init__(self, nodes: Sequence[Node]):
+        self._nodes = list(nodes)
+        self._index = {node: i for i, node in enumerate(self._nodes)}
+
+        for node in self._nodes:
+            if isinstance(node._fd, StoredFlagsDescriptor):
+                raise RuntimeError(f"Node {node.name} already has flags in a FlagsStore")
+
+        n = len(self._nodes)
+        for flag in self.flags:
+            setattr(self, flag, zeros(n, dtype=bool))
+
+        indptr = [0]
+        indices = []
+        for node in self._nodes:
+            children = {
+                self._index[input.node]
+                for output in node.outputs.iter_all()
+                for input in output.child_inputs
+                if input.node in self._index
+            }
+            indices.extend(sorted(children))
+            indptr.append(len(indices))
+        self._children_indptr = array(indptr, dtype="i8")
+        self._children_indices = array(indices, dtype="i8")
+
+        for i, node in enumerate(self._nodes):
+            node._fd = StoredFlagsDescriptor(node._fd, self, i)
+
+    def release(self) -> None:
+        """Returns the flags back to the nodes"""
+        for node in self._nodes:
+            node._fd = node._fd.to_flags_descriptor()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> list[Node]:
+        return self._nodes
+
+    def index(self, node: Node) -> int:
+        return self._index[node]
+
+    def ids(self, nodes: Iterable[Node]) -> NDArray:
+        return array([self._index[node] for node in nodes], dtype="i8")
+
+    def select(self, mask: NDArray) -> list[Node]:
+        """Returns the nodes for the bool mask or array of ids"""
+        nodes = self._nodes
+        ids = flatnonzero(mask) if mask.dtype == bool else mask
+        return [nodes[i] for i in ids]
+
+    def mask_of(self, cls: type) -> NDArray:
+        """Returns the mask of the nodes of the class `cls`"""
+        return array([isinstance(node, cls) for node in self._nodes], dtype=bool)
+
+    def tainted_nodes(self) -> list[Node]:
+        """Returns the tainted not frozen nodes"""
+        return self.select(self.tainted & ~self.frozen)
+
+    def _children(self, ids: NDArray) -> NDArray:
+        starts = self._children_indptr[ids]
+        lengths = self._children_indptr[ids + 1] - starts
+        total = lengths.sum()
+        if not total:
+            return self._children_indices[:0]
+        offsets = repeat(starts - cumsum(lengths) + lengths, lengths) + arange(total)
+        return self._children_indices[offsets]
+
+    def taint_downstream(self, nodes: Iterable[Node]) -> int:
+        """
+        Taints all the nodes downstream of the `nodes`. The propagation is done
+        layer by layer with vector operations. As in `Node.taint`, the propagation
+        stops on the frozen nodes (marked as `frozen_tainted`) and on the already tainted nodes,
+        except the partially tainted ones, which become fully tainted (the dependency map of
+        the nodes is not used). `_on_taint` is called for the reached nodes,
+        the immediate nodes are evaluated afterwards.
+
+        Returns the number of tainted nodes.
+        """
+        nodes = list(nodes)
+        for node in nodes:
+            node._version += 1
+        visited = zeros(len(self._nodes), dtype=bool)
+        newly_tainted = zeros(len(self._nodes), dtype=bool)
+        frontier = self._children(self.ids(nodes))
+        while frontier.size:
+            frontier = unique(frontier)
+            frontier = frontier[~visited[frontier]]
+            visited[frontier] = True
+
+            frozen = self.frozen[frontier]
+            self.frozen_tainted[frontier[frozen]] = True
+
+            active = frontier[~frozen]
+            tainted = self.tainted[active]
+            partial = [i for i in active[tainted] if self._nodes[i]._fd.tainted_outputs is not None]
+            for i in partial:
+                self._nodes[i]._fd.tainted_outputs = None
+            fresh = active[~tainted]
+            self.tainted[fresh] = True
+            newly_tainted[fresh] = True
+
+            frontier = self._children(concatenate((fresh, array(partial, dtype="i8"))))
+
+        self._call_hooks(visited, newly_tainted, nodes)
+        return int(newly_tainted.sum())
+
+    def _call_hooks(self, visited: NDArray, newly_tainted: NDArray, sources: Iterable[Node]):
+        from .node import Node
+
+        callers = set(sources) | set(self.select(newly_tainted))
+        for node in self.select(visited):
+            if type(node)._on_taint is Node._on_taint:
+                continue
+            for input in node.inputs.iter_all():
+                if input.parent_node in callers:
+                    node._on_taint(input)
+
+        for node in self.select(newly_tainted):
+            if node._immediate:
+                node.touch()
+
+    def unfreeze(self, mask: NDArray) -> int:
+        """
+        Unfreezes the nodes of the bool mask (e.g. `store.mask_of(Cache)`)
+        and taints the ones, which missed the taint while being frozen.
+
+        Returns the number of tainted nodes.
+        """
+        ids = flatnonzero(mask & self.frozen)
+        self.frozen[ids] = False
+        retaint = ids[self.frozen_tainted[ids]]
+        self.frozen_tainted[retaint] = False
+        self.tainted[retaint] = True
+        return len(retaint) + self.taint_downstream(self.select(retaint))
+
+
+def _stored_flag(name: str) -> property:
+    def getter(self) -> bool:
+        return bool(getattr(self._store, name)[self._id])
+
+    def setter(self, value: bool) -> None:
+        getattr(self._store, name)[self._id] = value
+
+    return property(getter, setter)
+
+
+class StoredFlagsDescriptor(FlagsDescriptor):
+    """The flags descriptor, which keeps some of the flags in the `FlagsStore`"""
+
+    __slots__ = ("_store", "_id")
+
+    _store: FlagsStore
+    _id: int
+
+    tainted = _stored_flag("tainted")
+    frozen = _stored_flag("frozen")
+    frozen_tainted = _stored_flag("frozen_tainted")
+    closed = _stored_flag("closed")
+    allocated = _stored_flag("allocated")
+
+    def __init__(self, fd: FlagsDescriptor, store: FlagsStore, id: int):
+        self._store = store
+        self._id = id
+        for slot in FlagsDescriptor.__slots__:
+            setattr(self, slot, getattr(fd, slot))
+
+    def to_flags_descriptor(self) -> FlagsDescriptor:
+        fd = FlagsDescriptor(children=self._children, parents=self._parents)
+        for slot in FlagsDescriptor.__slots__:
+            setattr(fd, slot, getattr(self, slot))
+        return fd
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numba import njit
+
+from .lib.arithmetic import Division, Product, Sqrt, Square, Sum
+from .lib.exponential import Exp, Expm1, Log, Log1p, Log10
+from .lib.trigonometry import ArcCos, ArcSin, ArcTan, Cos, Sin, Tan
+from .schedule import toposort
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .node import Node
+    from .output import Output
+
+# The elementwise nodes, which may be fused: the operator of n-ary nodes
+_nary_operators = {Sum: "+", Product: "*", Division: "/"}
+# and the expression of the unary nodes
+_unary_expressions = {
+    Square: "({0})**2",
+    Sqrt: "sqrt({0})",
+    Exp: "exp({0})",
+    Expm1: "expm1({0})",
+    Log: "log({0})",
+    Log1p: "log1p({0})",
+    Log10: "log10({0})",
+    Cos: "cos({0})",
+    Sin: "sin({0})",
+    Tan: "tan({0})",
+    ArcCos: "arccos({0})",
+    ArcSin: "arcsin({0})",
+    ArcTan: "arctan({0})",
+}
+_kernel_namespace_source = (
+    "from numpy import arccos, arcsin, arctan, cos, exp, expm1, log, log1p, log10, sin, sqrt, tan"
+)
+
+# The compiled kernels, indexed by the expression
+_kernels: dict[str, Callable] = {}
+
+
+def _is_elementwise(node: Node) -> bool:
+    """
+    The node is a known elementwise function of the contiguous inputs of the same shape and dtype
+    """
+    cls = type(node)
+    if cls not in _nary_operators and cls not in _unary_expressions:
+        return False
+    if len(node.outputs) != 1 or (cls in _unary_expressions and len(node.inputs) != 1):
+        return False
+    if getattr(node, "_incremental", 0):
+        # the incremental node relies on its own previous result
+        return False
+    output = node.outputs[0]
+    data = output.data_unsafe
+    if data is None or not data.flags.c_contiguous or data.dtype.kind != "f":
+        return False
+    for input in node.inputs.iter_all():
+        indata = input.data_unsafe
+        if indata is None or indata.shape != data.shape or indata.dtype != data.dtype:
+            return False
+        if not indata.flags.c_contiguous:
+            return False
+    return True
+
+
+def _is_intermediate(node: Node, elementwise: set[Node]) -> bool:
+    """The output of the node is consumed only by a single elementwise node"""
+    if node not in elementwise or node._immediate or node._auto_freeze or node.frozen:
+        return False
+    child_inputs = node.outputs[0].child_inputs
+    return len(child_inputs) == 1 and child_inputs[0].node in elementwise
+
+
+def _make_kernel(expression: str, nargs: int) -> Callable:
+    key = f"{nargs}:{expression}"
+    if (kernel := _kernels.get(key)) is not None:
+        return kernel
+
+    args = ", ".join(f"a{i}" for i in range(nargs))
+    source = (
+        f"{_kernel_namespace_source}\n"
+        f"def _fused(out, {args}):\n"
+        f"    for i in range(out.shape[0]):\n"
+        f"        out[i] = {expression}\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    kernel = _kernels[key] = njit(error_model="numpy")(namespace["_fused"])
+    return kernel
+
+
+class FusedGroup:
+    """
+    The tree of the elementwise nodes, computed by a single numba kernel.
+
+    The `root` node evaluates the kernel, which reads only the inputs of the tree (leaves)
+    and writes only the output of the root. The intermediate nodes are not evaluated:
+    their outputs are not updated and may not be read while the fusion is active.
+    """
+
+    __slots__ = ("_root", "_intermediates", "_leaves", "_expression", "_kernel")
+
+    _root: Node
+    _intermediates: list[Node]
+    _leaves: list[Output]
+    _expression: str
+    _kernel: Callable
+
+    def __init__(self, root: Node, intermediates: set[Node]):
+        self._root = root
+        self._intermediates = []
+        self._leaves = []
+        self._expression = self._build_expression(root, intermediates, {})
+        self._kernel = _make_kernel(self._expression, len(self._leaves))
+
+    def _build_expression(
+        self, node: Node, intermediates: set[Node], leaves: dict[Output, int]
+    ) -> str:
+        terms = []
+        for input in node.inputs:
+            parent = input.parent_node
+            if parent in intermediates:
+                self._intermediates.append(parent)
+                terms.append(self._build_expression(parent, intermediates, leaves))
+                continue
+            output = input.parent_output
+            if (i := leaves.get(output)) is None:
+                i = leaves[output] = len(self._leaves)
+                self._leaves.append(output)
+            terms.append(f"a{i}[i]")
+
+        cls = type(node)
+        if (operator := _nary_operators.get(cls)) is not None:
+            return f"({f' {operator} '.join(terms)})"
+        return _unary_expressions[cls].format(terms[0])
+
+    @property
+    def root(self) -> Node:
+        return self._root
+
+    @property
+    def intermediates(self) -> list[Node]:
+        return self._intermediates
+
+    @property
+    def leaves(self) -> list[Output]:
+        return self._leaves
+
+    @property
+    def expression(self) -> str:
+        return self._expression
+
+    def fuse(self) -> None:
+        out = self._root.outputs[0].data_unsafe.reshape(-1)
+        args = tuple(output.data_unsafe.reshape(-1) for output in self._leaves)
+        touches = tuple({output.node: output.node.touch for output in self._leaves}.values())
+        # the flags descriptors are read on the evaluation, since they may be replaced,
+        # see `Graph.make_flags_store()`
+        intermediates = tuple(self._intermediates)
+        kernel = self._kernel
+
+        def fcn():
+            for touch in touches:
+                touch()
+            kernel(out, *args)
+            for node in intermediates:
+                fd = node._fd
+                fd.tainted = False
+                fd.tainted_outputs = None
+
+        self._root._stash_fcn()
+        self._root.fcn = fcn
+        for node in self._intermediates:
+            node._stash_fcn()
+            node.fcn = _skip
+            node.outputs[0]._set_evaluated_by(self._root)
+
+    def unfuse(self) -> None:
+        self._root._unwrap_fcn()
+        for node in self._intermediates:
+            node._unwrap_fcn()
+            node.outputs[0]._set_evaluated_by(None)
+            node._fd.tainted = True
+        self._root._fd.tainted = True
+        self._root.taint_children()
+
+
+def _skip():
+    """The function of the fused intermediate node"""
+
+
+def find_groups(nodes: Iterable[Node]) -> list[FusedGroup]:
+    """Finds the trees of the elementwise nodes with intermediates, which have no other consumers"""
+    order = toposort(nodes)
+    elementwise = {node for node in order if _is_elementwise(node)}
+    intermediates = {node for node in elementwise if _is_intermediate(node, elementwise)}
+    return [
+        FusedGroup(node, intermediates)
+        for node in order
+        if node in elementwise
+        and node not in intermediates
+        and any(input.parent_node in intermediates for input in node.inputs)
+    ]
+
+
+def fuse(nodes: Iterable[Node]) -> list[FusedGroup]:
+    """Fuses the trees of the elementwise nodes of the closed graph"""
+    groups = find_groups(nodes)
+    for group in groups:
+        group.fuse()
+    return groups
@@ -1,8 +1,31 @@
 from __future__ import annotations
 
-from .exception import ClosedGraphError, ClosingError, InitializationError, UnclosedGraphError
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from .arena import Arena
+from .cutoff import update_cutoff_checks
+from .exception import (
+    ClosedGraphError,
+    ClosingError,
+    DagflowError,
+    InitializationError,
+    UnclosedGraphError,
+)
+from .flagsstore import FlagsStore
 from .graphbase import GraphBase
-from .logger import Logger, get_logger
+from .logger import INFO1, INFO2, Logger, get_logger
+from .memoryplan import MemoryPlan
+from .parallel import ParallelExecutor
+from .schedule import Schedule, toposort
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .fusion import FusedGroup
+    from .node import Node
+    from .output import Output
+    from .storage import NodeStorage
 
 
 class Graph(GraphBase):
@@ -20,6 +43,12 @@ class Graph(GraphBase):
         "_nodes_closed",
         "_debug",
         "_logger",
+        "_schedule",
+        "_executor",
+        "_flags_store",
+        "_fused_groups",
+        "_memory_plan",
+        "_arena",
     )
 
     _label: str | None
@@ -29,6 +58,15 @@ class Graph(GraphBase):
     _nodes_closed: bool
     _debug: bool
     _logger: Logger
+    _schedule: Schedule | None
+    _executor: ParallelExecutor | None
+    _flags_store: FlagsStore | None
+    _fused_groups: list[FusedGroup]
+    _memory_plan: MemoryPlan | None
+    _arena: Arena | None
+
+    # the minimal number of nodes between the progress reports on closing
+    progress_step: int = 10000
 
     def __init__(self, *args, close_on_exit: bool = False, strict: bool = True, **kwargs):
         super().__init__(*args)
@@ -39,6 +77,12 @@ class Graph(GraphBase):
         self._strict = strict
         self._closed = False
         self._nodes_closed = False
+        self._schedule = None
+        self._executor = None
+        self._flags_store = None
+        self._fused_groups = []
+        self._memory_plan = None
+        self._arena = None
         # init or get default logger
         self._logger = get_logger(
             filename=kwargs.pop("logfile", None),
@@ -66,6 +110,105 @@ class Graph(GraphBase):
     def closed(self) -> bool:
         return self._closed
 
+    @property
+    def schedule(self) -> Schedule | None:
+        """The topologically ordered nodes of the closed graph"""
+        return self._schedule
+
+    @property
+    def executor(self) -> ParallelExecutor | None:
+        return self._executor
+
+    @property
+    def flags_store(self) -> FlagsStore | None:
+        return self._flags_store
+
+    def make_flags_store(self) -> FlagsStore:
+        """
+        Moves the flags of the nodes of the closed graph to the `FlagsStore`
+        for the vectorized graph-wide queries. The store is released, when the graph is opened.
+        """
+        if self._schedule is None:
+            raise UnclosedGraphError("The graph should be closed to make the flags store")
+        if self._flags_store is None:
+            self._flags_store = FlagsStore(self._schedule.nodes)
+        return self._flags_store
+
+    def release_flags_store(self) -> None:
+        """Returns the flags from the `FlagsStore` back to the nodes"""
+        if self._flags_store is not None:
+            self._flags_store.release()
+            self._flags_store = None
+
+    @property
+    def fused_groups(self) -> list[FusedGroup]:
+        return self._fused_groups
+
+    def fuse(self) -> list[FusedGroup]:
+        """
+        Fuses the chains and trees of the elementwise nodes of the closed graph,
+        which intermediate outputs have no other consumers, into single numba kernels.
+        The outputs of the intermediate nodes are not updated and may not be read
+        while the graph is fused, the intermediate nodes are skipped by `touch()`.
+        """
+        if self._schedule is None:
+            raise UnclosedGraphError("The graph should be closed to be fused")
+        if self._memory_plan is not None:
+            raise DagflowError("The graph with the memory plan may not be fused")
+        if not self._fused_groups:
+            from .fusion import fuse
+
+            self._fused_groups = fuse(self._nodes)
+            self._schedule.set_delegated(
+                node for group in self._fused_groups for node in group.intermediates
+            )
+        return self._fused_groups
+
+    def unfuse(self) -> None:
+        """Returns the original functions to the fused nodes"""
+        if not self._fused_groups:
+            return
+        for group in reversed(self._fused_groups):
+            group.unfuse()
+        self._fused_groups = []
+        self._schedule.set_delegated(())
+
+    @property
+    def memory_plan(self) -> MemoryPlan | None:
+        return self._memory_plan
+
+    @property
+    def arena(self) -> Arena | None:
+        return self._arena
+
+    def set_parallel(self, nthreads: int | bool | None = None) -> None:
+        """
+        Enables the parallel evaluation of the independent branches of the closed graph
+        with `nthreads` threads (default or `True`: number of CPUs).
+        `nthreads=1` (or `False`) switches back to the serial evaluation.
+        The threads of the previous executor are released.
+        """
+        if nthreads is True:
+            nthreads = None
+        serial = nthreads is not None and nthreads <= 1
+        if not serial and self._memory_plan is not None:
+            raise DagflowError("The graph with the memory plan may not be evaluated in parallel")
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if serial:
+            return
+        self._executor = ParallelExecutor(nthreads)
+
+    def set_early_cutoff(self, mode: str | None = "compare") -> None:
+        """
+        Enables the early cutoff for all the nodes of the graph, see `Node.set_early_cutoff()`.
+        `mode=None` disables the cutoff.
+        """
+        for node in self._nodes:
+            node._set_early_cutoff(mode)
+        update_cutoff_checks(self._nodes)
+
     def _add_output(self, *args, **kwargs):
         """Dummy method"""
 
@@ -102,10 +245,33 @@ class Graph(GraphBase):
         for node in self._nodes:
             node.print()
 
-    def close(self, *, strict: bool = True, **kwargs) -> bool:
-        """Closes the graph"""
+    def close(
+        self,
+        *,
+        strict: bool = True,
+        fuse: bool = False,
+        memory_plan: bool = False,
+        keep: Iterable[Output] | NodeStorage = (),
+        arena: bool | str = False,
+        **kwargs,
+    ) -> bool:
+        """
+        Closes the graph.
+
+        With `fuse=True` the elementwise nodes are fused, see `fuse()`.
+        With `memory_plan=True` the intermediate outputs, consumed only once, share
+        the buffers, see `MemoryPlan`. The outputs from `keep` (e.g. `storage("outputs")`)
+        are not shared.
+        With `arena=True` the data of the outputs and inputs is allocated as the views
+        into a single contiguous buffer, see `Arena`. If `arena` is a file name,
+        the buffer is memory mapped to the file.
+        """
         if self._closed:
             return True
+        if memory_plan and (fuse or self._executor is not None):
+            raise DagflowError(
+                "The memory plan is incompatible with fusion and parallel evaluation"
+            )
         self.logger.debug(f"Graph '{self.name}': Closing...")
 
         if self._nodes_closed:
@@ -113,36 +279,49 @@ class Graph(GraphBase):
         else:
             nodes_to_process = self._nodes
 
-        self.logger.debug(f"Graph '{self.name}': Update types...")
-        for node in nodes_to_process:
-            if not node.closed:
-                try:
-                    node.update_types()
-                except ClosingError:
-                    if strict:
-                        raise
-        self.logger.debug(f"Graph '{self.name}': Allocate memory...")
-        for node in nodes_to_process:
-            if not node.closed:
-                try:
-                    node.allocate(**kwargs)
-                except ClosingError:
-                    if strict:
-                        raise
-        self.logger.debug(f"Graph '{self.name}': Closing nodes...")
-        for node in nodes_to_process:
-            try:
-                self._closed = node.close(**kwargs)
-            except ClosingError:
-                if strict:
-                    raise
-            if not self._closed:
-                break
-        else:
-            self._closed = True
+        # the nodes and their ancestors are processed in the topological order,
+        # so each phase is done once per node without the recursion
+        start = perf_counter()
+        order = [node for node in toposort(nodes_to_process) if not node.closed]
+        self.logger.log(
+            INFO1,
+            f"Graph '{self.name}': Sort {len(order)} nodes: {perf_counter() - start:.3f} s",
+        )
+
+        self._close_phase("Update types", order, strict, lambda node: node.update_types(False))
+        if memory_plan and not self._nodes_closed:
+            self.logger.debug(f"Graph '{self.name}': Plan memory...")
+            self._memory_plan = MemoryPlan(self._nodes, keep)
+        if arena and not self._nodes_closed:
+            self.logger.debug(f"Graph '{self.name}': Allocate the arena...")
+            self._arena = Arena(self._nodes, filename=arena if isinstance(arena, str) else None)
+        self._close_phase(
+            "Allocate memory", order, strict, lambda node: node.allocate(False, **kwargs)
+        )
+
+        def close_node(node: Node) -> bool:
+            self._closed = node.close(False, **kwargs)
+            return self._closed
+
+        self._closed = True
+        self._close_phase("Close nodes", order, strict, close_node)
 
         self._clear_new_nodes_list()
         self._nodes_closed = True
+        if self._closed:
+            self.logger.debug(f"Graph '{self.name}': Build the evaluation schedule...")
+            self._schedule = Schedule.from_graph(self)
+            if self._memory_plan is not None:
+                self._memory_plan.apply()
+                self._schedule.set_delegated(output.node for output in self._memory_plan.outputs)
+                self.logger.debug(
+                    f"Graph '{self.name}': {len(self._memory_plan.outputs)} transient outputs use"
+                    f" {self._memory_plan.nbytes_allocated} bytes instead of"
+                    f" {self._memory_plan.nbytes_planned}"
+                )
+            if fuse:
+                self.logger.debug(f"Graph '{self.name}': Fuse the elementwise nodes...")
+                self.fuse()
 
         if strict and not self._closed:
             raise UnclosedGraphError("The graph is still open!")
@@ -151,6 +330,30 @@ class Graph(GraphBase):
         )
         return self._closed
 
+    def _close_phase(
+        self, phase: str, nodes: list[Node], strict: bool, fcn: Callable[[Node], bool | None]
+    ) -> None:
+        """
+        Applies `fcn` to the nodes, reporting the progress and the time of the phase.
+        The phase stops when `fcn` returns `False`.
+        """
+        self.logger.debug(f"Graph '{self.name}': {phase}...")
+        start = perf_counter()
+        nnodes = len(nodes)
+        step = max(nnodes // 10, self.progress_step)
+        for i, node in enumerate(nodes, 1):
+            try:
+                if fcn(node) is False:
+                    break
+            except ClosingError:
+                if strict:
+                    raise
+            if i % step == 0:
+                self.logger.log(INFO2, f"Graph '{self.name}': {phase}: {i}/{nnodes}")
+        self.logger.log(
+            INFO1, f"Graph '{self.name}': {phase} of {nnodes} nodes: {perf_counter() - start:.3f} s"
+        )
+
     def open(
         self,
         force: bool = False,
@@ -165,6 +368,12 @@ class Graph(GraphBase):
             return self
 
         self.logger.debug(f"Graph '{self.name}': Opening...")
+        self.release_flags_store()
+        self.unfuse()
+        if self._memory_plan is not None:
+            self._memory_plan.release()
+            self._memory_plan = None
+        self._schedule = None
 
         if open_nodes:
             self._closed = not all(node.open(force) for node in self._nodes)
@@ -177,6 +386,18 @@ class Graph(GraphBase):
 
         return self
 
+    def touch(self) -> int | None:
+        """
+        Touch all the nodes. The closed graph evaluates the tainted nodes
+        in a single pass over the schedule (or with the parallel executor, if set)
+        and returns the number of evaluated nodes.
+        """
+        if self._schedule is None:
+            return super().touch()
+        if self._executor is not None:
+            return self._executor.touch(self._schedule)
+        return self._schedule.touch()
+
     def build_index_dict(self, index):
         for node in self:
             node.labels.build_index_dict(index)
@@ -0,0 +1,129 @@
+"""
+The registry of the numba kernels of the library.
+
+The kernels are registered with the explicit argument types of their common use (`kernel()`).
+`warmup()` compiles all of them ahead of time. The kernels are defined with `cache=True`, so the
+compiled code is written to the numba cache and the next processes load it instead of compiling.
+See also `python -m dagflow.warmup`.
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatch
+from importlib import import_module
+from pkgutil import iter_modules
+from typing import TYPE_CHECKING
+
+from numba import float32, float64, int32, int64
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+    from numba.core.dispatcher import Dispatcher
+    from numba.core.types import Type
+
+# the common dtypes of the data and of the indices
+float_types = (float64, float32)
+integer_types = (int64, int32)
+
+# the registered kernels by name
+_kernels: dict[str, Kernel] = {}
+
+
+class Kernel:
+    """
+    The numba dispatcher and the argument types to compile it for.
+
+    The argument types are passed to `Dispatcher.compile()` as a tuple (not as a signature) since
+    numba uses them as the key of the cache and the implicit compilation on call does the same.
+    """
+
+    __slots__ = ("name", "dispatcher", "signatures")
+
+    name: str
+    dispatcher: Dispatcher
+    signatures: tuple[tuple[Type, ...], ...]
+
+    def __init__(self, name: str, dispatcher: Dispatcher, signatures: Iterable[tuple[Type, ...]]):
+        self.name = name
+        self.dispatcher = dispatcher
+        self.signatures = tuple(map(tuple, signatures))
+
+    @property
+    def cached(self) -> bool:
+        """Whether the kernel is defined with `cache=True`"""
+        from numba.core.caching import NullCache
+
+        return not isinstance(self.dispatcher._cache, NullCache)
+
+    def is_compiled(self, signature: tuple[Type, ...]) -> bool:
+        return signature in self.dispatcher.overloads
+
+    def compile(self) -> list[tuple[Type, ...]]:
+        """Compiles the signatures, returns the ones, which were not loaded from the cache"""
+        dispatcher = self.dispatcher
+        compiled = []
+        for signature in self.signatures:
+            if self.is_compiled(signature):
+                continue
+            dispatcher.compile(signature)
+            if dispatcher.stats.cache_misses[signature]:
+                compiled.append(signature)
+        return compiled
+
+
+def kernel(*signatures: tuple[Type, ...]) -> Callable:
+    """The decorator to register the numba dispatcher with the argument types to compile it for"""
+
+    def register(dispatcher: Dispatcher) -> Dispatcher:
+        fcn = dispatcher.py_func
+        name = f"{fcn.__module__}.{fcn.__qualname__}"
+        _kernels[name] = Kernel(name, dispatcher, signatures)
+        return dispatcher
+
+    return register
+
+
+def kernels(pattern: str | None = None) -> list[Kernel]:
+    """Returns the kernels of the library, matching the shell-style `pattern`"""
+    from . import lib
+
+    # the nodes are imported lazily, import all the modules to register their kernels
+    for module in iter_modules(lib.__path__):
+        import_module(f"{lib.__name__}.{module.name}")
+
+    return [kern for name, kern in _kernels.items() if pattern is None or fnmatch(name, pattern)]
+
+
+def warmup(
+    pattern: str | None = None, *, verbose: bool = False
+) -> dict[str, list[tuple[Type, ...]]]:
+    """
+    Compiles the kernels for all their signatures.
+    Returns the signatures, which were compiled and not loaded from the cache, by kernel name.
+    """
+    ret = {}
+    for kern in kernels(pattern):
+        ret[kern.name] = compiled = kern.compile()
+        if verbose:
+            print(
+                f"{kern.name:<60s} {len(kern.signatures):3d} signature(s), "
+                f"{len(compiled):3d} compiled"
+            )
+    return ret
+
+
+def check(pattern: str | None = None) -> list[tuple[str, Any]]:
+    """
+    Returns the kernels, which are not cached, as `(name, reason)`: either the kernel is defined
+    without `cache=True` or a signature is missing in the cache. The missing signatures are compiled
+    (and cached) in the process.
+    """
+    ret = []
+    for kern in kernels(pattern):
+        if not kern.cached:
+            ret.append((kern.name, "cache is disabled"))
+            continue
+        ret.extend((kern.name, signature) for signature in kern.compile())
+    return ret
@@ -3,8 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from .tools.schema import LoadYaml
-
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
     from typing import Any
@@ -125,6 +123,8 @@ class Labels:
     _repr_pretty_ = repr_pretty
 
     def _update_from(self, path: str):
+        from .tools.schema import LoadYaml
+
         d = LoadYaml(path)
         self.update(d)
 
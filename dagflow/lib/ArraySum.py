@@ -28,5 +28,5 @@ class ArraySum(OneToOneNode):
             out.dd.shape = (1,)
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             out.data[0] = inp.data.sum()
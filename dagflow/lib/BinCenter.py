@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from numba import njit
 
+from ..kernels import float_types, kernel
 from ..typefunctions import AllPositionals, check_has_inputs, check_input_dimension
 from .OneToOneNode import OneToOneNode
 
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+@kernel(*((f[::1], f[::1]) for f in float_types))
 @njit(cache=True)
 def _bincenter(edges: NDArray[double], centers: NDArray[double]) -> None:
     nbins = len(centers)
@@ -10,7 +10,7 @@ class Cache(OneToOneNode):
         self._labels.setdefault("mark", "cache")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             out.data[:] = inp.data
 
     def recache(self) -> None:
@@ -10,5 +10,5 @@ class Copy(OneToOneNode):
         self._labels.setdefault("mark", "copy")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             out.data[:] = inp.data
@@ -10,6 +10,7 @@ from multikeydict.typing import KeyLike, TupleKey, properkey
 from ..metanode import MetaNode
 from ..parameters import GaussianParameter, NormalizedGaussianParameter
 from ..storage import NodeStorage
+from ..tools.dependencies import ParameterDependencies
 from . import Sum
 from .Jacobian import Jacobian
 from .MatrixProductDDt import MatrixProductDDt
@@ -101,6 +102,11 @@ class CovarianceMatrixGroup(MetaNode):
         jacobians = self._dict_jacobian[name]
         matrices = self._dict_cov_syst_part[name]
         parameter_groups_clean = self._get_parameter_groups(parameter_groups)
+        # the Jacobians skip the parameters, which the model does not depend on;
+        # the index is built once for all the groups on the first evaluation
+        dependencies = ParameterDependencies(
+            par for pars in parameter_groups_clean for par in pars
+        )
         npars_total = 0
         ngroups = len(parameter_groups_clean)
         for i, pars in enumerate(parameter_groups_clean):
@@ -109,7 +115,10 @@ class CovarianceMatrixGroup(MetaNode):
             npars_total += npars
 
             jacobian = Jacobian(
-                f"Jacobian ({npars}): {name}", parameters=pars, **self._jacobian_kwargs
+                f"Jacobian ({npars}): {name}",
+                parameters=pars,
+                dependencies=dependencies,
+                **self._jacobian_kwargs,
             )
             jacobian()
             self._add_node(jacobian, kw_inputs={"input": "model"}, merge_inputs=("model",))
@@ -2,6 +2,7 @@ from numba import njit
 from numpy.typing import NDArray
 
 from ..inputhandler import MissingInputAddOne
+from ..kernels import float_types, kernel
 from ..node import Node
 from ..typefunctions import (
     AllPositionals,
@@ -11,6 +12,7 @@ from ..typefunctions import (
 )
 
 
+@kernel(*((f[::1], f[::1]) for f in float_types))
 @njit(cache=True)
 def _sumsq(data: NDArray, out: NDArray):
     sm = 0.0
@@ -24,6 +26,8 @@ class ElSumSq(Node):
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("missing_input_handler", MissingInputAddOne(output_fmt="result"))
         super().__init__(*args, **kwargs)
@@ -41,3 +45,9 @@ class ElSumSq(Node):
         check_inputs_same_dtype(self)
         eval_output_dtype(self, AllPositionals, "result")
         self.outputs[0].dd.shape = (1,)
+
+    def _vjp(self, grads, inputs):
+        grad = grads[self.outputs["result"]][0]
+        for input in self.inputs:
+            if input in inputs:
+                yield input, 2.0 * grad * input.data
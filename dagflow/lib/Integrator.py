@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from numba import njit
-from numpy import empty, floating, integer, multiply
+from numpy import empty, floating, integer, multiply, repeat
 
 from ..exception import TypeFunctionError
 from ..inputhandler import MissingInputAddPair
+from ..kernels import float_types, integer_types, kernel
 from ..typefunctions import (
     check_has_inputs,
     check_input_dimension,
@@ -18,12 +19,16 @@ from ..typefunctions import (
 from .OneToOneNode import OneToOneNode
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
     from numpy.typing import NDArray
 
     from ..input import Input
+    from ..output import Output
     from ..types import ShapeLike
 
 
+@kernel(*((f[::1], f[::1], i[::1]) for f in float_types for i in integer_types))
 @njit(cache=True)
 def _integrate1d(result: NDArray, data: NDArray, ordersX: NDArray):
     """
@@ -37,6 +42,9 @@ def _integrate1d(result: NDArray, data: NDArray, ordersX: NDArray):
         iprev = inext
 
 
+@kernel(
+    *((f[:, ::1], f[:, ::1], i[::1], i[::1]) for f in float_types for i in integer_types)
+)
 @njit(cache=True)
 def _integrate2d(result: NDArray, data: NDArray, ordersX: NDArray, ordersY: NDArray):
     """
@@ -54,6 +62,15 @@ def _integrate2d(result: NDArray, data: NDArray, ordersX: NDArray, ordersY: NDAr
         iprev = inext
 
 
+# the data is transposed for the x dimension drop
+@kernel(
+    *(
+        (f[::1], data, i[::1])
+        for f in float_types
+        for data in (f[:, ::1], f[::1, :])
+        for i in integer_types
+    )
+)
 @njit(cache=True)
 def _integrate2to1d(result: NDArray, data: NDArray, orders: NDArray):
     """
@@ -109,6 +126,7 @@ class Integrator(OneToOneNode):
         "_ordersX",
         "_ordersY",
         "_weights",
+        "_mode",
     )
 
     __buffer: NDArray
@@ -119,7 +137,10 @@ class Integrator(OneToOneNode):
     _ordersX: NDArray
     _ordersY: NDArray | None
     _weights: NDArray
+    # the key of the function: 1, 2, 210 (x is dropped) or 211 (y is dropped)
+    _mode: int
 
+    _vjp_supported = True
 
     def __init__(self, *args, dropdim: bool = True, **kwargs):
         kwargs.setdefault("missing_input_handler", MissingInputAddPair())
@@ -174,19 +195,20 @@ class Integrator(OneToOneNode):
             if self.dropdim and edgeslenY == 2:  # drop Y dimension
                 shape = (edgeslenX - 1,)
                 edges = [edgesX]
-                self.fcn = self._functions[211]
+                self._mode = 211
             elif self.dropdim and edgeslenX == 2:  # drop X dimension
                 shape = (edgeslenY - 1,)
                 edges = [edgesY]
-                self.fcn = self._functions[210]
+                self._mode = 210
             else:
                 shape = (edgeslenX - 1, edgeslenY - 1)
                 edges = [edgesX, edgesY]
-                self.fcn = self._functions[2]
+                self._mode = 2
         else:
             shape = (edgeslenX - 1,)
             edges = [edgesX]
-            self.fcn = self._functions[1]
+            self._mode = 1
+        self.fcn = self._functions[self._mode]
 
         for output in self.outputs:
             output.dd.dtype = dtype
@@ -230,7 +252,7 @@ class Integrator(OneToOneNode):
         for callback in self._input_nodes_callbacks:
             callback()
 
-        for input, output in self._input_output_data:
+        for input, output in self._tainted_input_output_data():
             multiply(input, self._weights, out=self.__buffer)
             _integrate1d(output, self.__buffer, self._ordersX)
 
@@ -242,7 +264,7 @@ class Integrator(OneToOneNode):
         # weights - (n, m)
         # ordersX - (n, )
         # ordersY - (m, )
-        for input, output in self._input_output_data:
+        for input, output in self._tainted_input_output_data():
             multiply(input, self._weights, out=self.__buffer)
             _integrate2d(output, self.__buffer, self._ordersX, self._ordersY)
 
@@ -253,7 +275,7 @@ class Integrator(OneToOneNode):
 
         # weights - (1, m)
         # ordersY - (m, )
-        for input, output in self._input_output_data:
+        for input, output in self._tainted_input_output_data():
             multiply(input, self._weights, out=self.__buffer)
             _integrate2to1d(output, self.__buffer.T, self._ordersY)
 
@@ -264,6 +286,36 @@ class Integrator(OneToOneNode):
 
         # weights - (m, 1)
         # ordersX - (m, )
-        for input, output in self._input_output_data:
+        for input, output in self._tainted_input_output_data():
             multiply(input, self._weights, out=self.__buffer)
             _integrate2to1d(output, self.__buffer, self._ordersX)
+
+    def _expand(self, grad: NDArray) -> NDArray:
+        """Repeats the cotangent of the result for each integrated point"""
+        match self._mode:
+            case 1:
+                return repeat(grad, self._ordersX)
+            case 2:
+                return repeat(repeat(grad, self._ordersX, axis=0), self._ordersY, axis=1)
+            case 210:
+                return repeat(grad, self._ordersY)[None, :]
+            case 211:
+                return repeat(grad, self._ordersX)[:, None]
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        weights_grad = None
+        for (input_data, _), input, output in zip(
+            self._input_output_data, self.inputs, self.outputs
+        ):
+            if (grad := grads.get(output)) is None:
+                continue
+            expanded = self._expand(grad)
+            if input in inputs:
+                yield input, expanded * self._weights
+            if self._weights_input in inputs:
+                contribution = expanded * input_data
+                weights_grad = contribution if weights_grad is None else weights_grad + contribution
+        if weights_grad is not None:
+            yield self._weights_input, weights_grad
@@ -3,10 +3,11 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import TYPE_CHECKING, Literal
 
-from numba import njit
-from numpy import double, exp, integer, log
+from numba import float64, int64, njit
+from numpy import ascontiguousarray, double, exp, integer, log, zeros_like
 
-from ..exception import InitializationError
+from ..exception import DagflowError, InitializationError
+from ..kernels import float_types, integer_types, kernel
 from ..node import Node
 from ..typefunctions import (
     assign_output_axes_from_inputs,
@@ -19,6 +20,7 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
     from typing import Callable
 
     from numpy.typing import NDArray
@@ -33,6 +35,18 @@ class ExtrapolationStrategy(IntEnum):
     extrapolate = 2
 
 
+# the method is passed to the kernel as the number: the kernel, which accepts a function as an
+# argument, may not be loaded from the numba cache
+class InterpolationMethod(IntEnum):
+    linear = 0
+    log = 1
+    logx = 2
+    exp = 3
+    left = 4
+    right = 5
+    nearest = 6
+
+
 MethodType = Literal["linear", "log", "logx", "exp", "left", "right", "nearest"]
 OutOfBoundsStrategyType = Literal["constant", "nearestedge", "extrapolate"]
 
@@ -68,6 +82,7 @@ class Interpolator(Node):
         "_strategies",
         "_methods",
         "_method",
+        "_methodid",
         "_methodname",
         "_tolerance",
         "_underflow",
@@ -99,8 +114,11 @@ class Interpolator(Node):
 
     _methods: dict[str, Callable]
     _method: Callable
+    _methodid: int
     _methodname: str
 
+    _vjp_supported = True
+
     def __init__(
         self,
         *args,
@@ -129,6 +147,7 @@ class Interpolator(Node):
                 node=self,
             )
         self._method = self._methods[method]
+        self._methodid = int(InterpolationMethod[method])
         self._strategies = {"constant": 0, "nearestedge": 1, "extrapolate": 2}
         self._tolerance = tolerance
         slist = self.strategies.keys()
@@ -226,7 +245,7 @@ class Interpolator(Node):
             callback()
 
         _interpolation(
-            self._method,
+            self._methodid,
             self._coarse,
             self._y,
             self._fine,
@@ -238,10 +257,41 @@ class Interpolator(Node):
             self.fillvalue,
         )
 
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        """The derivatives with respect to `y` and `fine`, the `indices` are piecewise constant"""
+        if self._coarse_input in inputs:
+            raise DagflowError(
+                "The derivative with respect to the coarse points is not implemented",
+                node=self,
+                input=self._coarse_input,
+            )
+        grad = ascontiguousarray(grads[self._result_output], dtype=self._result.dtype).ravel()
+        grad_y = zeros_like(self._y)
+        grad_fine = zeros_like(self._fine)
+        _interpolation_vjp(
+            self._methodid,
+            self._coarse,
+            self._y,
+            self._fine,
+            self._indices,
+            grad,
+            grad_y,
+            grad_fine,
+            self.tolerance,
+            self.strategies[self.underflow],
+            self.strategies[self.overflow],
+        )
+        if self._y_input in inputs:
+            yield self._y_input, grad_y.reshape(self._y_input.dd.shape)
+        if self._fine_input in inputs:
+            yield self._fine_input, grad_fine.reshape(self._fine_input.dd.shape)
+
 
 @njit(cache=True)
 def _interpolation(
-    method: Callable[[float, float, float, float, float], float],
+    method: int,
     coarse: NDArray[double],
     yc: NDArray[double],
     fine: NDArray[double],
@@ -264,7 +314,8 @@ def _interpolation(
             elif overflow == ExtrapolationStrategy.nearestedge:  # nearestedge
                 result[i] = yc[nseg]
             elif has_last_y_input:  # extrapolate
-                result[i] = method(
+                result[i] = _interpolate(
+                    method,
                     coarse[nseg - 1],
                     coarse[nseg],
                     yc[nseg - 1],
@@ -272,7 +323,8 @@ def _interpolation(
                     fine[i],
                 )
             else:  # extrapolate
-                result[i] = method(
+                result[i] = _interpolate(
+                    method,
                     coarse[nseg - 1],
                     coarse[nseg],
                     yc[nseg - 1],
@@ -285,7 +337,8 @@ def _interpolation(
             elif underflow == ExtrapolationStrategy.nearestedge:  # nearestedge
                 result[i] = yc[0]
             else:  # extrapolate
-                result[i] = method(
+                result[i] = _interpolate(
+                    method,
                     coarse[0],
                     coarse[1],
                     yc[0],
@@ -293,9 +346,120 @@ def _interpolation(
                     fine[i],
                 )
         elif has_last_y_input or j < nseg:  # interpolate
-            result[i] = method(coarse[j - 1], coarse[j], yc[j - 1], yc[j], fine[i])
+            result[i] = _interpolate(method, coarse[j - 1], coarse[j], yc[j - 1], yc[j], fine[i])
+        else:  # interpolate
+            result[i] = _interpolate(
+                method, coarse[j - 1], coarse[j], yc[j - 1], yc[j - 1], fine[i]
+            )
+
+
+@njit(cache=True, inline="always")
+def _interpolate(
+    method: int,
+    coarse0: float,
+    coarse1: float,
+    yc0: float,
+    yc1: float,
+    fine: float,
+) -> float:
+    if method == InterpolationMethod.linear:
+        return _linear_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    elif method == InterpolationMethod.log:
+        return _log_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    elif method == InterpolationMethod.logx:
+        return _logx_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    elif method == InterpolationMethod.exp:
+        return _exp_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    elif method == InterpolationMethod.left:
+        return _left_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    elif method == InterpolationMethod.right:
+        return _right_interpolation(coarse0, coarse1, yc0, yc1, fine)
+    return _nearest_interpolation(coarse0, coarse1, yc0, yc1, fine)
+
+
+@njit(cache=True)
+def _interpolation_vjp(
+    method: int,
+    coarse: NDArray[double],
+    yc: NDArray[double],
+    fine: NDArray[double],
+    indices: NDArray[integer],
+    grad: NDArray[double],
+    grad_yc: NDArray[double],
+    grad_fine: NDArray[double],
+    tolerance: float,
+    underflow: int,
+    overflow: int,
+) -> None:
+    """
+    The vector-Jacobian product of `_interpolation()`: adds the products of the cotangent
+    of the result `grad` with the derivatives to `grad_yc` and `grad_fine`
+    """
+    nseg = coarse.size - 1
+    has_last_y_input = coarse.size == yc.size
+    for i, j in enumerate(indices):
+        if abs(fine[i] - coarse[j]) < tolerance:
+            grad_yc[j] += grad[i]
+            continue
+        if j > nseg:  # overflow
+            if overflow == ExtrapolationStrategy.constant:
+                continue
+            elif overflow == ExtrapolationStrategy.nearestedge:
+                grad_yc[nseg] += grad[i]
+                continue
+            k0, k1 = nseg - 1, nseg
+            l1 = nseg if has_last_y_input else nseg - 1
+        elif j <= 0:  # underflow
+            if underflow == ExtrapolationStrategy.constant:
+                continue
+            elif underflow == ExtrapolationStrategy.nearestedge:
+                grad_yc[0] += grad[i]
+                continue
+            k0, k1 = 0, 1
+            l1 = 1
         else:  # interpolate
-            result[i] = method(coarse[j - 1], coarse[j], yc[j - 1], yc[j - 1], fine[i])
+            k0, k1 = j - 1, j
+            l1 = j if has_last_y_input or j < nseg else j - 1
+        dy0, dy1, dfine = _dinterpolate(method, coarse[k0], coarse[k1], yc[k0], yc[l1], fine[i])
+        grad_yc[k0] += grad[i] * dy0
+        grad_yc[l1] += grad[i] * dy1
+        grad_fine[i] += grad[i] * dfine
+
+
+@njit(cache=True, inline="always")
+def _dinterpolate(
+    method: int,
+    coarse0: float,
+    coarse1: float,
+    yc0: float,
+    yc1: float,
+    fine: float,
+) -> tuple[float, float, float]:
+    """The derivatives of `_interpolate()` with respect to `yc0`, `yc1` and `fine`"""
+    width = coarse1 - coarse0
+    if method == InterpolationMethod.linear:
+        t = (fine - coarse0) / width
+        return 1.0 - t, t, (yc1 - yc0) / width
+    elif method == InterpolationMethod.log:
+        exp0, exp1 = exp(yc0), exp(yc1)
+        t = (fine - coarse0) / width
+        value = exp0 + t * (exp1 - exp0)
+        return (1.0 - t) * exp0 / value, t * exp1 / value, (exp1 - exp0) / (width * value)
+    elif method == InterpolationMethod.logx:
+        logwidth = log(coarse1 / coarse0)
+        t = log(fine / coarse0) / logwidth
+        return 1.0 - t, t, (yc1 - yc0) / (logwidth * fine)
+    elif method == InterpolationMethod.exp:
+        a = (coarse0 - fine) / width
+        value = _exp_interpolation(coarse0, coarse1, yc0, yc1, fine)
+        return (1.0 + a) * value / yc0, -a * value / yc1, -value * log(yc0 / yc1) / width
+    elif method == InterpolationMethod.left:
+        return 1.0, 0.0, 0.0
+    elif method == InterpolationMethod.right:
+        return 0.0, 1.0, 0.0
+    elif (fine - coarse0) <= (coarse1 - fine):
+        return 1.0, 0.0, 0.0
+    return 0.0, 1.0, 0.0
 
 
 @njit(cache=True, inline="always")
@@ -373,3 +537,20 @@ def _nearest_interpolation(
     fine: float,
 ) -> float:
     return yc0 if (fine - coarse0) <= (coarse1 - fine) else yc1
+
+
+kernel(
+    *(
+        (int64, f[::1], f[::1], f[::1], i[::1], f[::1], float64, int64, int64, float64)
+        for f in float_types
+        for i in integer_types
+    )
+)(_interpolation)
+
+kernel(
+    *(
+        (int64, f[::1], f[::1], f[::1], i[::1], f[::1], f[::1], f[::1], float64, int64, int64)
+        for f in float_types
+        for i in integer_types
+    )
+)(_interpolation_vjp)
@@ -3,10 +3,13 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from numba import njit
+from numba import float64, int64, njit
+from numpy import flatnonzero
 
 from ..exception import InitializationError
+from ..kernels import float_types, kernel
 from ..parameters import AnyGaussianParameter, GaussianParameter, NormalizedGaussianParameter
+from ..tools.dependencies import ParameterDependencies
 from .OneToOneNode import OneToOneNode
 
 if TYPE_CHECKING:
@@ -16,20 +19,38 @@ if TYPE_CHECKING:
 
 
 class Jacobian(OneToOneNode):
-    __slots__ = ("_scale", "_parameters_list")
+    """
+    The Jacobian of the inputs with respect to the parameters, computed with the 4-point
+    finite-difference stencil.
+
+    The parameters, which the input does not depend on, are not varied: their columns are zero.
+    The dependencies are taken from the `ParameterDependencies` (may be shared by several
+    Jacobians), the index of the parameters of the Jacobian is built by default.
+    """
+
+    __slots__ = ("_scale", "_parameters_list", "_dependencies", "_columns")
 
     _scale: float
     _parameters_list: list[AnyGaussianParameter]
+    _dependencies: ParameterDependencies | None
+    # the indices of the parameters, which each input depends on
+    _columns: list[NDArray] | None
+
+    # modifies the parameters and re-evaluates the input during the evaluation
+    _parallel_safe = False
 
     def __init__(
         self,
         name,
         scale: float = 0.1,
         parameters: Sequence[AnyGaussianParameter] | None = None,
+        dependencies: ParameterDependencies | None = None,
         **kwargs,
     ) -> None:
         super().__init__(name, auto_freeze=True, **kwargs)
         self._scale = scale
+        self._dependencies = dependencies
+        self._columns = None
 
         self._parameters_list = []  # pyright: ignore
         if parameters:
@@ -45,8 +66,25 @@ class Jacobian(OneToOneNode):
         if not isinstance(par, (GaussianParameter,NormalizedGaussianParameter)):
             raise RuntimeError(f"par must be a GaussianParameter or NormalizedGaussianParameter, but given {par=}, {type(par)=}!")
         self._parameters_list.append(par)
+        self._columns = None
+
+    @property
+    def dependencies(self) -> ParameterDependencies:
+        if self._dependencies is None:
+            self._dependencies = ParameterDependencies(self._parameters_list)
+        return self._dependencies
+
+    def nonzero_columns(self, i: int = 0) -> NDArray:
+        """The indices of the parameters, which the input `i` depends on"""
+        if self._columns is None:
+            self._columns = [
+                flatnonzero(self.dependencies.mask(inp.parent_output, self._parameters_list))
+                for inp in self.inputs
+            ]
+        return self._columns[i]
 
     def _typefunc(self) -> None:
+        self._columns = None
         n = len(self._parameters_list)
         for inp, out in zip(self.inputs, self.outputs):
             out.dd.dtype = inp.dd.dtype
@@ -55,9 +93,10 @@ class Jacobian(OneToOneNode):
     def _fcn(self):
         c1 = 4.0 / 3.0
         c2 = 1.0 / 6.0
-        for inp, outdata in zip(self.inputs, self.outputs.iter_data()):
+        for j, (inp, outdata) in enumerate(zip(self.inputs, self.outputs.iter_data())):
             outdata[:] = 0.0
-            for i, parameter in enumerate(self._parameters_list):
+            for i in self.nonzero_columns(j):
+                parameter = self._parameters_list[i]
                 reldelta = parameter.sigma * self._scale
                 f1 = c1 / reldelta
                 f2 = c2 / reldelta
@@ -87,6 +126,7 @@ def _do_step(
     _step_in_numba(res, inp.data, coeff, icol)
 
 
+@kernel(*((f[:, ::1], f[::1], float64, int64) for f in float_types))
 @njit(cache=True)
 def _step_in_numba(res: NDArray, inpdata: NDArray, coeff: float, icol: int) -> None:
     for j in range(len(inpdata)):
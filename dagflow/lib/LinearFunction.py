@@ -3,14 +3,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from numba import njit
+from numpy import zeros
 
+from ..kernels import float_types, kernel
 from ..typefunctions import AllPositionals, check_input_size, check_inputs_same_dtype
 from .OneToOneNode import OneToOneNode
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
     from numpy.typing import NDArray
 
     from ..input import Input
+    from ..output import Output
 
 
 class LinearFunction(OneToOneNode):
@@ -20,6 +25,8 @@ class LinearFunction(OneToOneNode):
     _a: Input
     _b: Input
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._a = self._add_input("a", positional=False)
@@ -36,7 +43,26 @@ class LinearFunction(OneToOneNode):
         for inp, out in zip(self.inputs.iter_data(), self.outputs.iter_data()):
             _linear_function(inp, out, a, b)
 
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        a = self._a.data[0]
+        grad_a = zeros(1, dtype=self._a.dd.dtype)
+        grad_b = zeros(1, dtype=self._b.dd.dtype)
+        for input, output in zip(self.inputs, self.outputs):
+            if (grad := grads.get(output)) is None:
+                continue
+            if input in inputs:
+                yield input, a * grad
+            grad_a += (grad * input.data).sum()
+            grad_b += grad.sum()
+        if self._a in inputs:
+            yield self._a, grad_a
+        if self._b in inputs:
+            yield self._b, grad_b
+
 
+@kernel(*((f[::1], f[::1], f, f) for f in float_types))
 @njit(cache=True)
 def _linear_function(inp: NDArray, out: NDArray, a: float, b: float):
     for i in range(len(inp)):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from numpy import copyto
 from numpy.typing import NDArray
 
 from multikeydict.typing import properkey
@@ -14,6 +15,7 @@ from ..typefunctions import (
     check_has_inputs,
     check_inputs_equivalence,
     copy_from_input_to_output,
+    eval_output_broadcast_shape,
     eval_output_dtype,
 )
 
@@ -23,11 +25,18 @@ if TYPE_CHECKING:
 
     from multikeydict.typing import KeyLike, TupleKey
 
+    from ..input import Input
+
 
 class ManyToOneNode(Node):
     """
     The abstract node with only one output `result`,
     which is the result of some function of all the positional inputs
+
+    The nodes, which support the incremental mode (`incremental=K`), record the inputs
+    tainted since the last evaluation and update the result only with their contribution
+    using the copies of the previous input values. Each K incremental updates
+    the result is fully recomputed to bound the accumulation of the rounding errors.
     """
 
     __slots__ = (
@@ -37,8 +46,15 @@ class ManyToOneNode(Node):
         "_input_data_other",
         "_input_data",
         "_output_data",
+        "_incremental",
+        "_incremental_steps",
+        "_input_index",
+        "_changed_inputs",
+        "_shadow",
     )
 
+    _incremental_supported: bool = False
+
     _broadcastable: bool
     _check_edges_contents: bool
 
@@ -46,12 +62,19 @@ class ManyToOneNode(Node):
     _input_data: list[NDArray]
     _output_data: NDArray
 
+    _incremental: int
+    _incremental_steps: int
+    _input_index: dict[Input, int]
+    _changed_inputs: set[int] | None
+    _shadow: list[NDArray] | None
+
     def __init__(
         self,
         *args,
         broadcastable: bool = False,
         output_name: str = "result",
         check_edges_contents: bool = False,
+        incremental: int = 0,
         **kwargs,
     ):
         kwargs.setdefault(
@@ -66,6 +89,14 @@ class ManyToOneNode(Node):
         self._input_data = []
         self._output_data = None # pyright: ignore [reportAttributeAccessIssue]
 
+        if incremental and not self._incremental_supported:
+            raise RuntimeError(f"{type(self).__name__} does not support the incremental mode")
+        self._incremental = incremental
+        self._incremental_steps = 0
+        self._input_index = {}
+        self._changed_inputs = None
+        self._shadow = None
+
     @staticmethod
     def _input_names() -> tuple[str, ...]:
         return ("input",)
@@ -83,6 +114,8 @@ class ManyToOneNode(Node):
             prefer_largest_input=self._broadcastable,
             prefer_input_with_edges=True,
         )  # copy shape to result
+        if self._broadcastable:
+            eval_output_broadcast_shape(self, AllPositionals, "result")  # e.g. the batch dimension
         eval_output_dtype(self, AllPositionals, "result")  # eval dtype of result
 
     def _post_allocate(self):
@@ -92,6 +125,45 @@ class ManyToOneNode(Node):
         self._input_data0, self._input_data_other = self._input_data[0], self._input_data[1:]
         self._output_data = self.outputs["result"].data_unsafe
 
+        self._input_index = {input: i for i, input in enumerate(self.inputs)}
+        self._changed_inputs = None
+        self._shadow = None
+
+    def _on_taint(self, caller: Input | None) -> None:
+        if not self._incremental:
+            return
+        if caller is None or (index := self._input_index.get(caller)) is None:
+            self._changed_inputs = None
+        elif self._changed_inputs is not None:
+            self._changed_inputs.add(index)
+
+    def _incremental_changes(self) -> set[int] | None:
+        """
+        Returns the indices of the positional inputs, changed since the last evaluation,
+        or `None` if the result should be fully recomputed
+        """
+        changed, self._changed_inputs = self._changed_inputs, set()
+        if (
+            not changed
+            or self._shadow is None
+            or self._incremental_steps >= self._incremental
+            or 2 * len(changed) > len(self._input_data)
+        ):
+            return None
+        return changed
+
+    def _update_shadow(self, changed: set[int] | None = None) -> None:
+        """Saves the input values after the full (`changed=None`) or the incremental update"""
+        if not self._incremental:
+            return
+        if changed is None or self._shadow is None:
+            self._shadow = [data.copy() for data in self._input_data]
+            self._incremental_steps = 0
+            return
+        for i in changed:
+            copyto(self._shadow[i], self._input_data[i])
+        self._incremental_steps += 1
+
     @classmethod
     def replicate(
         cls,
@@ -14,6 +14,10 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
+    from numpy.typing import NDArray
+
     from ..input import Input
     from ..output import Output
 
@@ -29,6 +33,8 @@ class MatrixProductAB(Node):
     _right: Input
     _out: Output
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs, allowed_kw_inputs=("left", "right"))
         self._left = self._add_input("left")
@@ -92,3 +98,29 @@ class MatrixProductAB(Node):
         eval_output_dtype(self, slice(None), "result")
 
         self._out.dd.shape = resshape[:ndim_out]
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        grad = grads[self._out]
+        left = self._left.data
+        right = self._right.data
+        ndim = self._left.dd.dim, self._right.dd.dim
+        if self._left in inputs:
+            match ndim:
+                case (2, 2):
+                    yield self._left, grad @ right.T
+                case (1, 2):
+                    yield self._left, (grad * right).sum(axis=1)
+                case _:
+                    yield self._left, grad * right
+        if self._right in inputs:
+            match ndim:
+                case (2, 2):
+                    yield self._right, left.T @ grad
+                case (2, 1):
+                    yield self._right, (grad * left).sum(axis=0)
+                case (1, 2):
+                    yield self._right, left[:, None] * grad
+                case _:
+                    yield self._right, grad * left
@@ -8,6 +8,10 @@ from ..node import Node
 from ..typefunctions import check_input_dimension, eval_output_dtype
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
+    from numpy.typing import NDArray
+
     from ..input import Input
     from ..output import Output
 
@@ -22,6 +26,8 @@ class MatrixProductDDt(Node):
     _matrix: Input
     _out: Output
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs, allowed_kw_inputs=("matrix",))
         self._matrix = self._add_input("matrix")
@@ -37,3 +43,10 @@ class MatrixProductDDt(Node):
         check_input_dimension(self, "matrix", ndim=2)
         eval_output_dtype(self, slice(None), "result")
         self._out.dd.shape = (self._matrix.dd.shape[0], self._matrix.dd.shape[0])
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        if self._matrix in inputs:
+            grad = grads[self._out]
+            yield self._matrix, (grad + grad.T) @ self._matrix.data
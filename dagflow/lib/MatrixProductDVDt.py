@@ -14,6 +14,8 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
     from numpy.typing import NDArray
 
     from ..input import Input
@@ -34,6 +36,8 @@ class MatrixProductDVDt(Node):
     _out: Output
     _buffer: NDArray
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs, allowed_kw_inputs=("left", "square"))
         self._left = self._add_input("left")
@@ -67,3 +71,21 @@ class MatrixProductDVDt(Node):
 
     def _post_allocate(self) -> None:
         self._buffer = empty(shape=self._left.dd.shape, dtype=self._left.dd.dtype)
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        grad = grads[self._out]
+        left = self._left.data
+        square = self._square.data
+        if self._square.dd.dim == 1:
+            if self._left in inputs:
+                yield self._left, (grad + grad.T) @ (left * square)
+            if self._square in inputs:
+                yield self._square, ((grad @ left) * left).sum(axis=0)
+            return
+
+        if self._left in inputs:
+            yield self._left, grad @ left @ square.T + grad.T @ left @ square
+        if self._square in inputs:
+            yield self._square, left.T @ grad @ left
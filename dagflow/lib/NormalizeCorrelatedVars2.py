@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import add, divide, matmul, multiply, subtract, zeros
+from numpy import add, divide, matmul, multiply, outer, subtract, tril, zeros, zeros_like
 from scipy.linalg import solve_triangular
 
 from ..node import Node
@@ -16,6 +16,8 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
     from numpy.typing import NDArray
 
     from ..input import Input
@@ -59,6 +61,8 @@ class NormalizeCorrelatedVars2(Node):
     _value_output: Output
     _normvalue_output: Output
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(
             *args,
@@ -138,9 +142,7 @@ class NormalizeCorrelatedVars2(Node):
         - if value is modified, the normvalue should be updated
         - if sigma or central is modified, the normvalue should be updated
 
-        TODO:
-            - implement partial taintflag propagation
-            - value should not be tainted on sigma/central modificantion
+        The value is not tainted on sigma/central modification, see `_post_allocate`.
         """
         if caller is self._normvalue_input:
             self.fcn = self._functions[f"backward_{self._ndim}"]
@@ -181,3 +183,55 @@ class NormalizeCorrelatedVars2(Node):
 
         self._matrix = self.inputs["matrix"].data_unsafe
         self._central = self.inputs["central"].data_unsafe
+
+        # the value and normvalue outputs share the data with the inputs,
+        # therefore only the matrix and central may affect a single output
+        self._input_output_map = {
+            self._matrix_input: (self._normvalue_output,),
+            self._central_input: (self._normvalue_output,),
+        }
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        """
+        The derivatives in the direction of the last evaluation: the normvalue of the value
+        (forward) or the value of the normvalue (backward). The other output is the input.
+        """
+        if (grad_value := grads.get(self._value_output)) is None:
+            grad_value = zeros_like(self._value)
+        if (grad_normvalue := grads.get(self._normvalue_output)) is None:
+            grad_normvalue = zeros_like(self._normvalue)
+        ndim2 = self._ndim == "2d"
+        if self.fcn == self._functions[f"forward_{self._ndim}"]:
+            # normvalue = L⁻¹(value - central)
+            if ndim2:
+                grad_diff = solve_triangular(
+                    self._matrix,
+                    grad_normvalue,
+                    lower=True,
+                    trans="T",
+                    check_finite=False,
+                )
+                grad_matrix = -tril(outer(grad_diff, self._normvalue))
+            else:
+                grad_diff = grad_normvalue / self._matrix
+                grad_matrix = -grad_diff * self._normvalue
+            if self._value_input in inputs:
+                yield self._value_input, grad_value + grad_diff
+            if self._central_input in inputs:
+                yield self._central_input, -grad_diff
+        else:
+            # value = L normvalue + central
+            if ndim2:
+                grad_normvalue = grad_normvalue + self._matrix.T @ grad_value
+                grad_matrix = tril(outer(grad_value, self._normvalue))
+            else:
+                grad_normvalue = grad_normvalue + self._matrix * grad_value
+                grad_matrix = grad_value * self._normvalue
+            if self._normvalue_input in inputs:
+                yield self._normvalue_input, grad_normvalue
+            if self._central_input in inputs:
+                yield self._central_input, grad_value
+        if self._matrix_input in inputs:
+            yield self._matrix_input, grad_matrix
@@ -6,6 +6,7 @@ from numba import njit
 from numpy import divide, sum
 
 from ..inputhandler import MissingInputAddPair
+from ..kernels import float_types, kernel
 from ..typefunctions import AllPositionals, check_input_dimension, check_inputs_equivalence
 from .OneToOneNode import OneToOneNode
 
@@ -43,11 +44,11 @@ class NormalizeMatrix(OneToOneNode):
         )
 
     def _fcn_norm_rows(self) -> None:
-        for input, output in zip(self.inputs, self.outputs):
+        for input, output in self._tainted_pairs():
             _norm_rows(input.data, output._data)
 
     def _fcn_norm_columns(self) -> None:
-        for input, output in zip(self.inputs, self.outputs):
+        for input, output in self._tainted_pairs():
             _norm_columns(input.data, output._data)
 
     def _typefunc(self) -> None:
@@ -58,6 +59,7 @@ class NormalizeMatrix(OneToOneNode):
         self.fcn = self._functions[self._mode]
 
 
+@kernel(*((f[:, ::1], f[:, ::1]) for f in float_types))
 @njit(cache=True)
 def _norm_rows(matrix: NDArray, out: NDArray):
     ncols = matrix.shape[1]
@@ -72,6 +74,7 @@ def _norm_rows(matrix: NDArray, out: NDArray):
             out[row, column] += matrix[row, column] / total_sum
 
 
+@kernel(*((f[:, ::1], f[:, ::1]) for f in float_types))
 @njit(cache=True)
 def _norm_columns(matrix: NDArray, out: NDArray):
     nrows = matrix.shape[0]
@@ -6,6 +6,7 @@ from numpy.typing import NDArray
 
 from multikeydict.typing import properkey
 
+from ..exception import DagflowError
 from ..inputhandler import MissingInputAddPair
 from ..node import Node
 from ..storage import NodeStorage
@@ -16,11 +17,14 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Container, Iterator, Mapping, Sequence
     from typing import Any
 
     from multikeydict.typing import KeyLike
 
+    from ..input import Input
+    from ..output import Output
+
 
 class OneToOneNode(Node):
     """
@@ -47,8 +51,43 @@ class OneToOneNode(Node):
 
     def _post_allocate(self):
         super()._post_allocate()
-        for input, output in zip(self.inputs, self.outputs):
-            self._input_output_data.append((input.data_unsafe, output.data_unsafe))
+        self._input_output_data = [
+            (input.data_unsafe, output.data_unsafe)
+            for input, output in zip(self.inputs, self.outputs)
+        ]
+        self._input_output_map = {
+            input: (output,) for input, output in zip(self.inputs, self.outputs)
+        }
+
+    def _tainted_pairs(self) -> list[tuple[Input, Output]]:
+        """The input/output pairs to be computed: only the tainted ones for the partial taint"""
+        if (tainted := self._fd.tainted_outputs) is None:
+            return list(zip(self.inputs, self.outputs))
+        return [
+            (input, output) for input, output in zip(self.inputs, self.outputs) if output in tainted
+        ]
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        """The cotangents of the positional inputs, see `_vjp_elementwise()`"""
+        for (input_data, output_data), input, output in zip(
+            self._input_output_data, self.inputs, self.outputs
+        ):
+            if input in inputs and (grad := grads.get(output)) is not None:
+                yield input, self._vjp_elementwise(input_data, output_data, grad)
+
+    def _vjp_elementwise(self, x: NDArray, y: NDArray, grad: NDArray) -> NDArray:
+        """The cotangent of the input `x` of the output `y=f(x)` with the cotangent `grad`"""
+        raise DagflowError("Unimplemented method: the method must be overridden!", node=self)
+
+    def _tainted_input_output_data(self) -> list[tuple[NDArray, NDArray]]:
+        """The data of the input/output pairs to be computed, see `_tainted_pairs()`"""
+        if (tainted := self._fd.tainted_outputs) is None:
+            return self._input_output_data
+        return [
+            data for data, output in zip(self._input_output_data, self.outputs) if output in tainted
+        ]
 
     @classmethod
     def replicate(
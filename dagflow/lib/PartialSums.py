@@ -6,6 +6,7 @@ from numba import njit
 from numpy import integer
 
 from ..exception import TypeFunctionError
+from ..kernels import float_types, integer_types, kernel
 from ..typefunctions import (
     AllPositionals,
     check_has_inputs,
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from ..input import Input
 
 
+@kernel(*((f[::1], i[::1], f[::1]) for f in float_types for i in integer_types))
 @njit(cache=True)
 def _psum(data: NDArray, range: NDArray, out: NDArray):
     out[0] = data[range[0] : range[1]].sum()
@@ -70,5 +72,5 @@ class PartialSums(OneToOneNode):
 
     def _fcn(self):
         data = self._array.data
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             _psum(data, inp.data, out.data)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numba import njit
+from numba import int64, njit
 
 from ..inputhandler import MissingInputAddPair
+from ..kernels import float_types, kernel
 from ..typefunctions import (
     AllPositionals,
     check_input_shape,
@@ -55,12 +56,12 @@ class RenormalizeDiag(OneToOneNode):
 
     def _fcn_diag(self) -> None:
         scale = self._scale.data[0]
-        for input, output in zip(self.inputs, self.outputs):
+        for input, output in self._tainted_pairs():
             _renorm_diag_numba(input.data, output._data, scale, self._ndiag)
 
     def _fcn_offdiag(self) -> None:
         scale = self._scale.data[0]
-        for input, output in zip(self.inputs, self.outputs):
+        for input, output in self._tainted_pairs():
             _renorm_offdiag_numba(input.data, output._data, scale, self._ndiag)
 
     def _typefunc(self) -> None:
@@ -113,9 +114,10 @@ def _renorm_offdiag_python(matrix: NDArray, out: NDArray, scale: float, ndiag: i
     _norming(out)
 
 
-_renorm_diag_numba: Callable[[NDArray, NDArray, float, float], None] = njit(cache=True)(
-    _renorm_diag_python
-)
-_renorm_offdiag_numba: Callable[[NDArray, NDArray, float, float], None] = njit(cache=True)(
-    _renorm_offdiag_python
-)
+_renorm_signatures = tuple((f[:, ::1], f[:, ::1], f, int64) for f in float_types)
+_renorm_diag_numba: Callable[[NDArray, NDArray, float, float], None] = kernel(
+    *_renorm_signatures
+)(njit(cache=True)(_renorm_diag_python))
+_renorm_offdiag_numba: Callable[[NDArray, NDArray, float, float], None] = kernel(
+    *_renorm_signatures
+)(njit(cache=True)(_renorm_offdiag_python))
@@ -5,17 +5,21 @@ from typing import TYPE_CHECKING, Literal
 from numba import njit
 
 from ..exception import InitializationError, CalculationError
+from ..kernels import float_types, kernel
 from ..node import Node
 from ..typefunctions import check_inputs_number, copy_from_input_to_output
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
     from numpy.typing import NDArray
 
     from ..input import Input
     from ..output import Output
 
 
-@njit
+@kernel(*((f[::1],) for f in float_types))
+@njit(cache=True)
 def _is_sorted(array: NDArray) -> bool:
     previous = array[0]
     for i in range(1, len(array)):
@@ -55,6 +59,9 @@ class SegmentIndex(Node):
     _fine: Input
     _indices: Output
 
+    # the indices are piecewise constant: the derivatives are zero
+    _vjp_supported = True
+
     def __init__(
         self,
         *args,
@@ -93,3 +100,8 @@ class SegmentIndex(Node):
         if not _is_sorted(coarse):
             raise CalculationError("Coarse array is not sorted", node=self, input=self._coarse)
         out[:] = coarse.searchsorted(fine, side=self.mode)
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        yield from ()
@@ -3,6 +3,7 @@ from numpy import add, copyto
 from numpy.typing import NDArray
 
 from ..inputhandler import MissingInputAddOne
+from ..kernels import float_types, kernel
 from ..node import Node
 from ..typefunctions import (
     AllPositionals,
@@ -14,6 +15,7 @@ from ..typefunctions import (
 )
 
 
+@kernel(*((f[::1], f[:, ::1]) for f in float_types))
 @njit(cache=True)
 def _settodiag1(inarray: NDArray, outmatrix: NDArray):
     outmatrix[:] = 0
@@ -21,6 +23,7 @@ def _settodiag1(inarray: NDArray, outmatrix: NDArray):
         outmatrix[i, i] = inarray[i]
 
 
+@kernel(*((f[::1], f[:, ::1]) for f in float_types))
 @njit(cache=True)
 def _addtodiag(inarray: NDArray, outmatrix: NDArray):
     for i in range(inarray.size):
@@ -17,6 +17,8 @@ class SumSq(ManyToOneNode):
     __slots__ = ("_buffer",)
     _buffer: NDArray
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "Σ()²")
@@ -39,3 +41,9 @@ class SumSq(ManyToOneNode):
     def _post_allocate(self) -> None:
         inpdd = self.inputs[0].dd
         self._buffer = empty(shape=inpdd.shape, dtype=inpdd.dtype)
+
+    def _vjp(self, grads, inputs):
+        grad = grads[self.outputs["result"]]
+        for input in self.inputs:
+            if input in inputs:
+                yield input, 2.0 * grad * input.data
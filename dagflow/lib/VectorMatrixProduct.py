@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import matmul, multiply
+from numpy import matmul, multiply, outer
 
 from dagflow.inputhandler import MissingInputAddPair
 
@@ -17,9 +17,13 @@ from ..typefunctions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
     from typing import Literal
 
+    from numpy.typing import NDArray
+
     from ..input import Input
+    from ..output import Output
 
 
 class VectorMatrixProduct(Node):
@@ -32,6 +36,8 @@ class VectorMatrixProduct(Node):
     _mat: Input
     _matrix_column: bool
 
+    _vjp_supported = True
+
     def __init__(self, *args, mode: Literal["column", "row"] = "column", **kwargs) -> None:
         kwargs.setdefault(
             "missing_input_handler", MissingInputAddPair(input_fmt="vector", output_fmt="result")
@@ -102,3 +108,29 @@ class VectorMatrixProduct(Node):
             for out in self.outputs:
                 out.dd.axes_edges = edges
         eval_output_dtype(self, AllPositionals, AllPositionals)
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        mat = self._mat.data
+        diagonal = self._mat.dd.dim == 1
+        matrix_grad = None
+        for input, output in zip(self.inputs, self.outputs):
+            if (grad := grads.get(output)) is None:
+                continue
+            vector = input.data
+            if input in inputs:
+                if diagonal:
+                    yield input, mat * grad
+                else:
+                    yield input, mat.T @ grad if self._matrix_column else mat @ grad
+            if self._mat in inputs:
+                if diagonal:
+                    contribution = grad * vector
+                elif self._matrix_column:
+                    contribution = outer(grad, vector)
+                else:
+                    contribution = outer(vector, grad)
+                matrix_grad = contribution if matrix_grad is None else matrix_grad + contribution
+        if matrix_grad is not None:
+            yield self._mat, matrix_grad
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from numpy import zeros
+
 from ..node import Node
 from ..typefunctions import copy_from_input_to_output
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
+    from numpy.typing import NDArray
+
     from ..input import Input
     from ..output import Output
 
@@ -17,10 +23,14 @@ class View(Node):
         "_input",
         "_start",
         "_length",
+        "_axis",
     )
     _input: Input
     _start: int | None
     _length: int | None
+    _axis: int
+
+    _vjp_supported = True
 
     def __init__(
         self,
@@ -30,6 +40,7 @@ class View(Node):
         outname="view",
         start: int | None = None,
         length: int | None = None,
+        axis: int = 0,
         **kwargs,
     ) -> None:
         super().__init__(name, **kwargs)
@@ -38,6 +49,7 @@ class View(Node):
         self._input = self._add_input("input", child_output=child_output)
         self._start = start
         self._length = length
+        self._axis = axis
 
         if output is not None:
             output >> self._input
@@ -53,25 +65,42 @@ class View(Node):
 
         if self._length is not None:
             dd = self.outputs[0].dd
-            dd.shape=(self._length,)+dd.shape[1:]
-
-    def _post_allocate(self) -> None:
-        _input = self.inputs[0]
-        output = self.outputs[0]
+            shape = list(dd.shape)
+            shape[self._axis] = self._length
+            dd.shape = shape
 
-        buffer = _input.parent_output._data
+    def _index(self) -> tuple:
+        """The index of the view in the input data"""
         match (self._start, self._length):
             case [None, None]:
-                view = buffer
+                index = slice(None)
             case [start, None]:
-                view = buffer[start:]
+                index = slice(start, None)
             case [None, length]:
-                view = buffer[:length]
+                index = slice(None, length)
             case [start, length]:
-                view = buffer[start : start + length]
+                index = slice(start, start + length)
+        if self._axis < 0:
+            return (..., index) + (slice(None),) * (-self._axis - 1)
+        return (slice(None),) * self._axis + (index,)
 
+    def _post_allocate(self) -> None:
+        _input = self.inputs[0]
+        output = self.outputs[0]
+
+        buffer = _input.parent_output._data
         output._set_data(
-            view,
+            buffer[self._index()],
             owns_buffer=False,
             forbid_reallocation=True,
         )
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        if self._input not in inputs:
+            return
+        grad = grads[self.outputs[0]]
+        input_grad = zeros(self._input.dd.shape, dtype=grad.dtype)
+        input_grad[self._index()] = grad
+        yield self._input, input_grad
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from numpy import copyto
+from numpy import array, copyto, isfinite
 
 from ..exception import TypeFunctionError
 from ..typefunctions import check_has_inputs, copy_input_shape_to_outputs, eval_output_dtype
 from .ManyToOneNode import ManyToOneNode
 
 if TYPE_CHECKING:
+    from collections.abc import Container, Iterator, Mapping
+
+    from numpy.typing import NDArray
+
     from ..input import Input
+    from ..output import Output
 
 
 class WeightedSum(ManyToOneNode):
@@ -18,6 +23,9 @@ class WeightedSum(ManyToOneNode):
     __slots__ = ("_weight",)
     _weight: Input
 
+    _incremental_supported = True
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs, allowed_kw_inputs=("weight",))
         self._weight = self._add_input("weight", positional=False)
@@ -57,10 +65,13 @@ class WeightedSum(ManyToOneNode):
         """
         out = self.outputs[0].data
         weight = self._weight.data
+        if self._incremental and self._fcn_incremental(weight.repeat(len(self._input_data))):
+            return
         copyto(out, self.inputs[0].data.copy())
         for _input in self.inputs[1:]:
             out += _input.data
         out *= weight
+        self._update_shadow()
 
     def _fcn_iterable(self):
         """
@@ -69,6 +80,42 @@ class WeightedSum(ManyToOneNode):
         """
         out = self.outputs[0].data
         weights = self._weight.data
+        if self._incremental and self._fcn_incremental(weights):
+            return
         copyto(out, self.inputs[0].data * weights[0])
         for _input, weight in zip(self.inputs[1:], weights[1:]):
             out += _input.data * weight
+        self._update_shadow()
+
+    def _fcn_incremental(self, weights) -> bool:
+        """
+        Adds the weighted difference of the changed inputs to the result.
+        Returns `False` if the full recomputation is needed, e.g. on the change of the weight.
+        """
+        if (changed := self._incremental_changes()) is None:
+            return False
+        shadow = self._shadow
+        if not all(isfinite(shadow[i]).all() for i in changed):
+            return False
+        for callback in self._input_nodes_callbacks:
+            callback()
+        out = self._output_data
+        for i in changed:
+            out += (self._input_data[i] - shadow[i]) * weights[i]
+        self._update_shadow(changed)
+        return True
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        grad = grads[self.outputs[0]]
+        weights = self._weight.data
+        number = len(weights) == 1
+        if number:
+            weights = weights.repeat(len(self._input_data))
+        for input, weight in zip(self.inputs, weights):
+            if input in inputs:
+                yield input, grad * weight
+        if self._weight in inputs:
+            weights_grad = array([(grad * input_data).sum() for input_data in self._input_data])
+            yield self._weight, weights_grad.sum(keepdims=True) if number else weights_grad
@@ -1,41 +1,111 @@
-from .arithmetic import Division, Product, Sqrt, Square, Sum
-from .Array import Array
-from .ArraySum import ArraySum
-from .BinCenter import BinCenter
-from .BlockToOneNode import BlockToOneNode
-from .Cache import Cache
-from .Cholesky import Cholesky
-from .Concatenation import Concatenation
-from .Copy import Copy
-from .CovmatrixFromCormatrix import CovmatrixFromCormatrix
-from .ElSumSq import ElSumSq
-from .exponential import Exp, Expm1, Log, Log1p, Log10
-from .Integrator import Integrator
-from .IntegratorGroup import IntegratorGroup
-from .IntegratorSampler import IntegratorSampler
-from .Interpolator import Interpolator
-from .InterpolatorGroup import InterpolatorGroup
-from .Jacobian import Jacobian
-from .LinearFunction import LinearFunction
-from .LogProdDiag import LogProdDiag
-from .ManyToOneNode import ManyToOneNode
-from .MatrixProductAB import MatrixProductAB
-from .MatrixProductDDt import MatrixProductDDt
-from .MatrixProductDVDt import MatrixProductDVDt
-from .MeshToEdges import MeshToEdges
-from .NormalizeCorrelatedVars import NormalizeCorrelatedVars
-from .NormalizeCorrelatedVars2 import NormalizeCorrelatedVars2
-from .OneToOneNode import OneToOneNode
-from .PartialSums import PartialSums
-from .RenormalizeDiag import RenormalizeDiag
-from .SegmentIndex import SegmentIndex
-from .SumMatOrDiag import SumMatOrDiag
-from .SumSq import SumSq
-from .trigonometry import ArcCos, ArcSin, ArcTan, Cos, Sin, Tan
-from .VectorMatrixProduct import VectorMatrixProduct
-from .View import View
-from .ViewConcat import ViewConcat
-from .WeightedSum import WeightedSum
+"""
+The library of the nodes.
+
+The nodes are imported lazily, on the first access, so that `import dagflow.lib` does not import
+the optional dependencies of all the nodes (e.g. scipy or numba).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from sys import modules
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .arithmetic import Division, Product, Sqrt, Square, Sum
+    from .Array import Array
+    from .ArraySum import ArraySum
+    from .BinCenter import BinCenter
+    from .BlockToOneNode import BlockToOneNode
+    from .Cache import Cache
+    from .Cholesky import Cholesky
+    from .Concatenation import Concatenation
+    from .Copy import Copy
+    from .CovmatrixFromCormatrix import CovmatrixFromCormatrix
+    from .ElSumSq import ElSumSq
+    from .exponential import Exp, Expm1, Log, Log1p, Log10
+    from .Integrator import Integrator
+    from .IntegratorGroup import IntegratorGroup
+    from .IntegratorSampler import IntegratorSampler
+    from .Interpolator import Interpolator
+    from .InterpolatorGroup import InterpolatorGroup
+    from .Jacobian import Jacobian
+    from .LinearFunction import LinearFunction
+    from .LogProdDiag import LogProdDiag
+    from .ManyToOneNode import ManyToOneNode
+    from .MatrixProductAB import MatrixProductAB
+    from .MatrixProductDDt import MatrixProductDDt
+    from .MatrixProductDVDt import MatrixProductDVDt
+    from .MeshToEdges import MeshToEdges
+    from .NormalizeCorrelatedVars import NormalizeCorrelatedVars
+    from .NormalizeCorrelatedVars2 import NormalizeCorrelatedVars2
+    from .OneToOneNode import OneToOneNode
+    from .PartialSums import PartialSums
+    from .RenormalizeDiag import RenormalizeDiag
+    from .SegmentIndex import SegmentIndex
+    from .SumMatOrDiag import SumMatOrDiag
+    from .SumSq import SumSq
+    from .trigonometry import ArcCos, ArcSin, ArcTan, Cos, Sin, Tan
+    from .VectorMatrixProduct import VectorMatrixProduct
+    from .View import View
+    from .ViewConcat import ViewConcat
+    from .WeightedSum import WeightedSum
+
+# the node name: the module
+_modules = {
+    "ArcCos": "trigonometry",
+    "ArcSin": "trigonometry",
+    "ArcTan": "trigonometry",
+    "Array": "Array",
+    "ArraySum": "ArraySum",
+    "BinCenter": "BinCenter",
+    "BlockToOneNode": "BlockToOneNode",
+    "Cache": "Cache",
+    "Cholesky": "Cholesky",
+    "Concatenation": "Concatenation",
+    "Copy": "Copy",
+    "Cos": "trigonometry",
+    "CovmatrixFromCormatrix": "CovmatrixFromCormatrix",
+    "Division": "arithmetic",
+    "ElSumSq": "ElSumSq",
+    "Exp": "exponential",
+    "Expm1": "exponential",
+    "Integrator": "Integrator",
+    "IntegratorGroup": "IntegratorGroup",
+    "IntegratorSampler": "IntegratorSampler",
+    "Interpolator": "Interpolator",
+    "InterpolatorGroup": "InterpolatorGroup",
+    "Jacobian": "Jacobian",
+    "LinearFunction": "LinearFunction",
+    "Log": "exponential",
+    "Log10": "exponential",
+    "Log1p": "exponential",
+    "LogProdDiag": "LogProdDiag",
+    "ManyToOneNode": "ManyToOneNode",
+    "MatrixProductAB": "MatrixProductAB",
+    "MatrixProductDDt": "MatrixProductDDt",
+    "MatrixProductDVDt": "MatrixProductDVDt",
+    "MeshToEdges": "MeshToEdges",
+    "NormalizeCorrelatedVars": "NormalizeCorrelatedVars",
+    "NormalizeCorrelatedVars2": "NormalizeCorrelatedVars2",
+    "OneToOneNode": "OneToOneNode",
+    "PartialSums": "PartialSums",
+    "Product": "arithmetic",
+    "RenormalizeDiag": "RenormalizeDiag",
+    "SegmentIndex": "SegmentIndex",
+    "Sin": "trigonometry",
+    "Sqrt": "arithmetic",
+    "Square": "arithmetic",
+    "Sum": "arithmetic",
+    "SumMatOrDiag": "SumMatOrDiag",
+    "SumSq": "SumSq",
+    "Tan": "trigonometry",
+    "VectorMatrixProduct": "VectorMatrixProduct",
+    "View": "View",
+    "ViewConcat": "ViewConcat",
+    "WeightedSum": "WeightedSum",
+}
 
 __all__ = [
     "ArcCos",
@@ -90,3 +160,33 @@ __all__ = [
     "ViewConcat",
     "WeightedSum",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _modules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+class _LibModule(ModuleType):
+    """
+    The import of the submodule sets it as the attribute of the package. Most of the nodes are
+    defined in the submodules of the same name, the attribute is replaced by the node.
+    """
+
+    def __setattr__(self, name: str, value):
+        if isinstance(value, ModuleType) and _modules.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+modules[__name__].__class__ = _LibModule
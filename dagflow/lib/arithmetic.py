@@ -1,4 +1,4 @@
-from numpy import add, copyto, divide, multiply, sqrt, square
+from numpy import add, copyto, divide, isfinite, multiply, sqrt, square, subtract
 
 from .ManyToOneNode import ManyToOneNode
 from .OneToOneNode import OneToOneNode
@@ -9,6 +9,9 @@ class Sum(ManyToOneNode):
 
     __slots__ = ()
 
+    _incremental_supported = True
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("broadcastable", True)
         super().__init__(*args, **kwargs)
@@ -19,15 +22,39 @@ class Sum(ManyToOneNode):
             callback()
 
         output_data = self._output_data
+        if self._incremental and (changed := self._incremental_changes()) is not None:
+            shadow = self._shadow
+            if all(isfinite(shadow[i]).all() for i in changed):
+                for i in changed:
+                    subtract(output_data, shadow[i], out=output_data)
+                    add(output_data, self._input_data[i], out=output_data)
+                self._update_shadow(changed)
+                return
+
         copyto(output_data, self._input_data0)
         for input_data in self._input_data_other:
             add(output_data, input_data, out=output_data)
+        self._update_shadow()
+
+    def _vjp(self, grads, inputs):
+        grad = grads[self.outputs[0]]
+        for input in self.inputs:
+            if input in inputs:
+                yield input, grad
 
 class Product(ManyToOneNode):
-    """Product of all the inputs together"""
+    """
+    Product of all the inputs together
+
+    In the incremental mode the result is divided by the previous value of the changed input,
+    therefore the full recomputation is done if the previous value has zeros or is not finite.
+    """
 
     __slots__ = ()
 
+    _incremental_supported = True
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("broadcastable", True)
         super().__init__(*args, **kwargs)
@@ -38,9 +65,31 @@ class Product(ManyToOneNode):
             callback()
 
         output_data = self._output_data
+        if self._incremental and (changed := self._incremental_changes()) is not None:
+            shadow = self._shadow
+            if all((isfinite(shadow[i]) & (shadow[i] != 0)).all() for i in changed):
+                for i in changed:
+                    divide(output_data, shadow[i], out=output_data)
+                    multiply(output_data, self._input_data[i], out=output_data)
+                self._update_shadow(changed)
+                return
+
         copyto(output_data, self._input_data0)
         for _input_data in self._input_data_other:
             multiply(output_data, _input_data, out=output_data)
+        self._update_shadow()
+
+    def _vjp(self, grads, inputs):
+        grad = grads[self.outputs[0]]
+        for i, input in enumerate(self.inputs):
+            if input not in inputs:
+                continue
+            # the product of the other inputs: the result may not be divided by zero
+            input_grad = grad.copy()
+            for j, input_data in enumerate(self._input_data):
+                if j != i:
+                    input_grad = input_grad * input_data
+            yield input, input_grad
 
 
 class Division(ManyToOneNode):
@@ -52,6 +101,8 @@ class Division(ManyToOneNode):
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("broadcastable", True)
         super().__init__(*args, **kwargs)
@@ -66,12 +117,27 @@ class Division(ManyToOneNode):
         for _input_data in self._input_data_other:
             divide(self._output_data, _input_data, out=self._output_data)
 
+    def _vjp(self, grads, inputs):
+        grad = grads[self.outputs[0]]
+        for i, input in enumerate(self.inputs):
+            if input not in inputs:
+                continue
+            if i == 0:
+                input_grad = grad.copy()
+                for input_data in self._input_data_other:
+                    input_grad = input_grad / input_data
+            else:
+                input_grad = -grad * self._output_data / self._input_data[i]
+            yield input, input_grad
+
 
 class Square(OneToOneNode):
     """Square function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "x²")
@@ -80,15 +146,20 @@ class Square(OneToOneNode):
         for callback in self._input_nodes_callbacks:
             callback()
 
-        for input_data, output_data in self._input_output_data:
+        for input_data, output_data in self._tainted_input_output_data():
             square(input_data, out=output_data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return 2.0 * grad * x
+
 
 class Sqrt(OneToOneNode):
     """Square function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "√x")
@@ -97,5 +168,8 @@ class Sqrt(OneToOneNode):
         for callback in self._input_nodes_callbacks:
             callback()
 
-        for input_data, output_data in self._input_output_data:
+        for input_data, output_data in self._tainted_input_output_data():
             sqrt(input_data, out=output_data)
+
+    def _vjp_elementwise(self, x, y, grad):
+        return 0.5 * grad / y
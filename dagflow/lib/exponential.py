@@ -8,66 +8,91 @@ class Exp(OneToOneNode):
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "exp")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             exp(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad * y
+
 
 class Expm1(OneToOneNode):
     """exp(x)-1 function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "exp-1")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             expm1(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad * (y + 1.0)
+
 
 class Log(OneToOneNode):
     """log(x) function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "log")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             log(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad / x
+
 
 class Log1p(OneToOneNode):
     """log(x+1) function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "log(x+1)")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             log1p(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad / (x + 1.0)
+
 
 class Log10(OneToOneNode):
     """log10(x) function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "log₁₀")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             log10(inp.data, out=out.data)
+
+    def _vjp_elementwise(self, x, y, grad):
+        return grad / (x * log(10.0))
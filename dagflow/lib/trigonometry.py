@@ -1,4 +1,4 @@
-from numpy import arccos, arcsin, arctan, cos, sin, tan
+from numpy import arccos, arcsin, arctan, cos, sin, sqrt, tan
 
 from .OneToOneNode import OneToOneNode
 
@@ -8,80 +8,110 @@ class Cos(OneToOneNode):
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "cos")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             cos(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return -grad * sin(x)
+
 
 class Sin(OneToOneNode):
     """Sin function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "sin")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             sin(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad * cos(x)
+
 
 class ArcCos(OneToOneNode):
     """ArcCos function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "acos")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             arccos(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return -grad / sqrt(1.0 - x * x)
+
 
 class ArcSin(OneToOneNode):
     """ArcSin function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "asin")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             arcsin(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad / sqrt(1.0 - x * x)
+
 
 class Tan(OneToOneNode):
     """Tan function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "tan")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             tan(inp.data, out=out.data)
 
+    def _vjp_elementwise(self, x, y, grad):
+        return grad * (1.0 + y * y)
+
 
 class ArcTan(OneToOneNode):
     """Arctan function"""
 
     __slots__ = ()
 
+    _vjp_supported = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._labels.setdefault("mark", "atan")
 
     def _fcn(self):
-        for inp, out in zip(self.inputs, self.outputs):
+        for inp, out in self._tainted_pairs():
             arctan(inp.data, out=out.data)
+
+    def _vjp_elementwise(self, x, y, grad):
+        return grad / (1.0 + x * x)
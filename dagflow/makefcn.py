@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+from numpy import copyto
+
+from dagflow.memoize import MemoizedFunction
 from dagflow.node import Node
 from dagflow.output import Output
-from dagflow.parameters import Parameter
+from dagflow.parameters import Parameter, ParametersSetter
 from dagflow.storage import NestedMKDict, NodeStorage
 
 if TYPE_CHECKING:
     from collections.abc import Callable, KeysView
+    from typing import Literal
+
+    from numpy.typing import ArrayLike, NDArray
 
-    from numpy.typing import NDArray
+    from dagflow.autodiff import Gradient
 
 
 def _find_par_permissive(storage: NodeStorage | NestedMKDict, name: str) -> Parameter | None:
@@ -29,16 +36,173 @@ def _collect_pars_permissive(
     return res
 
 
+class VectorFunction:
+    """
+    The function `f(x, out=None)` of the vector of the parameter values `x`,
+    see `makefcn(..., parameters=...)`.
+
+    The parameters are resolved once: the values are written directly into the buffers
+    of the parameters (`ParametersSetter`) and the graph is tainted in a single pass.
+    The result is the data of the output (the tuple for the node with several outputs
+    or for the sequence of outputs), copied if `copy=True` or written into the arrays `out`.
+
+    If `restore="eager"` the initial values of the parameters are written back after each call.
+    This taints the graph, but does not evaluate it again. If `restore="lazy"`, the values of the
+    last call are kept and the initial values are written back by `restore()` (or on exit from
+    the `with` block), so each call costs a single assignment and a single evaluation.
+    If `restore=None`, the values are not restored.
+    """
+
+    __slots__ = ("_outputs", "_single", "_setter", "_restore", "_copy", "_initial", "_gradient")
+
+    _outputs: tuple[Output, ...]
+    _single: bool
+    _setter: ParametersSetter
+    _restore: Literal["eager", "lazy"] | None
+    _copy: bool
+    _initial: NDArray | None
+    _gradient: Gradient | None
+
+    def __init__(
+        self,
+        node: Node | Output | Sequence[Output],
+        parameters: Sequence[Parameter],
+        *,
+        restore: Literal["eager", "lazy"] | None = "eager",
+        copy: bool = True,
+    ):
+        if isinstance(node, Output):
+            self._outputs = (node,)
+            self._single = True
+        elif isinstance(node, Node):
+            self._outputs = tuple(node.outputs)
+            self._single = len(self._outputs) == 1
+        elif isinstance(node, Sequence) and all(isinstance(output, Output) for output in node):
+            self._outputs = tuple(node)
+            self._single = False
+        else:
+            raise ValueError(
+                f"`node` must be Node | Output | Sequence[Output], but given {node}, {type(node)=}!"
+            )
+        if restore not in ("eager", "lazy", None):
+            raise ValueError(f"Invalid {restore=}, must be 'eager', 'lazy' or None")
+
+        self._setter = ParametersSetter(parameters)
+        if len(self._setter) != len(parameters):
+            raise ValueError("Some parameters are passed more than once")
+        self._restore = restore
+        self._copy = copy
+        self._initial = None
+        self._gradient = None
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        return self._setter.parameters
+
+    @property
+    def outputs(self) -> tuple[Output, ...]:
+        return self._outputs
+
+    @property
+    def single(self) -> bool:
+        """Whether the function returns the array of the single output (not the tuple)"""
+        return self._single
+
+    @property
+    def copy(self) -> bool:
+        return self._copy
+
+    @property
+    def initial_values(self) -> NDArray | None:
+        """The values of the parameters to be restored"""
+        return self._initial
+
+    def values(self) -> NDArray:
+        """Returns the current values of the parameters"""
+        return self._setter.values()
+
+    def __call__(
+        self, x: ArrayLike, out: NDArray | Sequence[NDArray] | None = None
+    ) -> NDArray | tuple[NDArray, ...] | None:
+        if self._restore is not None and self._initial is None:
+            self._initial = self._setter.values()
+        self._setter(x)
+
+        if self._single:
+            data = self._outputs[0].data
+            if out is not None:
+                copyto(out, data)
+                res = out
+            else:
+                res = data.copy() if self._copy else data
+        elif out is not None:
+            for output, outdata in zip(self._outputs, out):
+                copyto(outdata, output.data)
+            res = tuple(out)
+        elif self._outputs:
+            res = tuple(
+                output.data.copy() if self._copy else output.data for output in self._outputs
+            )
+        else:
+            res = None
+
+        if self._restore == "eager":
+            self.restore()
+        return res
+
+    def gradient(self, x: ArrayLike) -> NDArray:
+        """
+        Returns the gradient of the single scalar output at `x` with respect to the parameters,
+        computed with the reverse-mode differentiation (see `dagflow.autodiff.Gradient`)
+        """
+        if self._gradient is None:
+            if not self._single:
+                raise ValueError("The gradient requires a single output")
+            from dagflow.autodiff import Gradient
+
+            self._gradient = Gradient(self._outputs[0], self._setter.parameters)
+
+        if self._restore is not None and self._initial is None:
+            self._initial = self._setter.values()
+        self._setter(x)
+        res = self._gradient()
+        if self._restore == "eager":
+            self.restore()
+        return res
+
+    def restore(self) -> None:
+        """Writes back the initial values of the parameters"""
+        if self._initial is None:
+            return
+        self._setter(self._initial)
+        self._initial = None
+
+    def __enter__(self) -> VectorFunction:
+        return self
+
+    def __exit__(self, *_):
+        self.restore()
+
+
 def makefcn(
     node: Node | Output,
     storage: NodeStorage | NestedMKDict,
     safe: bool = True,
     par_names: list[str] | tuple[str, ...] | None = None,
+    parameters: Sequence[str | Parameter] | None = None,
+    restore: Literal["eager", "lazy"] | None = "eager",
+    cache: int | None = None,
 ) -> Callable:
     """
     Retruns a function, which takes the parameter values as arguments
     and retruns the result of the node evaluation.
 
+    If `parameters` (the names or the parameters) are passed, returns `VectorFunction`:
+    the function `f(x, out=None)` of the array of the parameter values, resolved once.
+    If `safe=True` the initial values are restored with the `restore` strategy
+    (see `VectorFunction`). If `cache` is passed, the results are memoized in the LRU cache
+    of `cache` bytes, keyed by the array of the parameter values (see `MemoizedFunction`).
+
     :param node: A node (or output), depending (explicitly or implicitly) on the parameters
     :type node: class:`dagflow.node.Node` | class:`dagflow.output.Output`
     :param storage: A storage with parameters
@@ -48,12 +212,21 @@ def makefcn(
     :type safe: bool
     :param par_names: The short names of the set of parameters for presearch
     :type par_names: list[str] | tuple[str] | None
+    :param parameters: The parameters (or their names) for the function of the array of values
+    :type parameters: Sequence[str | Parameter] | None
+    :param restore: The strategy to restore the parameters if `safe=True`: "eager", "lazy"
+    or `None` (not restored)
+    :type restore: str | None
+    :param cache: The size of the cache of the results in bytes, requires `parameters`
+    :type cache: int | None
     :rtype: function
     """
     if not isinstance(storage, (NodeStorage, NestedMKDict)):
         raise ValueError(
             f"`storage` must be NodeStorage | NestedMKDict, but given {storage}, {type(storage)=}!"
         )
+    if cache is not None and parameters is None:
+        raise ValueError("The cache requires the `parameters` (the function of the array)")
 
     # to avoid extra checks in the function, we prepare the corresponding getter here
     if isinstance(node, Output):
@@ -90,6 +263,17 @@ def makefcn(
                 raise RuntimeError(f"There is no parameter '{name}' in the {storage=}!") from exc
         return par
 
+    if parameters is not None:
+        fcn = VectorFunction(
+            node,
+            [par if isinstance(par, Parameter) else _get_parameter(par) for par in parameters],
+            restore=restore if safe else None,
+            copy=safe,
+        )
+        if cache is None:
+            return fcn
+        return MemoizedFunction(fcn, maxbytes=cache)
+
     if not safe:
 
         def fcn_unsafe(**kwargs) -> NDArray | tuple[NDArray, ...] | None:
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from numpy import ascontiguousarray, copyto, ones
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+    from .makefcn import VectorFunction
+    from .node import Node
+    from .output import Output
+
+
+def source_nodes(outputs: Iterable[Output]) -> list[Node]:
+    """Returns the nodes without inputs, upstream of the `outputs`"""
+    sources = []
+    visited = set()
+    stack = [output.node for output in outputs]
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if not node.inputs.len_all():
+            sources.append(node)
+        for input in node.inputs.iter_all():
+            if (parent := input.parent_output) is not None and parent.node not in visited:
+                stack.append(parent.node)
+    return sources
+
+
+class MemoizedFunction:
+    """
+    The LRU cache of the results of the `VectorFunction`, keyed by the bytes of the vector
+    of the parameter values: the function `f(x, out=None)` returns the stored results for
+    the repeated `x` without setting the parameters and without touching the graph.
+    The gradient (`gradient(x)`) is cached in the same way.
+
+    The results are stored until their total size exceeds `maxbytes`, then the least recently
+    used entries are evicted. The cache is cleared once any of the source nodes (the nodes
+    without inputs, upstream of the outputs) is changed by other means than the parameters of
+    the function: the versions of the nodes (see `Node.version`) are checked on each call,
+    while for the arrays, holding the parameters, the values of the other elements are compared.
+    The nodes with the internal state, changed without tainting, are not tracked.
+    """
+
+    __slots__ = (
+        "_function",
+        "_dtype",
+        "_maxbytes",
+        "_entries",
+        "_nbytes",
+        "_sources",
+        "_parameter_sources",
+        "_stamp",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    _function: VectorFunction
+    _dtype: DTypeLike
+    _maxbytes: int
+    _entries: OrderedDict[tuple, tuple[NDArray, ...]]
+    _nbytes: int
+    # the source nodes, tracked by the version, and the arrays of the parameters, tracked by
+    # the values of the elements, which are not set by the function
+    _sources: list[Node]
+    _parameter_sources: list[tuple[Output, NDArray]]
+    _stamp: tuple | None
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, function: VectorFunction, *, maxbytes: int = 64 * 1024 * 1024):
+        if maxbytes < 0:
+            raise ValueError(f"Invalid {maxbytes=}, must be non-negative")
+        self._function = function
+        self._dtype = function.values().dtype
+        self._maxbytes = maxbytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._stamp = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        masks = {}
+        for par in function.parameters:
+            output = par._common_output
+            if (mask := masks.get(output)) is None:
+                mask = masks[output] = ones(output._data.shape, dtype=bool)
+            mask[par._idx] = False
+        self._parameter_sources = [(output, mask) for output, mask in masks.items() if mask.any()]
+        parameter_nodes = {output.node for output in masks}
+        self._sources = [
+            node for node in source_nodes(function.outputs) if node not in parameter_nodes
+        ]
+
+    @property
+    def function(self) -> VectorFunction:
+        return self._function
+
+    @property
+    def maxbytes(self) -> int:
+        return self._maxbytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the stored results"""
+        return self._nbytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "nbytes": self._nbytes,
+            "maxbytes": self._maxbytes,
+        }
+
+    def clear(self) -> None:
+        """Removes all the stored results, the statistics are kept"""
+        self._entries.clear()
+        self._nbytes = 0
+        self._stamp = None
+
+    def _current_stamp(self) -> tuple:
+        return (
+            tuple(node._version for node in self._sources),
+            tuple(output._data[mask].tobytes() for output, mask in self._parameter_sources),
+        )
+
+    def _lookup(self, key: tuple) -> tuple[NDArray, ...] | None:
+        if self._stamp is not None and self._stamp != self._current_stamp():
+            self.clear()
+        if (entry := self._entries.get(key)) is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def _store(self, key: tuple, datas: Iterable[NDArray]) -> None:
+        # the stamp is taken after the evaluation: the first evaluation changes the versions
+        self._stamp = self._current_stamp()
+        entry = tuple(data.copy() for data in datas)
+        nbytes = sum(data.nbytes for data in entry)
+        if nbytes > self._maxbytes:
+            return
+        for data in entry:
+            data.flags.writeable = False
+        self._entries[key] = entry
+        self._nbytes += nbytes
+        while self._nbytes > self._maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= sum(data.nbytes for data in evicted)
+            self._evictions += 1
+
+    def _key(self, x: ArrayLike, kind: str) -> tuple:
+        x = ascontiguousarray(x, dtype=self._dtype)
+        return kind, x.shape, x.tobytes()
+
+    def __call__(
+        self, x: ArrayLike, out: NDArray | tuple[NDArray, ...] | None = None
+    ) -> NDArray | tuple[NDArray, ...] | None:
+        function = self._function
+        key = self._key(x, "value")
+        if (entry := self._lookup(key)) is None:
+            res = function(x, out)
+            if res is not None:
+                self._store(key, (res,) if function.single else res)
+            return res
+
+        if out is not None:
+            for data, outdata in zip(entry, (out,) if function.single else out):
+                copyto(outdata, data)
+            return out
+        if function.copy:
+            entry = tuple(data.copy() for data in entry)
+        return entry[0] if function.single else entry
+
+    def gradient(self, x: ArrayLike) -> NDArray:
+        """Returns the gradient at `x` (see `VectorFunction.gradient()`)"""
+        key = self._key(x, "gradient")
+        if (entry := self._lookup(key)) is None:
+            res = self._function.gradient(x)
+            self._store(key, (res,))
+            return res
+        return entry[0].copy()
+
+    def restore(self) -> None:
+        self._function.restore()
+
+    def __enter__(self) -> MemoizedFunction:
+        return self
+
+    def __exit__(self, *_):
+        self.restore()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import prod, zeros
+
+from .schedule import parent_nodes, toposort
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from numpy.typing import NDArray
+
+    from .node import Node
+    from .output import Output
+
+
+def _is_transient(node: Node, nodes: set[Node], keep: set[Output]) -> bool:
+    """The only output of the node is consumed by a single node and may share the buffer"""
+    if node not in nodes or len(node.outputs) != 1 or not node.inputs.len_all():
+        return False
+    if node._immediate or node._auto_freeze or node.frozen or not node._parallel_safe:
+        return False
+    output = node.outputs[0]
+    if output in keep or not output.allocatable or output._allocating_input is not None:
+        return False
+    if output.dd.shape is None or output.dd.dtype is None:
+        return False
+    if len(output.child_inputs) != 1:
+        return False
+    consumer = output.child_inputs[0].node
+    return (
+        consumer in nodes
+        and consumer._parallel_safe
+        and all(child.allocatable for child in consumer.outputs.iter_all())
+    )
+
+
+class MemoryPlan:
+    """
+    The memory plan for the intermediate outputs of a graph.
+
+    The output, which is consumed only by a single node and is not kept (e.g. exposed via
+    `NodeStorage`), is transient: it is needed only while its consumer is evaluated.
+    The transient outputs with the same dtype and size share the buffers if their lifetimes
+    in the topological order (from the node to its consumer) do not overlap.
+
+    The transient nodes are evaluated only by the consumer, which is not transient itself.
+    Such consumer evaluates the transient nodes upstream (the closure) in the topological order
+    before its own function. The not transient nodes, which the closure and the consumer depend on,
+    are touched before, since they may evaluate the other closures, sharing the buffers.
+    The transient node is evaluated if it is tainted or if its buffer was overwritten by another
+    output since the last evaluation, therefore the plan trades some computations for memory.
+    The transient outputs may be read only while their consumer is being evaluated.
+    """
+
+    __slots__ = (
+        "_consumers",
+        "_closures",
+        "_parents",
+        "_buffers",
+        "_buffer_index",
+        "_nbytes",
+        "_applied",
+    )
+
+    _consumers: dict[Output, Node]
+    _closures: dict[Node, list[Node]]
+    # the not transient nodes, the closure and its consumer depend on
+    _parents: dict[Node, list[Node]]
+    _buffers: list[NDArray]
+    # the index of the buffer of each transient output
+    _buffer_index: dict[Output, int]
+    _nbytes: int
+    _applied: bool
+
+    def __init__(self, nodes: Iterable[Node], keep: Iterable[Output] = ()):
+        if hasattr(keep, "walkvalues"):
+            keep = keep.walkvalues()
+        keep = set(keep)
+        nodes = list(nodes)
+        nodeset = set(nodes)
+
+        order = toposort(nodes)
+        transient = [node for node in order if _is_transient(node, nodeset, keep)]
+        self._consumers = {
+            node.outputs[0]: node.outputs[0].child_inputs[0].node for node in transient
+        }
+        self._closures = {}
+        self._parents = {}
+        self._buffers = []
+        self._buffer_index = {}
+        self._nbytes = 0
+        self._applied = False
+
+        self._assign_buffers(order)
+        self._build_closures(order)
+
+    def _assign_buffers(self, order: list[Node]) -> None:
+        """Assigns the buffers with the greedy linear scan over the topological order"""
+        released: dict[Node, list[Output]] = {}
+        for output, consumer in self._consumers.items():
+            released.setdefault(consumer, []).append(output)
+
+        transient = {output.node: output for output in self._consumers}
+        free: dict[tuple, list[int]] = {}
+        for node in order:
+            if (output := transient.get(node)) is not None:
+                dd = output.dd
+                key = (dd.dtype, int(prod(dd.shape)))
+                if pool := free.get(key):
+                    index = pool.pop()
+                else:
+                    index = len(self._buffers)
+                    self._buffers.append(zeros(key[1], dd.dtype))
+                buffer = self._buffers[index]
+                self._buffer_index[output] = index
+                self._nbytes += buffer.nbytes
+                output._set_data(buffer.reshape(dd.shape), owns_buffer=True)
+                node.fd.needs_postallocate = True
+
+            for output in released.get(node, ()):
+                dd = output.dd
+                key = (dd.dtype, int(prod(dd.shape)))
+                free.setdefault(key, []).append(self._buffer_index[output])
+
+    def _build_closures(self, order: list[Node]) -> None:
+        """
+        For each not transient consumer find the transient nodes it depends on
+        and the other nodes, these transient nodes and the consumer depend on
+        """
+        position = {node: i for i, node in enumerate(order)}
+        transient = {output.node for output in self._consumers}
+        for consumer in set(self._consumers.values()) - transient:
+            closure = set()
+            parents = set()
+            stack = [consumer]
+            while stack:
+                for parent in parent_nodes(stack.pop()):
+                    if parent not in transient:
+                        parents.add(parent)
+                    elif parent not in closure:
+                        closure.add(parent)
+                        stack.append(parent)
+            self._closures[consumer] = sorted(closure, key=position.__getitem__)
+            self._parents[consumer] = sorted(parents, key=position.__getitem__)
+
+    @property
+    def outputs(self) -> list[Output]:
+        """The transient outputs"""
+        return list(self._consumers)
+
+    @property
+    def nbytes_planned(self) -> int:
+        """The memory, which would be allocated for the transient outputs without the plan"""
+        return self._nbytes
+
+    @property
+    def nbytes_allocated(self) -> int:
+        """The memory, allocated for the transient outputs"""
+        return sum(buffer.nbytes for buffer in self._buffers)
+
+    def apply(self) -> None:
+        """Replaces the functions of the nodes (after allocation)"""
+        if self._applied:
+            return
+        # the transient output, which was the last to write each buffer
+        owners: list[Output | None] = [None] * len(self._buffers)
+        for consumer, closure in self._closures.items():
+            steps = tuple(
+                (node, node.fcn, node.outputs[0], self._buffer_index[node.outputs[0]])
+                for node in closure
+            )
+            touches = tuple(parent.touch for parent in self._parents[consumer])
+            consumer._wrap_fcn(_make_transient_evaluation(touches, steps, owners))
+            for node in closure:
+                node.outputs[0]._set_evaluated_by(consumer)
+        for output in self._consumers:
+            node = output.node
+            node._stash_fcn()
+            node.fcn = _skip
+        self._applied = True
+
+    def release(self) -> None:
+        """Restores the functions and gives the transient outputs their own buffers"""
+        if not self._applied:
+            return
+        for consumer in self._closures:
+            consumer._unwrap_fcn()
+        for output in self._consumers:
+            output.node._unwrap_fcn()
+            output._set_evaluated_by(None)
+            output._data = output._data.copy()
+        for node in {output.node for output in self._consumers} | set(self._consumers.values()):
+            node._post_allocate()
+        for output in self._consumers:
+            output.node.fd.tainted = True
+        for consumer in self._closures:
+            consumer.taint()
+        self._buffers = []
+        self._applied = False
+
+
+def _skip():
+    """The function of the transient node: it is evaluated by the consumer"""
+
+
+def _make_transient_evaluation(
+    touches: tuple[Callable, ...],
+    steps: tuple[tuple[Node, Callable, Output, int], ...],
+    owners: list[Output | None],
+) -> Callable:
+    def evaluate_transient(fcn: Callable, _):
+        # the parents may evaluate the other closures, which share the buffers,
+        # therefore they are evaluated before the closure
+        for touch in touches:
+            touch()
+        for node, transient_fcn, output, index in steps:
+            fd = node._fd
+            if not fd.tainted and owners[index] is output:
+                continue
+            fd.tainted_outputs = None
+            fd.being_evaluated = True
+            transient_fcn()
+            node._n_calls += 1
+            fd.being_evaluated = False
+            fd.tainted = False
+            owners[index] = output
+        fcn()
+
+    return evaluate_transient
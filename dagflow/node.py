@@ -15,6 +15,7 @@ from .exception import (
     ReconnectionError,
     UnclosedGraphError,
 )
+from .cutoff import EarlyCutoff, update_cutoff_checks
 from .flagsdescriptor import FlagsDescriptor
 from .graph import Graph
 from .input import Input
@@ -25,10 +26,12 @@ from .nodebase import NodeBase
 from .output import Output
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Container, Iterator, Mapping, Sequence
     from typing import Any
     from weakref import ReferenceType
 
+    from numpy.typing import NDArray
+
     from .metanode import MetaNode
     from .storage import NodeStorage
 
@@ -51,6 +54,11 @@ class Node(NodeBase):
         "_functions",
         "_n_calls",
         "_input_nodes_callbacks",
+        "_input_output_map",
+        "_version",
+        "_early_cutoff",
+        "_cutoff_check",
+        "_parent_versions",
     )
 
     _name: str
@@ -70,7 +78,23 @@ class Node(NodeBase):
     _immediate: bool
     # _always_tainted: bool
 
+    # The node may be evaluated in a thread, concurrently with the other nodes
+    _parallel_safe: bool = True
+
     _input_nodes_callbacks: list[Callable]
+    # the outputs, which depend on the input; the inputs, missing in the map, affect all the outputs
+    _input_output_map: dict[Input, tuple[Output, ...]]
+
+    # early cutoff: the version is incremented each time the outputs are changed,
+    # the node with `_cutoff_check` (downstream of a node with the cutoff) skips the evaluation
+    # if the versions of the parents are the same as on the previous evaluation
+    _version: int
+    _early_cutoff: EarlyCutoff | None
+    _cutoff_check: bool
+    _parent_versions: tuple[int, ...] | None
+
+    # the node provides the vector-Jacobian product `_vjp()`, see `dagflow.autodiff`
+    _vjp_supported: bool = False
 
     def __init__(
         self,
@@ -123,6 +147,11 @@ class Node(NodeBase):
         self.fcn = self._functions["default"]
 
         self._input_nodes_callbacks = []
+        self._input_output_map = {}
+        self._version = 0
+        self._early_cutoff = None
+        self._cutoff_check = False
+        self._parent_versions = None
 
         if kwargs:
             raise InitializationError(f"Unparsed arguments: {kwargs}!")
@@ -308,6 +337,7 @@ class Node(NodeBase):
         self.fd._invalidate(invalid)
 
     def invalidate(self, invalid: bool = True) -> None:
+        self._parent_versions = None
         return self.fd.invalidate(invalid)
 
     def invalidate_children(self, invalid: bool = True) -> None:
@@ -583,6 +613,12 @@ class Node(NodeBase):
             return
         if not self.closed:
             raise UnclosedGraphError("Cannot evaluate not closed node!", node=self)
+        if self._cutoff_check and not force_computation and self._parents_unchanged():
+            self.fd.tainted = False
+            self.fd.tainted_outputs = None
+            if self._auto_freeze:
+                self.fd.frozen = True
+            return
         self.fd.being_evaluated = True
         try:
             self.fcn()
@@ -591,6 +627,11 @@ class Node(NodeBase):
         else:
             self._n_calls += 1
             self.fd.tainted = False
+            self.fd.tainted_outputs = None
+            if self._early_cutoff is None or self._early_cutoff.changed(self.outputs.iter_all()):
+                self._version += 1
+            if self._cutoff_check:
+                self._parent_versions = self._current_parent_versions()
             if self._auto_freeze:
                 self.fd.frozen = True
         self.fd.being_evaluated = False
@@ -615,25 +656,63 @@ class Node(NodeBase):
     ):
         self.logger.debug(f"Node '{self.name}': Taint...")
         self._on_taint(caller)
-        if self.tainted and not force:
+        self._parent_versions = None
+        if self.tainted and not force and self.fd.tainted_outputs is None:
             return
         if self.frozen:
             self.fd.frozen_tainted = True
             return
         self.fd.tainted = True
+        self.fd.tainted_outputs = None
         ret = self.touch() if (self._immediate or force_computation) else None
         self.taint_children(force=force)
         return ret
 
-    def taint_children(self, **kwargs):
-        self.fd.taint_children(**kwargs)
+    def taint_children(self, **kwargs) -> int:
+        self._version += 1
+        return self.fd.taint_children(**kwargs)
 
     def taint_type(self, **kwargs):
         self.logger.debug(f"Node '{self.name}': Taint types...")
         if self.closed:
             raise ClosedGraphError("Unable to taint type", node=self)
+        self._parent_versions = None
         self.fd.taint_type(**kwargs)
 
+    @property
+    def version(self) -> int:
+        """The counter of the changes of the outputs"""
+        return self._version
+
+    @property
+    def early_cutoff(self) -> str | None:
+        return self._early_cutoff.mode if self._early_cutoff is not None else None
+
+    def set_early_cutoff(self, mode: str | None = "compare") -> None:
+        """
+        Enables the early cutoff: after the evaluation the outputs are compared to the previous
+        ones (`mode="compare"`) or their hashes (`mode="hash"`). If the outputs are not changed,
+        the nodes downstream, tainted by the node, are not evaluated. `mode=None` disables
+        the cutoff.
+        """
+        self._set_early_cutoff(mode)
+        update_cutoff_checks((self,))
+
+    def _set_early_cutoff(self, mode: str | None) -> None:
+        """Sets the cutoff mode without updating the checks downstream"""
+        self._early_cutoff = EarlyCutoff(mode) if mode is not None else None
+
+    def _current_parent_versions(self) -> tuple[int, ...]:
+        return tuple(input.parent_node._version for input in self.inputs.iter_all())
+
+    def _parents_unchanged(self) -> bool:
+        """Evaluates the parents and checks whether their outputs were changed"""
+        if self._parent_versions is None:
+            return False
+        for callback in self._input_nodes_callbacks:
+            callback()
+        return self._parent_versions == self._current_parent_versions()
+
     def print(self):
         print(f"Node {self._name}: →[{len(self.inputs)}],[{len(self.outputs)}]→")
         for i, _input in enumerate(self.inputs):
@@ -652,24 +731,48 @@ class Node(NodeBase):
     def _on_taint(self, caller: Input):
         """A node method to be called on taint"""
 
+    def dependent_outputs(self, input: Input) -> tuple[Output, ...] | None:
+        """
+        The outputs, which depend on the `input` (`None` stands for all the outputs).
+        When the `input` is tainted, only the children of these outputs are tainted
+        and the node may recompute only them, see `FlagsDescriptor.tainted_outputs`.
+        """
+        return self._input_output_map.get(input)
+
+    def _vjp(
+        self, grads: Mapping[Output, NDArray], inputs: Container[Input]
+    ) -> Iterator[tuple[Input, NDArray]]:
+        """
+        The vector-Jacobian product for the reverse-mode differentiation: takes the cotangents
+        of the outputs `grads` (the missing outputs have zero cotangents) and yields the
+        cotangents of the `inputs`. The inputs, which are not yielded, get zero cotangents.
+        Only called after the node is evaluated, see `_vjp_supported`.
+        """
+        raise DagflowError("Unimplemented method: the method must be overridden!")
+
     def _post_allocate(self):
         self._input_nodes_callbacks = []
 
+        # each parent is touched once
+        parents = set()
         for input in self.inputs.iter_all():
             node = input.parent_node
-            if not node in self._input_nodes_callbacks:
-                self._input_nodes_callbacks.append(node.touch)
+            if node in parents:
+                continue
+            parents.add(node)
+            self._input_nodes_callbacks.append(node.touch)
 
     def update_types(self, recursive: bool = True):
         if not self.fd.types_tainted:
             return True
         # TODO: causes problems with nodes, that are allocated and closed prior the graph being closed
         # Need a mechanism to request reallocation
+        for input in self.inputs.iter_all():
+            if not input.connected():
+                raise ClosingError("Input is not connected", node=self, input=input)
         if recursive:
             self.logger.debug(f"Node '{self.name}': Trigger recursive update types...")
             for input in self.inputs.iter_all():
-                if not input.connected():
-                    raise ClosingError("Input is not connected", node=self, input=input)
                 input.parent_node.update_types(recursive)
         self.logger.debug(f"Node '{self.name}': Update types...")
         self._typefunc()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from numpy import zeros
 
@@ -19,6 +19,7 @@ from .exception import (
 from .iter import StopNesting
 from .labels import Labels, repr_pretty
 from .shift import rshift
+from .taint import taint_downstream
 
 if TYPE_CHECKING:
     from numpy.typing import ArrayLike, DTypeLike, NDArray
@@ -27,6 +28,7 @@ if TYPE_CHECKING:
 
     from .input import Input
     from .node import Node
+    from .tracer import TaintTracer
     from .types import EdgesLike, ShapeLike
 
 
@@ -44,6 +46,8 @@ class Output:
         "_forbid_reallocation",
         "_labels",
         "_debug",
+        "_n_tainted",
+        "_evaluated_by",
     )
     _data: NDArray | None
     _dd: DataDescriptor
@@ -59,6 +63,13 @@ class Output:
     _owns_buffer: bool
     _forbid_reallocation: bool
     _debug: bool
+    _n_tainted: int
+    # the node, which evaluates the output instead of its own node (fused or transient output),
+    # see `_set_evaluated_by()`
+    _evaluated_by: Node | None
+
+    # the tracer of the assignments via `seti()`, see `TaintTracer`
+    _taint_tracer: ClassVar[TaintTracer | None] = None
 
     def __init__(
         self,
@@ -78,6 +89,8 @@ class Output:
         self._labels = None
         self._data = None
         self._allocating_input = None
+        self._n_tainted = 0
+        self._evaluated_by = None
 
         self._name = name
         self._node = node
@@ -240,10 +253,25 @@ class Output:
     def debug(self) -> bool:
         return self._debug
 
+    @property
+    def n_tainted(self) -> int:
+        """The number of nodes, tainted by the last `set`/`seti`"""
+        return self._n_tainted
+
     @property
     def data_unsafe(self):
         return self._data
 
+    def _set_evaluated_by(self, node: Node | None) -> None:
+        """
+        Sets the node, which evaluates the output instead of its own node (fused or transient
+        output). The data of such output may be read only while this node is being evaluated:
+        the output is switched to the class, which checks it, so the other outputs do not
+        pay for the check.
+        """
+        self._evaluated_by = node
+        self.__class__ = Output if node is None else _DelegatedOutput
+
     def connect_to(self, input) -> Input:
         if not self.closed and input.closed:
             raise ConnectionError(
@@ -316,9 +344,10 @@ class Output:
         else:
             rshift(self, other)
 
-    def taint_children(self, **kwargs) -> None:
-        for input in self._child_inputs:
-            input.taint(**kwargs)
+    def taint_children(self, **kwargs) -> int:
+        """Taints the nodes downstream, returns the number of tainted nodes"""
+        self._node._version += 1
+        return taint_downstream((self,), **kwargs)
 
     def taint_children_type(self, **kwargs) -> None:
         for input in self._child_inputs:
@@ -372,14 +401,23 @@ class Output:
 
         return True
 
-    def seti(self, idx: int, value: float, check_taint: bool = False, force: bool = False) -> bool:
+    def seti(
+        self,
+        idx: int | tuple,
+        value: float | ArrayLike,
+        check_taint: bool = False,
+        force: bool = False,
+    ) -> bool:
         if self.node.frozen and not force:
             return False
 
-        tainted = self._data[idx] != value if check_taint else True
+        tainted = (self._data[idx] != value).any() if check_taint else True
         if tainted:
             self._data[idx] = value
-            self.__taint_children()
+            if Output._taint_tracer is None:
+                self.__taint_children()
+            else:
+                Output._taint_tracer._trace(self, idx, self.__taint_children)
         return tainted
 
     def set(self, data: ArrayLike, check_taint: bool = False, force: bool = False) -> bool:
@@ -393,8 +431,8 @@ class Output:
         return tainted
 
     # TODO: maybe move it into `self.taint_children()`?
-    def __taint_children(self):
-        self.taint_children()
+    def __taint_children(self, **kwargs):
+        self._n_tainted = self.taint_children(**kwargs)
         self.node.invalidate_parents()
         self.node.fd.tainted = False
 
@@ -419,6 +457,38 @@ class Output:
         return ret
 
 
+def taint_children_of(outputs: Sequence[Output]) -> int:
+    """
+    Taints the children of the modified `outputs` in a single pass, as `Output.set()` does for
+    a single output. Returns the number of the tainted nodes.
+    """
+    for output in outputs:
+        output._node._version += 1
+    ntainted = taint_downstream(outputs)
+    for output in outputs:
+        output._n_tainted = ntainted
+        output._node.invalidate_parents()
+        output._node.fd.tainted = False
+    return ntainted
+
+
+class _DelegatedOutput(Output):
+    """The output, evaluated by another node, see `Output._set_evaluated_by()`"""
+
+    __slots__ = ()
+
+    @property
+    def data(self) -> NDArray:
+        evaluated_by = self._evaluated_by
+        if not evaluated_by.being_evaluated and not self.node.being_evaluated:
+            raise CalculationError(
+                f"The output is evaluated by the node '{evaluated_by.name}' and may not be read",
+                node=self._node,
+                output=self,
+            )
+        return Output.data.fget(self)
+
+
 class Outputs(EdgeContainer):
     __slots__ = ()
 
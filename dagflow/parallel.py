@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from os import cpu_count
+from typing import TYPE_CHECKING
+from weakref import finalize
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .node import Node
+    from .schedule import Schedule
+
+
+class ParallelExecutor:
+    """
+    Evaluates the tainted nodes of a schedule with a pool of threads.
+
+    A node is submitted as soon as all its tainted parents are evaluated, so the independent
+    branches of the graph are computed concurrently, while the data dependencies are respected.
+    Each node writes only its own outputs, therefore the result does not depend on the order
+    of the evaluation of the branches.
+
+    The speed up is achieved only for the nodes, which release GIL (numba, numpy, scipy).
+    The nodes with `_parallel_safe=False` (e.g. nodes, which modify the parameters during
+    the evaluation) are evaluated in the main thread while no other node is being evaluated.
+    """
+
+    __slots__ = ("_nthreads", "_pool", "_finalizer", "__weakref__")
+
+    _nthreads: int
+    _pool: ThreadPoolExecutor
+    # shuts the pool down, when the executor is garbage collected
+    _finalizer: finalize
+
+    def __init__(self, nthreads: int | None = None):
+        self._nthreads = nthreads or cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self._nthreads, thread_name_prefix="dagflow")
+        self._finalizer = finalize(self, self._pool.shutdown, wait=False)
+
+    def __enter__(self) -> ParallelExecutor:
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    @property
+    def nthreads(self) -> int:
+        return self._nthreads
+
+    def shutdown(self) -> None:
+        self._finalizer.detach()
+        self._pool.shutdown()
+
+    def touch(self, schedule: Schedule) -> int:
+        """
+        Evaluates the tainted nodes of the `schedule`. Returns the number of the nodes,
+        which functions were called, as `Schedule.touch()`
+        """
+        nodes = schedule.tainted()
+        if not nodes:
+            return 0
+
+        pending = set(nodes)
+        nparents: dict[Node, int] = {}
+        children: dict[Node, list[Node]] = {node: [] for node in nodes}
+        ready: list[Node] = []
+        for node in nodes:
+            nparents[node] = 0
+            for parent in schedule.evaluated_parents(node):
+                if parent in pending:
+                    children[parent].append(node)
+                    nparents[node] += 1
+            if nparents[node] == 0:
+                ready.append(node)
+
+        def release(node: Node) -> None:
+            for child in children[node]:
+                nparents[child] -= 1
+                if nparents[child] == 0:
+                    ready.append(child)
+
+        running: dict[Future, Node] = {}
+        serial: deque[Node] = deque()
+        ncalls = [node._n_calls for node in nodes]
+        try:
+            while ready or running or serial:
+                for node in ready:
+                    if node._parallel_safe:
+                        running[self._pool.submit(node.touch)] = node
+                    else:
+                        serial.append(node)
+                ready.clear()
+
+                if not running:
+                    node = serial.popleft()
+                    node.touch()
+                    release(node)
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    future.result()
+                    release(node)
+        finally:
+            if running:
+                wait(running)
+
+        return sum(node._n_calls != n for node, n in zip(nodes, ncalls))
@@ -4,22 +4,23 @@ from collections.abc import Sequence
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
-from numpy import array, ndarray, zeros_like
+from numpy import array, asarray, broadcast_to, empty, moveaxis, ndarray, tile, zeros_like
 
 from .exception import InitializationError
 from .labels import inherit_labels, repr_pretty
-from .lib import Square
+from .lib.arithmetic import Square
 from .lib.Array import Array
-from .lib.Cholesky import Cholesky
 from .lib.CovmatrixFromCormatrix import CovmatrixFromCormatrix
-from .lib.NormalizeCorrelatedVars2 import NormalizeCorrelatedVars2
 from .lib.View import View
 from .node import Node, Output
+from .output import taint_children_of
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Mapping
+    from collections.abc import Generator, Iterable, Mapping
 
-    from numpy.typing import ArrayLike, DTypeLike
+    from .storage import NodeStorage
+
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 
 class Parameter:
@@ -57,6 +58,7 @@ class Parameter:
         self._parent = parent
         self._common_output = value_output
         self._labelfmt = labelfmt
+        batch = parent is not None and parent.batch is not None
 
         if connectible is not None:
             self._common_connectible_output = connectible
@@ -83,6 +85,7 @@ class Parameter:
                 self._common_connectible_output,
                 start=idx,
                 length=1,
+                axis=-1 if batch else 0,
             )
             self._view.labels.inherit(
                 labels,
@@ -99,23 +102,33 @@ class Parameter:
             self._value_output = value_output
         self._stack = []
 
+        if batch:
+            # the value is a column of the (B, npars) array
+            self._idx = (slice(None), self._idx)
+
     def __str__(self) -> str:
         return f"par v={self.value}"
 
     _repr_pretty_ = repr_pretty
 
     @property
-    def value(self) -> float | int:
+    def value(self) -> float | int | NDArray:
+        """The value of the parameter or the array of `B` values in the batch mode"""
         return self._common_output.data[self._idx]
 
     @value.setter
-    def value(self, value: float | int):
+    def value(self, value: float | int | ArrayLike):
         return self._common_output.seti(self._idx, value)
 
     @property
     def output(self) -> Output:
         return self._value_output
 
+    @property
+    def n_tainted(self) -> int:
+        """The number of nodes, tainted by the last change of the value"""
+        return self._common_output.n_tainted
+
     @property
     def is_correlated(self) -> bool:
         return self._parent.is_correlated
@@ -293,6 +306,7 @@ class Parameters:
         "_norm_pars",
         "_is_variable",
         "_constraint",
+        "_batch",
     )
     value: Output
     _value_node: Node
@@ -303,6 +317,7 @@ class Parameters:
     _is_variable: bool
 
     _constraint: Constraint | None
+    _batch: int | None
 
     def __init__(
         self,
@@ -312,8 +327,16 @@ class Parameters:
         variable: bool | None = None,
         fixed: bool | None = None,
         close: bool = True,
+        batch: int | None = None,
     ):
+        """
+        In the batch mode (`batch=B`) the value node keeps the array of shape `(B, npars)`:
+        each parameter holds `B` values in the column of shape `(B, 1)`. The column
+        is broadcasted by the elementwise nodes, so a single evaluation of the graph
+        computes the outputs with the leading batch dimension `B`.
+        """
         self._value_node = value
+        self._batch = batch
         try:
             self.value = value.outputs[0]
         except IndexError as exc:
@@ -336,7 +359,12 @@ class Parameters:
         if close:
             self._close()
 
-            npars = self.value._data.size
+            npars = self.value._data.shape[-1] if batch is not None else self.value._data.size
+            if batch is not None and self.value._data.shape != (batch, npars):
+                raise InitializationError(
+                    f"Parameters: the batch value must have shape ({batch}, npars), "
+                    f"but given {self.value._data.shape}"
+                )
             if npars > 1:
                 self._pars.extend(Parameter(self.value, i, parent=self) for i in range(npars))
             elif npars == 1:
@@ -355,6 +383,10 @@ class Parameters:
     def is_fixed(self) -> bool:
         return not self._is_variable
 
+    @property
+    def batch(self) -> int | None:
+        return self._batch
+
     @property
     def is_constrained(self) -> bool:
         return self._constraint is not None
@@ -384,6 +416,34 @@ class Parameters:
     def iteritems_norm(self) -> Generator[tuple[tuple[str, ...], Parameter], None, None]:
         yield from zip(self._names, self._norm_pars)
 
+    def set_values(
+        self, values: ArrayLike, *, check_taint: bool = False, force: bool = False
+    ) -> int:
+        """
+        Sets the values of all the parameters: the array of shape `(npars,)` (`(B, npars)` in the
+        batch mode) is written at once and the graph is tainted in a single pass, instead of
+        tainting it for each parameter. Returns the number of the tainted nodes.
+        """
+        output = self.value
+        if output.node.frozen and not force:
+            return 0
+
+        data = output._data
+        if check_taint and (data == values).all():
+            return 0
+
+        if Output._taint_tracer is not None:
+            # the assignments are traced for each parameter
+            values = broadcast_to(values, data.shape)
+            ntainted = 0
+            for par in self._pars:
+                par.value = values[par._idx]
+                ntainted += output.n_tainted
+            return ntainted
+
+        data[...] = values
+        return taint_children_of((output,))
+
     def _reset_pars(self) -> None:
         self._pars = []
         self._norm_pars = []
@@ -402,6 +462,8 @@ class Parameters:
     def set_constraint(self, constraint: Constraint) -> None:
         if self._constraint is not None:
             raise InitializationError("Constraint already set")
+        if self._batch is not None:
+            raise InitializationError("Constraints are not supported in the batch mode")
         self._constraint = constraint
         # constraint._pars = self
 
@@ -416,6 +478,7 @@ class Parameters:
         label: Mapping[str, str] | None = None,
         central: float | int | ArrayLike | None = None,
         sigma: float | int | ArrayLike | None = None,
+        batch: int | None = None,
         **kwargs,
     ) -> Parameters:
         label = {"text": "parameter"} if label is None else dict(label)
@@ -433,17 +496,21 @@ class Parameters:
             )
 
         has_constraint = sigma is not None
+        value = array(value, dtype=dtype)
+        if batch is not None:
+            value = tile(value, (batch, 1))
         pars = Parameters(
             names,
             Array(
                 name,
-                array(value, dtype=dtype),
+                value,
                 label=label,
                 mode="store_weak",
             ),
             fixed=fixed,
             variable=variable,
             close=not has_constraint,
+            batch=batch,
         )
 
         if has_constraint:
@@ -542,6 +609,10 @@ class GaussianConstraint(Constraint):
                 'GaussianConstraint: got "correlation", but no "sigma" as arguments'
             )
 
+        # the nodes depend on scipy
+        from .lib.Cholesky import Cholesky
+        from .lib.NormalizeCorrelatedVars2 import NormalizeCorrelatedVars2
+
         value_node = parameters._value_node
         self._sigma_total_node = sigma
         if sigma is not None:
@@ -700,3 +771,92 @@ def GaussianParameters(
 
 
 AnyGaussianParameter = GaussianParameter | NormalizedGaussianParameter
+
+
+class ParametersSetter:
+    """
+    Sets the values of the sequence of parameters at once.
+
+    The parameters are grouped by their common output (e.g. the correlated parameters share one
+    `Array`): the values of each group are written with a single vectorized assignment and
+    the children of all the modified outputs are tainted in a single pass. The grouping is done
+    once, so the setter is suitable for the repeated assignment (e.g. by a minimizer).
+    The parameters are taken from the iterable or from the storage (in the order of
+    `walkvalues()`, each parameter once).
+    """
+
+    __slots__ = ("_parameters", "_groups")
+
+    _parameters: list[Parameter]
+    # the output, the positions of the values and the indices of the elements of the output
+    _groups: list[tuple[Output, NDArray, NDArray]]
+
+    def __init__(self, parameters: NodeStorage | Iterable[Parameter]):
+        if hasattr(parameters, "walkvalues"):
+            parameters = (
+                value for value in parameters.walkvalues() if isinstance(value, Parameter)
+            )
+        self._parameters = list(dict.fromkeys(parameters))
+
+        groups: dict[Output, tuple[list[int], list[int]]] = {}
+        for i, par in enumerate(self._parameters):
+            positions, indices = groups.setdefault(par._common_output, ([], []))
+            positions.append(i)
+            # in the batch mode the index is `(slice(None), i)`
+            indices.append(par._idx[-1] if isinstance(par._idx, tuple) else par._idx)
+        self._groups = [
+            (output, array(positions), array(indices))
+            for output, (positions, indices) in groups.items()
+        ]
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        return self._parameters
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+    def values(self) -> NDArray:
+        """Returns the current values of the parameters, read at once for each group"""
+        ret = None
+        for output, positions, indices in self._groups:
+            group_values = moveaxis(output._data[..., indices], -1, 0)
+            if ret is None:
+                ret = empty((len(self._parameters), *group_values.shape[1:]), group_values.dtype)
+            ret[positions] = group_values
+        return ret if ret is not None else empty(0)
+
+    def __call__(
+        self, values: ArrayLike, *, check_taint: bool = False, force: bool = False
+    ) -> int:
+        """
+        Sets the `values`, one for each parameter (the array of `B` values in the batch mode).
+        Returns the number of the tainted nodes.
+        """
+        values = asarray(values)
+        if len(values) != len(self._parameters):
+            raise ValueError(
+                f"Expect {len(self._parameters)} values, but given {len(values)}"
+            )
+
+        if Output._taint_tracer is not None:
+            # the assignments are traced for each parameter
+            ntainted = 0
+            for par, value in zip(self._parameters, values):
+                if par._common_output.seti(par._idx, value, check_taint, force):
+                    ntainted += par.n_tainted
+            return ntainted
+
+        modified = []
+        for output, positions, indices in self._groups:
+            if output.node.frozen and not force:
+                continue
+            data = output._data
+            # the values of the group are placed along the last axis
+            group_values = moveaxis(values[positions], 0, -1)
+            if check_taint and (data[..., indices] == group_values).all():
+                continue
+            data[..., indices] = group_values
+            modified.append(output)
+
+        return taint_children_of(modified) if modified else 0
@@ -5,7 +5,6 @@ from contextlib import suppress
 from typing import TYPE_CHECKING
 
 from matplotlib import colormaps
-from matplotlib.axes import Axes
 from matplotlib.pyplot import close as closefig
 from matplotlib.pyplot import cm
 from matplotlib.pyplot import colorbar as plot_colorbar
@@ -31,6 +30,7 @@ from .nodebase import NodeBase
 from .output import Output
 
 if TYPE_CHECKING:
+    from matplotlib.axes import Axes
     from numpy.typing import ArrayLike, NDArray
 
     from .types import EdgesLike, MeshesLike
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from json import dump
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from .node import Node
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+    from .graph import Graph
+    from .storage import NodeStorage
+
+
+class NodeProfile:
+    """The accumulated profile of a single node"""
+
+    __slots__ = ("node", "n_calls", "time_self", "time_inclusive", "nbytes")
+
+    node: Node
+    n_calls: int
+    time_self: float
+    time_inclusive: float
+    nbytes: int
+
+    def __init__(self, node: Node):
+        self.node = node
+        self.n_calls = 0
+        self.time_self = 0.0
+        self.time_inclusive = 0.0
+        self.nbytes = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.node.name,
+            "label": self.node.labels.text,
+            "type": type(self.node).__name__,
+            "n_calls": self.n_calls,
+            "time_self": self.time_self,
+            "time_inclusive": self.time_inclusive,
+            "nbytes": self.nbytes,
+        }
+
+
+class Profiler:
+    """
+    The profiler of the node functions.
+
+    While attached, the profiler wraps the functions of the nodes (a `Graph`, a `NodeStorage`
+    or an iterable of nodes/outputs) and records for each node the number of calls, the self
+    time, the inclusive time (including the evaluation of the parents, triggered from the
+    function) and the number of bytes of the outputs written. The functions are restored on
+    `detach()`, so the profiler has no overhead when it is not attached.
+
+    The nodes may not be fused or have their functions replaced while the profiler is attached.
+    """
+
+    __slots__ = ("_nodes", "_profiles", "_stacks", "_stack", "_attached")
+
+    _nodes: list[Node]
+    _profiles: dict[Node, NodeProfile]
+    _stacks: dict[tuple[Node, ...], float]
+    _stack: list[list]
+    _attached: bool
+
+    def __init__(self, target: Graph | NodeStorage | Iterable, *, attach: bool = True):
+        self._nodes = _collect_nodes(target)
+        self._profiles = {node: NodeProfile(node) for node in self._nodes}
+        self._stacks = {}
+        self._stack = []
+        self._attached = False
+        if attach:
+            self.attach()
+
+    def __enter__(self) -> Profiler:
+        self.attach()
+        return self
+
+    def __exit__(self, *_):
+        self.detach()
+
+    @property
+    def attached(self) -> bool:
+        return self._attached
+
+    @property
+    def profiles(self) -> list[NodeProfile]:
+        return list(self._profiles.values())
+
+    def attach(self) -> None:
+        if self._attached:
+            return
+        for node in self._nodes:
+            node._wrap_fcn(self._profile)
+        self._attached = True
+
+    def detach(self) -> None:
+        if not self._attached:
+            return
+        for node in self._nodes:
+            node._unwrap_fcn()
+        self._attached = False
+
+    def reset(self) -> None:
+        for profile in self._profiles.values():
+            profile.n_calls = 0
+            profile.time_self = 0.0
+            profile.time_inclusive = 0.0
+            profile.nbytes = 0
+        self._stacks = {}
+
+    def _profile(self, fcn: Callable, node: Node) -> None:
+        frame = [node, 0.0]
+        stack = self._stack
+        stack.append(frame)
+        start = perf_counter()
+        try:
+            fcn()
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            time_self = elapsed - frame[1]
+            if stack:
+                stack[-1][1] += elapsed
+
+            profile = self._profiles[node]
+            profile.n_calls += 1
+            profile.time_inclusive += elapsed
+            profile.time_self += time_self
+            profile.nbytes += sum(
+                output.data_unsafe.nbytes
+                for output in node.outputs.iter_all()
+                if output.data_unsafe is not None
+            )
+            key = tuple(frame[0] for frame in stack) + (node,)
+            self._stacks[key] = self._stacks.get(key, 0.0) + time_self
+
+    def sorted(self, key: str = "time_self") -> list[NodeProfile]:
+        """Returns the profiles of the called nodes, sorted by `key` in descending order"""
+        profiles = (profile for profile in self._profiles.values() if profile.n_calls)
+        return sorted(profiles, key=lambda profile: getattr(profile, key), reverse=True)
+
+    def report(self, key: str = "time_self", limit: int | None = 20) -> str:
+        """Returns the table of the nodes sorted by `key`"""
+        profiles = self.sorted(key)[:limit]
+        total = sum(profile.time_self for profile in self._profiles.values()) or 1.0
+        lines = [
+            f"{'self, s':>12} {'%':>6} {'incl., s':>12} {'calls':>8} {'bytes':>12}  node",
+        ]
+        for profile in profiles:
+            lines.append(
+                f"{profile.time_self:12.6f} {100 * profile.time_self / total:6.2f} "
+                f"{profile.time_inclusive:12.6f} {profile.n_calls:8d} {profile.nbytes:12d}  "
+                f"{_frame_name(profile.node)}"
+            )
+        return "\n".join(lines)
+
+    def print(self, *args, **kwargs) -> None:
+        print(self.report(*args, **kwargs))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": [profile.to_dict() for profile in self.sorted()],
+            "stacks": self.collapsed_stacks(),
+        }
+
+    def dump_json(self, filename: str) -> None:
+        with open(filename, "w") as file:
+            dump(self.to_dict(), file, indent=2)
+
+    def collapsed_stacks(self) -> list[str]:
+        """
+        Returns the stacks in the collapsed format (`frame1;frame2 value`) with the self time
+        in microseconds, suitable for the flame graph tools
+        """
+        return [
+            f"{';'.join(_frame_name(node) for node in key)} {round(time * 1e6)}"
+            for key, time in self._stacks.items()
+        ]
+
+    def dump_collapsed(self, filename: str) -> None:
+        with open(filename, "w") as file:
+            for line in self.collapsed_stacks():
+                file.write(f"{line}\n")
+
+
+def _frame_name(node: Node) -> str:
+    text = node.labels.text
+    name = f"{node.name} [{text}]" if text and text != node.name else node.name
+    return name.replace(";", ",").replace("\n", " ")
+
+
+def _collect_nodes(target: Graph | NodeStorage | Iterable) -> list[Node]:
+    """Returns the unique nodes of the graph, the storage or of the iterable of nodes/outputs"""
+    if hasattr(target, "walkvalues"):
+        target = target.walkvalues()
+    elif hasattr(target, "_nodes"):
+        target = target._nodes
+
+    nodes = {}
+    for item in target:
+        if not isinstance(item, Node):
+            item = getattr(item, "node", None)
+            if not isinstance(item, Node):
+                continue
+        nodes[item] = None
+    return list(nodes)
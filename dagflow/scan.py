@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from queue import Empty
+from traceback import format_exc
+from typing import TYPE_CHECKING
+
+from numpy import asarray, empty, ndarray
+
+from .exception import DagflowError
+from .makefcn import makefcn
+from .output import Output
+from .storage import NodeStorage
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.queues import Queue
+
+    from numpy.typing import ArrayLike, NDArray
+
+    from multikeydict.nestedmkdict import NestedMKDict
+
+    from .makefcn import VectorFunction
+    from .node import Node
+    from .parameters import Parameter
+
+
+def scan(
+    target: Node | Output,
+    storage: NodeStorage | NestedMKDict | None,
+    parameters: Sequence[str | Parameter],
+    points: ArrayLike,
+    *,
+    nprocesses: int | None = None,
+    chunksize: int | None = None,
+    warmup: bool = True,
+) -> NDArray:
+    """
+    Evaluates the `target` (the output or the node with a single output) for each of the `N`
+    points of the `(N, K)` array `points` of the values of the `K` `parameters`
+    (the names in the `storage` or the parameters, see `makefcn()`).
+    Returns the array of shape `(N, *shape)`, where `shape` is the shape of the output.
+
+    The points are evaluated by `nprocesses` (the number of CPUs by default) forked worker
+    processes. Each worker owns the copy of the closed graph, takes the chunks of `chunksize`
+    points from the queue and writes the results into the shared memory array: the row `i`
+    always holds the result for the point `i`, independently of the worker and of the order
+    of the evaluation. With `nprocesses=1` the points are evaluated in the current process.
+    The graph with the parallel executor (see `Graph.set_parallel()`) may not be forked,
+    since the threads of its pool are not copied: such graph may be scanned only with
+    `nprocesses=1`.
+
+    If `warmup=True`, the target is evaluated before the workers are forked, so the numba
+    kernels are compiled once, and each worker evaluates the first point once before taking
+    the chunks. The values of the parameters of the current process are not changed.
+    """
+    output = _get_output(target)
+    points = asarray(points)
+    if points.ndim != 2 or points.shape[1] != len(parameters):
+        raise ValueError(
+            f"Expect the points of shape (N, {len(parameters)}), but given {points.shape}"
+        )
+    if storage is None:
+        storage = NodeStorage()
+    fcn = makefcn(output, storage, parameters=parameters, restore="lazy")
+
+    npoints = len(points)
+    shape, dtype = output.dd.shape, output.dd.dtype
+    nprocesses = min(nprocesses or cpu_count() or 1, max(npoints, 1))
+    if npoints == 0:
+        return empty((0, *shape), dtype=dtype)
+    if nprocesses == 1:
+        result = empty((npoints, *shape), dtype=dtype)
+        with fcn:
+            _evaluate(fcn, points, result, 0, npoints)
+        return result
+
+    graph = output.node.graph
+    if graph is not None and graph.executor is not None:
+        raise DagflowError("Unable to fork the graph with the parallel executor for the scan")
+    try:
+        context = get_context("fork")
+    except ValueError as exc:
+        raise DagflowError("The parallel scan requires the `fork` start method") from exc
+
+    if warmup:
+        output.touch()
+    if chunksize is None:
+        chunksize = max(1, npoints // (4 * nprocesses))
+    chunks = [(start, min(start + chunksize, npoints)) for start in range(0, npoints, chunksize)]
+
+    shm = SharedMemory(create=True, size=max(npoints * output.dd.size * dtype.itemsize, 1))
+    result = ndarray((npoints, *shape), dtype=dtype, buffer=shm.buf)
+    tasks = context.Queue()
+    messages = context.Queue()
+    for chunk in chunks:
+        tasks.put(chunk)
+    for _ in range(nprocesses):
+        tasks.put(None)
+
+    processes = [
+        context.Process(
+            target=_worker,
+            args=(fcn, points, result, tasks, messages, warmup),
+            name=f"dagflow scan {i}",
+            daemon=True,
+        )
+        for i in range(nprocesses)
+    ]
+    try:
+        for process in processes:
+            process.start()
+
+        ndone = 0
+        while ndone < len(chunks):
+            try:
+                status, payload = messages.get(timeout=0.1)
+            except Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise DagflowError("A scan worker has terminated unexpectedly") from None
+                continue
+            if status == "error":
+                raise DagflowError(f"A scan worker has failed:\n{payload}")
+            ndone += 1
+
+        return result.copy()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            if process.pid is not None:
+                process.join()
+        for queue in (tasks, messages):
+            queue.close()
+            queue.join_thread()
+        # the array must release the buffer before the shared memory is closed
+        del result
+        shm.close()
+        shm.unlink()
+
+
+def _get_output(target: Node | Output) -> Output:
+    if isinstance(target, Output):
+        return target
+    outputs = target.outputs
+    if len(outputs) != 1:
+        raise ValueError(
+            f"The scan target must have a single output, but {target} has {len(outputs)}"
+        )
+    return outputs[0]
+
+
+def _evaluate(fcn: VectorFunction, points: NDArray, result: NDArray, start: int, stop: int):
+    for i in range(start, stop):
+        fcn(points[i], out=result[i])
+
+
+def _worker(
+    fcn: VectorFunction,
+    points: NDArray,
+    result: NDArray,
+    tasks: Queue,
+    messages: Queue,
+    warmup: bool,
+) -> None:
+    """Evaluates the chunks of the points in the forked process"""
+    try:
+        if warmup:
+            fcn(points[0])
+        while (chunk := tasks.get()) is not None:
+            _evaluate(fcn, points, result, *chunk)
+            messages.put(("done", chunk))
+    except BaseException:  # noqa: BLE001 (reported to the main process)
+        messages.put(("error", format_exc()))
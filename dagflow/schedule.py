@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .graph import Graph
+    from .node import Node
+    from .output import Output
+
+
+def parent_nodes(node: Node) -> Iterator[Node]:
+    """Iterate over the nodes, connected to the inputs of the `node`"""
+    for input in node.inputs.iter_all():
+        if (output := input.parent_output) is not None:
+            yield output.node
+
+
+def toposort(nodes: Iterable[Node]) -> list[Node]:
+    """
+    Returns the `nodes` and all their ancestors in the topological order:
+    every node goes after all its parents.
+
+    The order is deterministic: it follows the order of the `nodes` and the order of the inputs.
+    The iterative depth first search is used, so there is no limit on the depth of the graph.
+    """
+    order = []
+    visited = set()
+    for root in nodes:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, parent_nodes(root))]
+        while stack:
+            node, parents = stack[-1]
+            for parent in parents:
+                if parent not in visited:
+                    visited.add(parent)
+                    stack.append((parent, parent_nodes(parent)))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    return order
+
+
+class Schedule:
+    """
+    The flat topologically ordered list of the nodes.
+
+    A linear pass over the schedule evaluates the tainted nodes after their parents,
+    therefore the `touch` of a node finds the parents up to date and
+    does not trigger the recursive evaluation.
+
+    The delegated nodes (e.g. the fused intermediate nodes) are evaluated by other nodes,
+    they are skipped by `touch()` and `tainted()`, see `set_delegated()`.
+    """
+
+    __slots__ = ("_nodes", "_index", "_evaluated", "_delegated")
+
+    _nodes: list[Node]
+    _index: dict[Node, int]
+    _evaluated: list[Node]
+    _delegated: set[Node]
+
+    def __init__(self, nodes: Iterable[Node]):
+        self._nodes = toposort(nodes)
+        self._index = {node: i for i, node in enumerate(self._nodes)}
+        self._evaluated = self._nodes
+        self._delegated = set()
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> Schedule:
+        return cls(graph._nodes)
+
+    @classmethod
+    def from_targets(cls, *targets: Node | Output) -> Schedule:
+        """Make the schedule for the targets and all their ancestors"""
+        return cls(getattr(target, "node", target) for target in targets)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._nodes)
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self._index
+
+    @property
+    def nodes(self) -> list[Node]:
+        return self._nodes
+
+    def index(self, node: Node) -> int:
+        return self._index[node]
+
+    def set_delegated(self, nodes: Iterable[Node]) -> None:
+        """Sets the nodes, which are evaluated by other nodes and are skipped by `touch()`"""
+        self._delegated = delegated = set(nodes)
+        if delegated:
+            self._evaluated = [node for node in self._nodes if node not in delegated]
+        else:
+            self._evaluated = self._nodes
+
+    def evaluated_parents(self, node: Node) -> set[Node]:
+        """The parents of the `node`, the delegated parents are replaced by their parents"""
+        parents = set()
+        stack = [node]
+        while stack:
+            for parent in parent_nodes(stack.pop()):
+                if parent not in self._delegated:
+                    parents.add(parent)
+                elif parent not in parents:
+                    parents.add(parent)
+                    stack.append(parent)
+        return parents - self._delegated
+
+    def tainted(self) -> list[Node]:
+        """Returns the tainted not frozen not delegated nodes in the order of evaluation"""
+        return [node for node in self._evaluated if node.tainted and not node.frozen]
+
+    def touch(self) -> int:
+        """
+        Evaluates the tainted nodes in a single linear pass. Returns the number of the nodes,
+        which functions were called (the nodes, skipped by the early cutoff, are not counted)
+        """
+        nevaluated = 0
+        for node in self._evaluated:
+            fd = node._fd
+            if fd.tainted and not fd.frozen:
+                ncalls = node._n_calls
+                node.touch()
+                nevaluated += node._n_calls != ncalls
+        return nevaluated
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pickle import PickleBuffer, Pickler, PicklingError, Unpickler
+from struct import Struct
+from typing import TYPE_CHECKING
+from weakref import ReferenceType
+from weakref import ref as weakref
+
+from numpy import array, frombuffer, memmap, ndarray, uint8, uint64
+
+from .exception import DagflowError, UnclosedGraphError
+from .input import Input
+from .nodebase import NodeBase
+from .output import Output
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from numpy.typing import DTypeLike, NDArray
+
+    from .graph import Graph
+    from .storage import NodeStorage
+
+_magic = b"DAGFLOW\x01"
+# magic, size of the pickled graph, number of buffers
+_header = Struct("<8sQQ")
+_alignment = 64
+
+# the objects, linked to each other along the graph: their states are pickled separately
+# so that the depth of the pickling does not depend on the depth of the graph
+_graph_types = (NodeBase, Input, Output)
+
+
+def _root(data: NDArray) -> NDArray:
+    """The array, which owns the memory of the `data`"""
+    while isinstance(data.base, ndarray):
+        data = data.base
+    return data
+
+
+def _rebuild_root(buffer, dtype: DTypeLike, shape: tuple[int, ...]) -> NDArray:
+    return frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+def _rebuild_view(
+    root: NDArray, offset: int, dtype: DTypeLike, shape: tuple[int, ...], strides: tuple[int, ...]
+) -> NDArray:
+    return ndarray(shape, dtype=dtype, buffer=root, offset=offset, strides=strides)
+
+
+def _rebuild_weakref(obj: Any) -> ReferenceType | None:
+    return None if obj is None else weakref(obj)
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+class _DeferredState:
+    """Restores the state of the object, which was pickled without it"""
+
+    __slots__ = ("obj", "state")
+
+    def __init__(self, obj: Any, state: Any):
+        self.obj = obj
+        self.state = state
+
+    def __reduce__(self):
+        return _identity, (self.obj,), self.state
+
+
+class _GraphPickler(Pickler):
+    """
+    Pickles the arrays so that the views share the memory of the same base array after loading,
+    the contiguous base arrays are stored out-of-band.
+
+    The nodes, inputs and outputs are pickled without their states, which are collected and
+    pickled later by `dump_graph()` in batches, so the pickling is not recursive along the graph.
+    The weak references are pickled as the references to the objects and rebuilt on loading.
+    """
+
+    _deferred: list[_DeferredState]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._deferred = []
+
+    def dump_graph(self, obj: Any) -> None:
+        """Pickles the `obj` followed by the batches of the deferred states and `None`"""
+        self.dump(obj)
+        while self._deferred:
+            batch, self._deferred = self._deferred, []
+            self.dump(batch)
+        self.dump(None)
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, _graph_types):
+            func, args, state, *rest = obj.__reduce_ex__(5)
+            if any(item is not None for item in rest):
+                return NotImplemented
+            if state is not None:
+                self._deferred.append(_DeferredState(obj, state))
+            return func, args
+        if isinstance(obj, ReferenceType):
+            return _rebuild_weakref, (obj(),)
+        if not isinstance(obj, ndarray) or obj.dtype.hasobject:
+            return NotImplemented
+        root = _root(obj)
+        if not root.flags.c_contiguous:
+            return NotImplemented
+        if obj is root:
+            return _rebuild_root, (PickleBuffer(root), root.dtype, root.shape)
+        offset = obj.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+        return _rebuild_view, (root, offset, obj.dtype, obj.shape, obj.strides)
+
+
+def save_snapshot(filename: str, graph: Graph, storage: NodeStorage | None = None) -> None:
+    """
+    Saves the closed graph (the nodes, connections, labels, data descriptors and data)
+    and optionally the storage to a single file, see `load_snapshot()`.
+
+    The file contains the pickled graph followed by the aligned contents of the arrays.
+    The arrays, which are the views of other arrays, are stored as views.
+    The metanodes are saved together with their nodes. As in the original graph, the nodes
+    reference them weakly, so they are kept alive after loading only if they are referenced
+    elsewhere, e.g. by the `storage`.
+    The graph with the fused nodes, the memory plan, the parallel executor or with the wrapped
+    functions (e.g. an attached profiler) may not be saved.
+    """
+    if not graph.closed:
+        raise UnclosedGraphError("Only the closed graph may be saved")
+    if graph.fused_groups or graph.memory_plan is not None or graph.executor is not None:
+        raise DagflowError("Unable to save the fused graph, the memory plan or the executor")
+
+    buffers: list[PickleBuffer] = []
+    stream = BytesIO()
+
+    pickler = _GraphPickler(stream, protocol=5, buffer_callback=buffers.append)
+    try:
+        pickler.dump_graph((graph, storage))
+    except (PicklingError, AttributeError, TypeError) as exc:
+        raise DagflowError(f"Unable to save the graph: {exc}") from exc
+    payload = stream.getbuffer()
+
+    table = []
+    offset = _header.size + 16 * len(buffers) + len(payload)
+    for buffer in buffers:
+        offset += -offset % _alignment
+        nbytes = buffer.raw().nbytes
+        table.append((offset, nbytes))
+        offset += nbytes
+
+    with open(filename, "wb") as file:
+        file.write(_header.pack(_magic, len(payload), len(buffers)))
+        file.write(array(table, dtype=uint64).reshape(-1, 2).tobytes())
+        file.write(payload)
+        for (offset, _), buffer in zip(table, buffers):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(buffer.raw())
+
+
+def load_snapshot(filename: str, *, mmap_mode: str = "c") -> tuple[Graph, NodeStorage | None]:
+    """
+    Loads the graph and the storage, saved by `save_snapshot()`.
+
+    The arrays are not copied, but memory mapped from the file. With the default `mmap_mode="c"`
+    (copy on write) the modifications of the data are not written to the file,
+    `mmap_mode="r+"` writes them back, `mmap_mode="r"` makes the data read only.
+
+    The snapshot is unpickled, which may execute arbitrary code: only load the trusted files.
+    """
+    with open(filename, "rb") as file:
+        magic, npayload, nbuffers = _header.unpack(file.read(_header.size))
+        if magic != _magic:
+            raise DagflowError(f"{filename} is not a dagflow snapshot")
+        table = frombuffer(file.read(16 * nbuffers), dtype=uint64).reshape(nbuffers, 2)
+        payload = file.read(npayload)
+
+    if nbuffers:
+        data = memmap(filename, dtype=uint8, mode=mmap_mode)
+        buffers = [data[offset : offset + nbytes] for offset, nbytes in table.tolist()]
+    else:
+        buffers = []
+    unpickler = Unpickler(BytesIO(payload), buffers=buffers)
+    ret = unpickler.load()
+    # the deferred states are restored by the unpickling itself
+    while unpickler.load() is not None:
+        pass
+    return ret
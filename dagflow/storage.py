@@ -15,21 +15,33 @@ from .output import Output
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
+    from numpy.typing import ArrayLike
+    from pandas import DataFrame
     from typing import TYPE_CHECKING, Any, Literal
 
     from collections.abc import Mapping, MutableSet, Sequence
 
-from LaTeXDatax import datax
 from numpy import nan, ndarray
-from pandas import DataFrame
-from pandas import set_option as pandas_set_option
-from tabulate import tabulate
-
-pandas_set_option("display.max_rows", None)
-pandas_set_option("display.max_colwidth", 100)
 
 from shutil import get_terminal_size
 
+# pandas, tabulate and LaTeXDatax are imported on the first use: they are only needed
+# for the output and are expensive to import
+_pandas_configured = False
+
+
+def _make_df(*args, **kwargs) -> DataFrame:
+    global _pandas_configured
+    from pandas import DataFrame
+    from pandas import set_option as pandas_set_option
+
+    if not _pandas_configured:
+        pandas_set_option("display.max_rows", None)
+        pandas_set_option("display.max_colwidth", 100)
+        _pandas_configured = True
+
+    return DataFrame(*args, **kwargs)
+
 
 def trunc(text: str, width: int) -> str:
     return "\n".join(line[:width] for line in text.split("\n"))
@@ -254,6 +266,48 @@ class NodeStorage(NestedMKDict):
             if not dct:
                 source.delete_with_parents(key)
 
+    #
+    # Parameters
+    #
+    def set_parameters(
+        self,
+        values: Mapping[KeyLike, float | ArrayLike],
+        *,
+        check_taint: bool = False,
+        force: bool = False,
+    ) -> int:
+        """
+        Sets the values of the parameters by their keys and taints the graph in a single pass,
+        see `ParametersSetter`. Returns the number of the tainted nodes.
+        """
+        from .parameters import Parameter, ParametersSetter
+
+        parameters = []
+        for key in values:
+            if not isinstance(parameter := self[key], Parameter):
+                raise TypeError(f"{self.joinkey(key)} is not a parameter, but {type(parameter)}")
+            parameters.append(parameter)
+
+        setter = ParametersSetter(parameters)
+        if len(setter) != len(parameters):
+            raise ValueError("Some parameters are set more than once")
+        return setter(list(values.values()), check_taint=check_taint, force=force)
+
+    def set_vector(
+        self, values: ArrayLike, *, check_taint: bool = False, force: bool = False
+    ) -> int:
+        """
+        Sets the values of all the parameters of the storage in the order of `walkvalues()`
+        (each parameter once) and taints the graph in a single pass.
+        Returns the number of the tainted nodes.
+
+        The parameters are collected on each call: for the repeated assignment create
+        `ParametersSetter(storage)` once.
+        """
+        from .parameters import ParametersSetter
+
+        return ParametersSetter(self)(values, check_taint=check_taint, force=force)
+
     #
     # Converters
     #
@@ -268,7 +322,7 @@ class NodeStorage(NestedMKDict):
         dct = self.to_list(**kwargs)
         if columns is None:
             columns = ["path", "value", "central", "sigma", "flags", "shape", "label"]
-        df = DataFrame(dct, columns=columns)
+        df = _make_df(dct, columns=columns)
 
         df.insert(4, "sigma_rel_perc", df["sigma"])
         sigma_rel_perc = df["sigma"] / df["central"] * 100.0
@@ -299,6 +353,8 @@ class NodeStorage(NestedMKDict):
     def to_table(
         self, *, df_kwargs: Mapping = {}, truncate: int | bool | Literal["auto"] = False, **kwargs
     ) -> str:
+        from tabulate import tabulate
+
         df = self.to_df(**df_kwargs)
         kwargs.setdefault("headers", df.columns)
         kwargs.setdefault("showindex", False)
@@ -338,6 +394,8 @@ class NodeStorage(NestedMKDict):
         return tex, df if return_df else tex
 
     def to_datax(self, filename: str, **kwargs) -> None:
+        from LaTeXDatax import datax
+
         data = self.to_dict(**kwargs)
         include = ("value", "central", "sigma", "sigma_rel_perc")
         odict = {".".join(k): v for k, v in data.walkitems() if (k and k[-1] in include)}
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .input import Inputs
+    from .node import Node
+    from .output import Output
+
+# The generation of the current taint propagation.
+# Each node is stamped with the generation when visited, so it is processed only once.
+_generation = 0
+
+
+def taint_downstream(
+    outputs: Iterable[Output], *, force: bool = False, collect: list[Node] | None = None
+) -> int:
+    """
+    Taints all the nodes, which depend on the `outputs`.
+
+    The propagation uses an explicit worklist instead of the recursion and each node is visited
+    at most once per propagation, which is controlled by the generation stamp: the node,
+    stamped with the current generation, is skipped unless it is partially tainted.
+    The `_on_taint(caller)` method is still called for every connection, since the node
+    may depend on the input, which caused the taint.
+
+    If the node declares the outputs, which depend on the input (`Node.dependent_outputs`),
+    only these outputs are marked as tainted (`FlagsDescriptor.tainted_outputs`)
+    and only their children are tainted further.
+
+    The `immediate` nodes are evaluated after the propagation is finished,
+    so they see the consistent state of the graph.
+
+    Returns the number of the nodes, which became tainted. If `collect` is given,
+    these nodes are appended to it.
+    """
+    global _generation
+    _generation += 1
+    generation = _generation
+
+    ntainted = 0
+    immediate: list[Node] = []
+    stack = [outputs]
+    while stack:
+        for output in stack.pop():
+            for input in output._child_inputs:
+                node = input._node
+                node._on_taint(input)
+                fd = node._fd
+                if fd.taint_generation == generation and fd.tainted_outputs is None:
+                    continue
+                fd.taint_generation = generation
+                if (
+                    node._input_output_map
+                    and not force
+                    and (dependent := node._input_output_map.get(input)) is not None
+                ):
+                    if fd.frozen:
+                        fd.frozen_tainted = True
+                        continue
+                    if not fd.tainted:
+                        fd.tainted = True
+                        fd.tainted_outputs = set()
+                        ntainted += 1
+                        if collect is not None:
+                            collect.append(node)
+                        if node._immediate:
+                            immediate.append(node)
+                    elif fd.tainted_outputs is None:
+                        continue
+                    if new := [output for output in dependent if output not in fd.tainted_outputs]:
+                        fd.tainted_outputs.update(new)
+                        stack.append(new)
+                    continue
+
+                partial = fd.tainted and fd.tainted_outputs is not None
+                if fd.tainted and not force and not partial:
+                    continue
+                if fd.frozen:
+                    fd.frozen_tainted = True
+                    continue
+                fd.tainted = True
+                fd.tainted_outputs = None
+                if not partial:
+                    ntainted += 1
+                    if collect is not None:
+                        collect.append(node)
+                    if node._immediate:
+                        immediate.append(node)
+                stack.append(node.outputs)
+
+    for node in immediate:
+        node.touch()
+
+    return ntainted
+
+
+def invalidate_upstream(inputs: Inputs, invalid: bool = True) -> None:
+    """
+    Invalidates (or validates) all the nodes, which the `inputs` depend on.
+    Each node is visited only once.
+    """
+    visited = set()
+    stack = [inputs]
+    while stack:
+        for input in stack.pop().iter_all():
+            node = input.parent_node
+            if node in visited:
+                continue
+            visited.add(node)
+            node.invalidate(invalid)
+            stack.append(node.inputs)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import array
+
+from ..parameters import Parameter
+from .graphwalker import GraphWalker
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from numpy.typing import NDArray
+
+    from ..output import Output
+    from ..storage import NodeStorage
+
+
+class ParameterDependencies:
+    """
+    The structural dependencies of the outputs on the parameters: the outputs, reachable
+    downstream from each parameter, and the parameters, each output depends on.
+
+    The parameters are taken from the iterable or from the storage (each parameter once).
+    The graph, connected to the parameters, is walked once (`GraphWalker`) in the topological
+    order and the parameters are propagated from the inputs to the dependent outputs of each node
+    (see `Node.dependent_outputs()`). The view of the parameter depends only on the parameter,
+    while the consumers of the whole array of values depend on all the parameters of the array.
+
+    The index is built on the first query, so it may be created before the graph is complete.
+    """
+
+    __slots__ = ("_parameters", "_positions", "_masks")
+
+    _parameters: list[Parameter]
+    _positions: dict[Parameter, int]
+    # the bit masks of the positions of the parameters by output
+    _masks: dict[Output, int] | None
+
+    def __init__(self, parameters: NodeStorage | Iterable[Parameter]):
+        if hasattr(parameters, "walkvalues"):
+            parameters = (
+                value for value in parameters.walkvalues() if isinstance(value, Parameter)
+            )
+        self._parameters = list(dict.fromkeys(parameters))
+        self._positions = {par: i for i, par in enumerate(self._parameters)}
+        self._masks = None
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        return self._parameters
+
+    def _build(self) -> dict[Output, int]:
+        # the array of values depends on all its parameters
+        masks: dict[Output, int] = {}
+        for i, par in enumerate(self._parameters):
+            masks[par._common_output] = masks.get(par._common_output, 0) | (1 << i)
+        # the view depends on its parameter and not on the other elements of the array
+        excluded: dict[Output, int] = {}
+        for i, par in enumerate(self._parameters):
+            if (output := par.output) is not par._common_output:
+                masks[output] = masks.get(output, 0) | (1 << i)
+                excluded[output] = masks[par._common_output]
+
+        for node in GraphWalker(*masks).nodes_sorted():
+            for input in node.inputs.iter_all():
+                if (parent := input.parent_output) is None or not (mask := masks.get(parent)):
+                    continue
+                outputs = node.dependent_outputs(input)
+                for output in node.outputs.iter_all() if outputs is None else outputs:
+                    masks[output] = masks.get(output, 0) | (mask & ~excluded.get(output, 0))
+
+        return {output: mask for output, mask in masks.items() if mask}
+
+    @property
+    def masks(self) -> dict[Output, int]:
+        """The bit masks of the positions of the parameters, each output depends on"""
+        if self._masks is None:
+            self._masks = self._build()
+        return self._masks
+
+    def parameters_of(self, output: Output) -> list[Parameter]:
+        """The parameters, the `output` depends on"""
+        mask = self.masks.get(output, 0)
+        return [par for i, par in enumerate(self._parameters) if mask >> i & 1]
+
+    def outputs_of(self, parameter: Parameter) -> list[Output]:
+        """The outputs, reachable downstream from the `parameter`"""
+        bit = 1 << self._positions[parameter]
+        return [output for output, mask in self.masks.items() if mask & bit]
+
+    def depends(self, output: Output, parameter: Parameter) -> bool:
+        return bool(self.masks.get(output, 0) >> self._positions[parameter] & 1)
+
+    def mask(self, output: Output, parameters: Sequence[Parameter] | None = None) -> NDArray:
+        """
+        The boolean array: whether the `output` depends on each of the `parameters`
+        (on each of the parameters of the index by default)
+        """
+        mask = self.masks.get(output, 0)
+        if parameters is None:
+            return array([mask >> i & 1 for i in range(len(self._parameters))], dtype=bool)
+        return array([mask >> self._positions[par] & 1 for par in parameters], dtype=bool)
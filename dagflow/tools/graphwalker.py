@@ -22,6 +22,7 @@ class GraphWalker:
         "_include_only",
         "_initial_nodes",
         "_queue",
+        "_queued_nodes",
         "_skipped_nodes",
         "_cache_nodes",
         "_cache_inputs",
@@ -34,6 +35,7 @@ class GraphWalker:
     _initial_nodes: list
 
     _queue: deque[Node]
+    _queued_nodes: set[Node]
     _skipped_nodes: set[Node]
     _cache_nodes: OrderedSet
     _cache_inputs: OrderedSet
@@ -42,7 +44,9 @@ class GraphWalker:
     _cache_outputs_open: OrderedSet
 
     def __init__(
-        self, *args: Node | Output | Iterable[Node] | Iterable[Output], *, include_only: Iterable[Node]
+        self,
+        *args: Node | Output | Iterable[Node] | Iterable[Output],
+        include_only: Iterable[Node] = (),
     ):
         self._include_only = tuple(include_only)
 
@@ -51,6 +55,7 @@ class GraphWalker:
             self._add_initial_node(arg)
 
         self._queue = deque()
+        self._queued_nodes = set()
         self._skipped_nodes = set()
         self._cache_nodes = OrderedSet()
         self._cache_inputs = OrderedSet()
@@ -102,10 +107,11 @@ class GraphWalker:
 
     def _add_to_queue(self, *nodes: Node):
         for node in nodes:
-            if node in self._queue or node in self._cache_nodes or node in self._skipped_nodes:
+            if node in self._queued_nodes:
                 continue
 
             self._queue.append(node)
+            self._queued_nodes.add(node)
 
     def _propagate_forward(self, node: Node, skip: bool):
         for output in node.outputs.iter_all():
@@ -147,6 +153,29 @@ class GraphWalker:
     def nodes(self) -> Generator[Node]:
         yield from self._cache_nodes
 
+    def nodes_sorted(self) -> list[Node]:
+        """The nodes in the topological order: each node follows the nodes it depends on"""
+        nparents = {
+            node: sum(
+                1
+                for input in node.inputs.iter_all()
+                if input.parent_output and input.parent_output.node in self._cache_nodes
+            )
+            for node in self._cache_nodes
+        }
+        queue = deque(node for node, n in nparents.items() if n == 0)
+        ret = []
+        while queue:
+            node = queue.popleft()
+            ret.append(node)
+            for output in node.outputs.iter_all():
+                for child_input in output.child_inputs:
+                    if (child := child_input.node) in nparents:
+                        nparents[child] -= 1
+                        if nparents[child] == 0:
+                            queue.append(child)
+        return ret
+
     def node_do(self, *args: Callable):
         return self._list_do(self._cache_nodes, *args)
 
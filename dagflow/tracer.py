@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from .exception import DagflowError
+from .output import Output
+from .profiler import _collect_nodes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+    from .graph import Graph
+    from .node import Node
+    from .parameters import Parameter
+    from .storage import NodeStorage
+
+
+class ParameterTrace:
+    """The statistics of the assignments of a single parameter"""
+
+    __slots__ = ("parameter", "n_changes", "n_tainted", "n_evaluated", "time", "evaluated")
+
+    parameter: Parameter
+    n_changes: int
+    n_tainted: int
+    n_evaluated: int
+    time: float
+    evaluated: dict[Node, int]
+
+    def __init__(self, parameter: Parameter):
+        self.parameter = parameter
+        self.n_changes = 0
+        self.n_tainted = 0
+        self.n_evaluated = 0
+        self.time = 0.0
+        self.evaluated = {}
+
+    @property
+    def name(self) -> str:
+        return self.parameter.output.node.name
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "n_changes": self.n_changes,
+            "n_tainted": self.n_tainted,
+            "n_evaluated": self.n_evaluated,
+            "time": self.time,
+            "evaluated": {node.name: count for node, count in self.evaluated.items()},
+        }
+
+
+class TaintEvent:
+    """A single assignment of the parameter and the nodes it has tainted"""
+
+    __slots__ = ("trace", "tainted")
+
+    trace: ParameterTrace
+    tainted: set[Node]
+
+    def __init__(self, trace: ParameterTrace, tainted: set[Node]):
+        self.trace = trace
+        self.tainted = tainted
+
+
+class TaintTracer:
+    """
+    Traces the assignments of the parameters and the recomputations they cause.
+
+    For each assignment of the parameter value (`Output.seti()`) the tracer records the nodes
+    of the graph, which became tainted. While attached, the functions of the nodes are wrapped
+    (like with `Profiler`) and each evaluation is attributed to the assignment, which has tainted
+    the node since the previous evaluation, together with its self time. If several parameters
+    are assigned before the evaluation, the node is attributed to the first of them, which
+    tainted it. The statistics are aggregated per parameter, see `ParameterTrace`.
+
+    Only one tracer may be attached at a time.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_node_set",
+        "_parameters",
+        "_traces",
+        "_pending",
+        "_evaluated",
+        "_stack",
+        "_attached",
+    )
+
+    _nodes: list[Node]
+    _node_set: set[Node]
+    _parameters: dict[Output, list[tuple[Any, ParameterTrace]]]
+    _traces: list[ParameterTrace]
+    _pending: list[TaintEvent]
+    _evaluated: bool
+    _stack: list[list]
+    _attached: bool
+
+    def __init__(
+        self,
+        target: Graph | NodeStorage | Iterable,
+        parameters: NodeStorage | Iterable,
+        *,
+        attach: bool = True,
+    ):
+        self._nodes = _collect_nodes(target)
+        self._node_set = set(self._nodes)
+        self._parameters = {}
+        self._traces = []
+        for parameter in _collect_parameters(parameters):
+            trace = ParameterTrace(parameter)
+            self._traces.append(trace)
+            self._parameters.setdefault(parameter._common_output, []).append(
+                (parameter._idx, trace)
+            )
+        self._pending = []
+        self._evaluated = False
+        self._stack = []
+        self._attached = False
+        if attach:
+            self.attach()
+
+    def __enter__(self) -> TaintTracer:
+        self.attach()
+        return self
+
+    def __exit__(self, *_):
+        self.detach()
+
+    @property
+    def attached(self) -> bool:
+        return self._attached
+
+    @property
+    def traces(self) -> list[ParameterTrace]:
+        return self._traces
+
+    def attach(self) -> None:
+        if self._attached:
+            return
+        if Output._taint_tracer is not None:
+            raise DagflowError("Another taint tracer is attached")
+        Output._taint_tracer = self
+        for node in self._nodes:
+            node._wrap_fcn(self._evaluate)
+        self._attached = True
+
+    def detach(self) -> None:
+        if not self._attached:
+            return
+        Output._taint_tracer = None
+        for node in self._nodes:
+            node._unwrap_fcn()
+        self._pending = []
+        self._attached = False
+
+    def _find_trace(self, output: Output, idx) -> ParameterTrace | None:
+        for parameter_idx, trace in self._parameters.get(output, ()):
+            if parameter_idx is idx or parameter_idx == idx:
+                return trace
+        return None
+
+    def _trace(self, output: Output, idx, taint: Callable) -> None:
+        """Called by `Output.seti()` instead of tainting the children"""
+        if (trace := self._find_trace(output, idx)) is None:
+            taint()
+            return
+
+        collected = []
+        taint(collect=collected)
+        nodes = self._node_set
+        tainted = {node for node in collected if node in nodes}
+
+        if self._evaluated:
+            self._pending = []
+            self._evaluated = False
+        self._pending.append(TaintEvent(trace, tainted))
+        trace.n_changes += 1
+        trace.n_tainted += len(tainted)
+
+    def _evaluate(self, fcn: Callable, node: Node) -> None:
+        frame = [0.0]
+        stack = self._stack
+        stack.append(frame)
+        start = perf_counter()
+        try:
+            fcn()
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            self._evaluated = True
+            for event in self._pending:
+                if node in event.tainted:
+                    event.tainted.discard(node)
+                    trace = event.trace
+                    trace.n_evaluated += 1
+                    trace.time += elapsed - frame[0]
+                    trace.evaluated[node] = trace.evaluated.get(node, 0) + 1
+                    break
+
+    def reset(self) -> None:
+        for trace in self._traces:
+            trace.n_changes = 0
+            trace.n_tainted = 0
+            trace.n_evaluated = 0
+            trace.time = 0.0
+            trace.evaluated = {}
+        self._pending = []
+
+    def sorted(self, key: str = "time") -> list[ParameterTrace]:
+        """Returns the traces of the changed parameters, sorted by `key` in descending order"""
+        traces = (trace for trace in self._traces if trace.n_changes)
+        return sorted(traces, key=lambda trace: getattr(trace, key), reverse=True)
+
+    def report(self, key: str = "time", limit: int | None = 20) -> str:
+        """Returns the table of the parameters sorted by `key`"""
+        lines = [f"{'time, s':>12} {'changes':>8} {'tainted':>10} {'evaluated':>10}  parameter"]
+        for trace in self.sorted(key)[:limit]:
+            lines.append(
+                f"{trace.time:12.6f} {trace.n_changes:8d} {trace.n_tainted:10d} "
+                f"{trace.n_evaluated:10d}  {trace.name}"
+            )
+        return "\n".join(lines)
+
+    def print(self, *args, **kwargs) -> None:
+        print(self.report(*args, **kwargs))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"parameters": [trace.to_dict() for trace in self.sorted()]}
+
+
+def _collect_parameters(parameters: NodeStorage | Iterable) -> list[Parameter]:
+    """Returns the parameters (including the normalized ones) of the storage or of the iterable"""
+    if hasattr(parameters, "walkvalues"):
+        parameters = parameters.walkvalues()
+
+    ret = {}
+    for item in parameters:
+        if hasattr(item, "norm_parameters"):
+            for parameter in (*item.parameters, *item.norm_parameters):
+                ret[parameter] = None
+        elif hasattr(item, "_common_output"):
+            ret[item] = None
+    return list(ret)
@@ -4,7 +4,7 @@ from collections.abc import Sequence
 from itertools import repeat
 from typing import TYPE_CHECKING
 
-from numpy import allclose, issubdtype, result_type
+from numpy import allclose, broadcast_shapes, issubdtype, result_type
 
 from .exception import TypeFunctionError
 from .input import Input
@@ -189,6 +189,29 @@ def eval_output_dtype(
         output.dd.dtype = dtype
 
 
+def eval_output_broadcast_shape(
+    node: Node,
+    inputkey: LimbKey = AllPositionals,
+    outputkey: LimbKey = AllPositionals,
+) -> tuple[int, ...]:
+    """
+    Evaluating the shape of the broadcasting of the inputs and setting it for the outputs.
+
+    Used to propagate the leading batch dimension: the inputs of shapes `(B, 1)` and `(N,)`
+    produce the output of shape `(B, N)`.
+    """
+    inputs = node.inputs.iter(inputkey)
+    outputs = node.outputs.iter(outputkey)
+
+    try:
+        shape = broadcast_shapes(*(inp.dd.shape for inp in inputs))
+    except ValueError as exc:
+        raise TypeFunctionError(f"Inputs may not be broadcasted: {exc.args[0]}", node=node) from exc
+    for output in outputs:
+        output.dd.shape = shape
+    return shape
+
+
 def copy_input_shape_to_outputs(
     node: Node,
     inputkey: str | int = 0,
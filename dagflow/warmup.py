@@ -0,0 +1,45 @@
+"""
+Compiles the numba kernels of the library into the numba cache:
+
+    python -m dagflow.warmup
+    python -m dagflow.warmup --check
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+
+from .kernels import check, kernels, warmup
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m dagflow.warmup", description=__doc__)
+    parser.add_argument("-k", "--pattern", help="process only the kernels matching the pattern")
+    parser.add_argument("-l", "--list", action="store_true", help="list the kernels and exit")
+    parser.add_argument(
+        "-c", "--check", action="store_true", help="report the kernels missing in the cache"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="print each kernel")
+    opts = parser.parse_args(args)
+
+    if opts.list:
+        for kern in kernels(opts.pattern):
+            print(f"{kern.name:<60s} {len(kern.signatures):3d} signature(s)")
+        return 0
+
+    if opts.check:
+        uncached = check(opts.pattern)
+        for name, reason in uncached:
+            print(f"{name:<60s} {reason}")
+        if uncached:
+            print(f"{len(uncached)} kernel signature(s) are not cached")
+        return 1 if uncached else 0
+
+    compiled = warmup(opts.pattern, verbose=opts.verbose)
+    ncompiled = sum(map(len, compiled.values()))
+    print(f"Compile {len(compiled)} kernel(s): {ncompiled} signature(s) compiled")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
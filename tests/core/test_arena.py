@@ -0,0 +1,55 @@
+from numpy import allclose, fromfile, linspace, shares_memory, uint8
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Product, Sum
+
+
+def _make_graph(debug_graph):
+    x = linspace(0.0, 1.0, 11)
+    with Graph(debug=debug_graph) as graph:
+        arr1 = Array("arr1", x)
+        arr2 = Array("arr2", 2.0 * x, mode="fill")
+        add = Sum("sum")
+        prod = Product("product")
+        (arr1, arr2) >> add
+        (add, arr1) >> prod
+    return graph, (arr1, arr2), (add, prod)
+
+
+def test_arena(debug_graph):
+    graph, (arr1, arr2), (add, prod) = _make_graph(debug_graph)
+    graph.close(arena=True)
+
+    arena = graph.arena
+    assert len(arena) == 3
+    assert arena.nodes == [arr2, add, prod]
+    for node in (arr2, add, prod):
+        data = node.outputs[0].data_unsafe
+        assert shares_memory(data, arena.buffer)
+        assert data.ctypes.data % arena.alignment == 0
+    assert not shares_memory(arr1.outputs[0].data_unsafe, arena.buffer)
+
+    x = arr1.outputs[0].data
+    assert allclose(prod.outputs[0].data, 3 * x**2)
+
+    snapshot = arena.snapshot()
+    arena.restore(snapshot * 0)
+    assert prod.tainted
+    assert allclose(prod.outputs[0].data, 3 * x**2)
+
+    arena.restore(snapshot * 0, assume_valid=True)
+    assert not prod.tainted
+    assert (prod.outputs[0].data == 0).all()
+
+
+def test_arena_memmap(debug_graph, tmp_path):
+    graph, (arr1, _), (_, prod) = _make_graph(debug_graph)
+    filename = str(tmp_path / "arena.dat")
+    graph.close(arena=filename)
+
+    x = arr1.outputs[0].data
+    assert allclose(prod.outputs[0].data, 3 * x**2)
+
+    arena = graph.arena
+    arena.flush()
+    assert (fromfile(filename, dtype=uint8) == arena.buffer).all()
@@ -0,0 +1,123 @@
+from numpy import allclose, array, diag, linspace, zeros
+from numpy.linalg import inv
+from pytest import mark, raises
+
+from dagflow.autodiff import Gradient, gradient
+from dagflow.exception import DagflowError
+from dagflow.graph import Graph
+from dagflow.lib import (
+    Array,
+    Concatenation,
+    Division,
+    ElSumSq,
+    Exp,
+    Interpolator,
+    Log,
+    Product,
+    SegmentIndex,
+)
+from dagflow.lib.LinearFunction import LinearFunction
+from dagflow.makefcn import makefcn
+from dagflow.parameters import GaussianParameters, Parameters
+from dagflow.storage import NodeStorage
+
+
+def _numeric_gradient(fcn, x0, step=1e-6):
+    ret = zeros(len(x0))
+    for i in range(len(x0)):
+        x1, x2 = x0.copy(), x0.copy()
+        x1[i] += step
+        x2[i] -= step
+        ret[i] = (fcn(x1)[0] - fcn(x2)[0]) / (2 * step)
+    return ret
+
+
+@mark.parametrize("method", ("linear", "log", "exp"))
+def test_autodiff_chi2(method):
+    coarse_x = linspace(0.5, 5.0, 10)
+    fine_x = linspace(0.7, 4.5, 25)
+    data = linspace(1.0, 2.0, 25)
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(
+            value=[0.3, -0.1, 1.2, 1.02], names=("a", "b", "norm", "scale")
+        )
+        a, b, norm, scale = pars.parameters
+        shape = LinearFunction("shape")
+        a >> shape("a")
+        b >> shape("b")
+        Array("coarse_x", coarse_x) >> shape
+        expshape = Exp("exp")
+        shape >> expshape
+
+        # the fine points are scaled by the parameter
+        fine = Product("fine")
+        (Array("fine_x", fine_x), scale.output) >> fine
+
+        coarse = Array("coarse", coarse_x)
+        segment_index = SegmentIndex("segment_index")
+        (coarse, fine) >> segment_index
+        interpolator = Interpolator("interpolator", method=method)
+        expshape >> interpolator
+        coarse >> interpolator("coarse")
+        fine >> interpolator("fine")
+        segment_index >> interpolator("indices")
+
+        model = Product("model")
+        (interpolator, norm.output) >> model
+        ratio = Division("ratio")
+        (model, Array("data", data)) >> ratio
+        logratio = Log("log")
+        ratio >> logratio
+        chi2 = ElSumSq("chi2")
+        logratio >> chi2
+
+    grad = Gradient(chi2, pars.parameters)
+    x0 = array([par.value for par in pars.parameters])
+    assert allclose(grad(), gradient(chi2.outputs[0], pars.parameters), rtol=0, atol=0)
+
+    fcn = makefcn(chi2, NodeStorage(), parameters=pars.parameters)
+    expected = _numeric_gradient(fcn, x0)
+    assert allclose(grad(), expected, rtol=1e-5, atol=1e-8)
+    assert allclose(fcn.gradient(x0 * 1.1), _numeric_gradient(fcn, x0 * 1.1), rtol=1e-5, atol=1e-8)
+    # the values are restored
+    assert allclose([par.value for par in pars.parameters], x0, rtol=0, atol=0)
+
+
+@mark.parametrize("correlated", (False, True))
+def test_autodiff_gaussian_constraint(correlated):
+    value_in = [1.1, 1.8, 5.0]
+    central_in = [1.0, 2.0, 3.0]
+    sigma_in = array([1.0, 0.5, 2.0])
+    names = ("a", "b", "c")
+    with Graph(close_on_exit=True):
+        value = Array("value", value_in, mode="store_weak")
+        central = Array("central", central_in)
+        if correlated:
+            covariance_in = sigma_in[:, None] * sigma_in[None, :] * 0.3
+            covariance_in[range(3), range(3)] = sigma_in**2
+            covariance = Array("covariance", covariance_in)
+            gp = GaussianParameters(names, value, central, covariance=covariance)
+        else:
+            covariance_in = diag(sigma_in**2)
+            sigma = Array("sigma", sigma_in)
+            gp = GaussianParameters(names, value, central, sigma=sigma)
+        chi2 = ElSumSq("chi2")
+        gp.constraint.normvalue_final >> chi2
+
+    # χ²=(v-c)ᵀV⁻¹(v-c)
+    diff = array(value_in) - array(central_in)
+    expected = 2.0 * inv(covariance_in) @ diff
+    assert allclose(gradient(chi2, gp.parameters), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_autodiff_unsupported():
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        concatenation = Concatenation("concatenation")
+        pars.parameters[0] >> concatenation
+        pars.parameters[1] >> concatenation
+        chi2 = ElSumSq("chi2")
+        concatenation >> chi2
+
+    with raises(DagflowError):
+        Gradient(chi2, pars.parameters)
@@ -0,0 +1,27 @@
+from dagflow.benchmarks import compare, read, run, save
+from dagflow.benchmarks.__main__ import main
+
+
+def test_benchmarks_run(tmp_path):
+    results = run("graph.*", quick=True, repeat=1, min_time=0.0)
+    assert {"graph.build[100]", "graph.close[100]", "graph.evaluate[100]"} <= set(
+        results["results"]
+    )
+    assert all(result["time"] > 0 for result in results["results"].values())
+
+    filename = tmp_path / "results.json"
+    save(results, filename)
+    assert read(filename) == results
+
+
+def test_benchmarks_compare():
+    baseline = {"results": {"a[1]": {"time": 1.0}, "b[1]": {"time": 1.0}, "c[1]": {"time": 1.0}}}
+    results = {"results": {"a[1]": {"time": 1.1}, "b[1]": {"time": 1.5}, "d[1]": {"time": 1.0}}}
+    statuses = {key: status for key, *_, status in compare(results, baseline, tolerance=0.2)}
+    assert statuses == {"a[1]": "ok", "b[1]": "slower", "c[1]": "missing", "d[1]": "new"}
+
+
+def test_benchmarks_cli(tmp_path):
+    filename = str(tmp_path / "baseline.json")
+    assert main(["-k", "graph.reevaluate_one", "-q", "-r", "1", "-o", filename]) == 0
+    assert main(["-k", "graph.reevaluate_one", "-q", "-r", "1", "-b", filename, "-t", "1e6"]) == 0
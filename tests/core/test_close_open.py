@@ -89,3 +89,23 @@ def test_03(debug_graph):
     assert not prod.closed
     assert not sum1.closed
     assert not sum2.closed
+
+
+def test_close_deep(debug_graph):
+    """The graph, deeper than the recursion limit, is closed in a single topological pass"""
+    from sys import getrecursionlimit
+
+    from dagflow.lib import Copy
+
+    depth = 2 * getrecursionlimit()
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(3, dtype="d"))
+        prev = arr
+        for i in range(depth):
+            node = Copy(f"copy {i}")
+            prev >> node
+            prev = node
+    assert graph.closed
+    assert prev.closed
+    assert graph.touch() >= depth
+    assert (prev.outputs[0].data == [0, 1, 2]).all()
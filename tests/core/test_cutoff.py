@@ -0,0 +1,100 @@
+from numpy import arange, array
+from pytest import mark, raises
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Square, Sum
+
+
+@mark.parametrize("mode", ("compare", "hash"))
+def test_cutoff_01(debug_graph, mode):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(3, dtype="d"), mode="store_weak")
+        other = Array("other", array((1.0, 1.0, 1.0)), mode="store_weak")
+        square = Square("square")
+        add = Sum("add")
+        arr >> square
+        (square, other) >> add
+    graph.set_early_cutoff(mode)
+    assert square.early_cutoff == mode
+
+    assert (add.outputs[0].data == [1, 2, 5]).all()
+    assert square.n_calls == 1
+    assert add.n_calls == 1
+
+    # the square does not change: the sum is not evaluated
+    arr.outputs[0].set(-arange(3, dtype="d"))
+    assert add.tainted
+    assert (add.outputs[0].data == [1, 2, 5]).all()
+    assert square.n_calls == 2
+    assert add.n_calls == 1
+    assert not add.tainted
+
+    # the square is changed
+    arr.outputs[0].set(arange(1, 4, dtype="d"))
+    assert (add.outputs[0].data == [2, 5, 10]).all()
+    assert square.n_calls == 3
+    assert add.n_calls == 2
+
+    # the other parent is changed
+    other.outputs[0].set(array((2.0, 2.0, 2.0)))
+    assert (add.outputs[0].data == [3, 6, 11]).all()
+    assert square.n_calls == 3
+    assert add.n_calls == 3
+
+    # disabled cutoff
+    graph.set_early_cutoff(None)
+    assert square.early_cutoff is None
+    arr.outputs[0].set(-arange(1, 4, dtype="d"))
+    assert (add.outputs[0].data == [3, 6, 11]).all()
+    assert add.n_calls == 4
+
+
+def test_cutoff_force(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True):
+        arr = Array("arr", arange(3, dtype="d"), mode="store_weak")
+        square = Square("square")
+        add = Sum("add")
+        arr >> square >> add
+    square.set_early_cutoff("compare")
+
+    add.touch()
+    add.touch(force_computation=True)
+    assert add.n_calls == 2
+
+    with raises(ValueError):
+        square.set_early_cutoff("unknown")
+
+
+def test_cutoff_deep(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(3, dtype="d"), mode="store_weak")
+        other = Array("other", array((1.0, 1.0, 1.0)), mode="store_weak")
+        square = Square("square")
+        add1 = Sum("add1")
+        add2 = Sum("add2")
+        add3 = Sum("add3")
+        arr >> square
+        (square, other) >> add1
+        add1 >> add2
+        (add2, other) >> add3
+    square.set_early_cutoff("compare")
+    assert add1._cutoff_check and add2._cutoff_check and add3._cutoff_check
+
+    assert (add3.outputs[0].data == [2, 3, 6]).all()
+    assert graph.touch() == 0
+
+    # the square does not change: the whole subtree is not evaluated
+    arr.outputs[0].set(-arange(3, dtype="d"))
+    assert add3.tainted
+    assert graph.touch() == 1
+    assert (add3.outputs[0].data == [2, 3, 6]).all()
+    assert square.n_calls == 2
+    assert [node.n_calls for node in (add1, add2, add3)] == [1, 1, 1]
+
+    # the other parent of the grandchild is changed
+    other.outputs[0].set(array((2.0, 2.0, 2.0)))
+    assert (add3.outputs[0].data == [4, 5, 8]).all()
+    assert [node.n_calls for node in (add1, add2, add3)] == [2, 2, 2]
+
+    square.set_early_cutoff(None)
+    assert not (add1._cutoff_check or add2._cutoff_check or add3._cutoff_check)
@@ -0,0 +1,47 @@
+from numpy import arange, array
+
+from dagflow.flagsstore import StoredFlagsDescriptor
+from dagflow.graph import Graph
+from dagflow.lib import Array, Cache, Product, Sum
+
+
+def test_flagsstore(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr1 = Array("arr1", arange(3, dtype="d"))  # [0, 1, 2]
+        arr2 = Array("arr2", array((3, 2, 1), dtype="d"))
+        sum1 = Sum("sum1")
+        cache = Cache("cache")
+        prod = Product("product")
+        (arr1, arr2) >> sum1  # [3, 3, 3]
+        sum1 >> cache
+        (cache, arr2) >> prod  # [9, 6, 3]
+
+    store = graph.make_flags_store()
+    assert graph.make_flags_store() is store
+    assert len(store) == 5
+    assert all(isinstance(node.fd, StoredFlagsDescriptor) for node in store.nodes)
+    assert store.closed.all()
+    assert set(store.tainted_nodes()) == {arr1, arr2, sum1, cache, prod}
+
+    assert (prod.outputs[0].data == [9, 6, 3]).all()
+    assert not store.tainted_nodes()
+    assert store.frozen[store.index(cache)]
+
+    arr1.outputs[0].set(array((1, 1, 1), dtype="d"))
+    assert store.tainted_nodes() == [sum1]
+    assert cache.frozen_tainted
+
+    # vectorized taint stops at the frozen cache
+    sum1.fd.tainted = False
+    assert store.taint_downstream([arr2]) == 2
+    assert set(store.tainted_nodes()) == {sum1, prod}
+
+    assert store.unfreeze(store.mask_of(Cache)) == 1
+    assert not cache.frozen
+    assert set(store.tainted_nodes()) == {sum1, cache, prod}
+    assert (prod.outputs[0].data == [12, 6, 2]).all()
+
+    graph.open()
+    assert graph.flags_store is None
+    assert all(type(node.fd).__name__ == "FlagsDescriptor" for node in store.nodes)
+    assert cache.frozen and not prod.tainted
@@ -0,0 +1,82 @@
+from numpy import allclose, array, exp, linspace
+from pytest import raises
+
+from dagflow.exception import CalculationError
+from dagflow.graph import Graph
+from dagflow.lib import Array, Exp, Product, Square, Sum
+
+
+def test_fusion(debug_graph):
+    x = linspace(0.0, 1.0, 11)
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr1 = Array("arr1", x)
+        arr2 = Array("arr2", 2.0 * x)
+        arr3 = Array("arr3", 0.5 - x)
+        prod = Product("product")
+        add = Sum("sum")
+        fexp = Exp("exp")
+        square = Square("square")
+        other = Square("other")
+        (arr1, arr2) >> prod
+        (prod, arr3) >> add
+        add >> fexp
+        fexp >> square
+        arr1 >> other
+
+    groups = graph.fuse()
+    assert len(groups) == 1
+    (group,) = groups
+    assert group.root is square
+    assert set(group.intermediates) == {prod, add, fexp}
+    assert group.expression == "(exp(((a0[i] * a1[i]) + a2[i])))**2"
+
+    def expected():
+        return exp(arr1.outputs[0].data * arr2.outputs[0].data + arr3.outputs[0].data) ** 2
+
+    assert allclose(square.outputs[0].data, expected())
+    assert all(node.n_calls == 0 for node in (prod, add, fexp))
+    assert (other.outputs[0].data == x**2).all()
+    # the outputs of the intermediate nodes are not updated
+    with raises(CalculationError):
+        fexp.outputs[0].data
+
+    arr3.outputs[0].set(array(x[::-1]))
+    assert square.tainted and fexp.tainted
+    assert graph.schedule.tainted() == [square]
+    assert graph.touch() == 1
+    assert allclose(square.outputs[0].data, expected())
+    assert square.n_calls == 2
+
+    # the parallel executor evaluates the root after the leaves
+    arr1.outputs[0].set(2.0 * x)
+    graph.set_parallel(2)
+    assert graph.touch() == 2
+    assert allclose(square.outputs[0].data, expected())
+    assert (other.outputs[0].data == 4.0 * x**2).all()
+    graph.set_parallel(1)
+
+    graph.unfuse()
+    assert not graph.fused_groups
+    assert allclose(square.outputs[0].data, expected())
+    assert allclose(fexp.outputs[0].data, exp(2 * x * 2 * x + x[::-1]))
+
+
+def test_fusion_flags_store(debug_graph):
+    """The graph is fused before the flags are moved to the store"""
+    x = linspace(0.0, 1.0, 11)
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr1 = Array("arr1", x)
+        arr2 = Array("arr2", 2.0 * x)
+        add = Sum("sum")
+        square = Square("square")
+        (arr1, arr2) >> add >> square
+
+    graph.fuse()
+    store = graph.make_flags_store()
+    assert allclose(square.outputs[0].data, (3.0 * x) ** 2)
+    assert not add.tainted
+
+    arr1.outputs[0].set(2.0 * x)
+    assert add.tainted and square.tainted
+    assert allclose(square.outputs[0].data, (4.0 * x) ** 2)
+    assert not store.tainted_nodes()
@@ -0,0 +1,64 @@
+from os.path import dirname
+from subprocess import CompletedProcess, run
+from sys import executable
+
+from pytest import mark, raises
+
+import dagflow.lib
+
+# the modules, which should not be imported by the core of dagflow
+_heavy_modules = ("pandas", "tabulate", "scipy", "numba", "matplotlib", "ROOT")
+# the cumulative import time of the core modules, s
+_import_budget = 2.0
+# the directory, containing the dagflow package: the tests are run from the `tests` directory
+_root = dirname(dirname(dagflow.__file__))
+
+
+def _run_python(code: str, *args: str) -> CompletedProcess:
+    return run(
+        [executable, *args, "-c", code], capture_output=True, text=True, check=True, cwd=_root
+    )
+
+
+@mark.parametrize(
+    "modules",
+    (
+        "dagflow.graph",
+        "dagflow.node",
+        "dagflow.lib",
+        "dagflow.storage",
+        "dagflow.parameters",
+        "dagflow.bundles.file_reader",
+    ),
+)
+def test_import_lazy(modules: str):
+    code = (
+        f"import sys, {modules}\n"
+        f"print(*(name for name in {_heavy_modules!r} if name in sys.modules))"
+    )
+    assert _run_python(code).stdout.strip() == ""
+
+
+def test_import_budget():
+    # the lines of -X importtime: "import time: self [us] | cumulative [us] | module"
+    output = _run_python("import dagflow.node", "-X", "importtime").stderr
+    cumulative = {}
+    for line in output.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, time, name = line.split("|")
+            if time.strip().isdigit():
+                cumulative[name.strip()] = int(time) * 1e-6
+
+    assert cumulative["dagflow.node"] < _import_budget
+
+
+def test_lib_lazy_attributes():
+    from dagflow.lib.Array import Array
+    from dagflow.lib.arithmetic import Sum
+
+    assert dagflow.lib.Array is Array
+    assert dagflow.lib.Sum is Sum
+    assert set(dagflow.lib.__all__) <= set(dir(dagflow.lib))
+
+    with raises(AttributeError):
+        dagflow.lib.NotANode
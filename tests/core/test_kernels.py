@@ -0,0 +1,32 @@
+from dagflow.kernels import check, kernels, warmup
+from dagflow.warmup import main
+
+
+def test_kernels_registered():
+    names = {kern.name for kern in kernels()}
+    assert {
+        "dagflow.lib.Integrator._integrate1d",
+        "dagflow.lib.Interpolator._interpolation",
+        "dagflow.lib.SegmentIndex._is_sorted",
+    } <= names
+    for kern in kernels():
+        assert kern.cached, kern.name
+        assert kern.signatures, kern.name
+
+
+def test_kernels_warmup():
+    pattern = "*.BinCenter.*"
+    compiled = warmup(pattern)
+    assert set(compiled) == {"dagflow.lib.BinCenter._bincenter"}
+    for kern in kernels(pattern):
+        assert all(kern.is_compiled(signature) for signature in kern.signatures)
+
+    # compiled in this process
+    assert not check(pattern)
+    assert warmup(pattern) == {"dagflow.lib.BinCenter._bincenter": []}
+
+
+def test_warmup_cli():
+    assert main(["-l"]) == 0
+    assert main(["-k", "*.MeshToEdges.*", "-v"]) == 0
+    assert main(["-k", "*.MeshToEdges.*", "--check"]) == 0
@@ -1,4 +1,4 @@
-from numpy import arange
+from numpy import arange, zeros
 from pytest import mark
 
 from dagflow.graph import Graph
@@ -98,3 +98,65 @@ def test_makefcn_nonsafe(testname, pass_params, pass_output):
     assert all(res1 == res2)
 
     savegraph(graph, f"output/{testname}.png")
+
+
+@mark.parametrize("restore", ("eager", "lazy"))
+def test_makefcn_vector(restore):
+    n = 10
+    x = arange(n, dtype="d")
+    vals_in = [1.0, 2.0]
+    vals_new = [3.0, 4.0]
+
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=vals_in, names=("a", "b"))
+        storage = NodeStorage({"parameters": {"all": {"a": pars._pars[0], "b": pars._pars[1]}}})
+        f = LinearFunction("ax+b")
+        A, B = pars._pars
+        A >> f("a")
+        B >> f("b")
+        Array("x", x) >> f
+
+    LF = makefcn(f, storage, parameters=("parameters.all.b", A), restore=restore)
+    assert LF.parameters == [B, A]
+
+    res1 = LF(vals_new[::-1])
+    assert all(res1 == (vals_new[0] * x + vals_new[1]))
+    if restore == "eager":
+        # the parameters are restored, the graph is tainted, but not evaluated
+        assert (A.value, B.value) == tuple(vals_in)
+        assert LF.initial_values is None
+        assert f.tainted
+    else:
+        assert (A.value, B.value) == tuple(vals_new)
+        assert all(LF.initial_values == vals_in[::-1])
+
+    out = zeros(n)
+    assert LF([0.0, 2.0], out=out) is out
+    assert all(out == 2.0 * x)
+
+    LF.restore()
+    assert (A.value, B.value) == tuple(vals_in)
+    assert all(f.outputs[0].data == (vals_in[0] * x + vals_in[1]))
+
+    with LF:
+        LF([0.0, 0.0])
+    assert (A.value, B.value) == tuple(vals_in)
+
+
+def test_makefcn_vector_unsafe():
+    x = arange(5, dtype="d")
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        f = LinearFunction("ax+b")
+        A, B = pars._pars
+        A >> f("a")
+        B >> f("b")
+        Array("x", x) >> f
+
+    LF = makefcn(f.outputs[0], NodeStorage(), safe=False, parameters=(A, B))
+    res = LF([2.0, 1.0])
+    # no copy
+    assert res is f.outputs[0].data
+    assert all(res == 2.0 * x + 1.0)
+    assert (A.value, B.value) == (2.0, 1.0)
+    assert LF.initial_values is None
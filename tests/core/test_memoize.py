@@ -0,0 +1,90 @@
+from numpy import allclose, arange, zeros
+from pytest import mark
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Product
+from dagflow.lib.LinearFunction import LinearFunction
+from dagflow.makefcn import VectorFunction, makefcn
+from dagflow.memoize import MemoizedFunction
+from dagflow.parameters import Parameters
+from dagflow.storage import NodeStorage
+
+
+@mark.parametrize("restore", ("eager", "lazy"))
+def test_memoize(restore):
+    x = arange(5, dtype="d")
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0, 3.0], names=("a", "b", "c"))
+        A, B, C = pars.parameters
+        f = LinearFunction("ax+b")
+        A >> f("a")
+        B >> f("b")
+        X = Array("x", x)
+        X >> f
+        y = Product("y")
+        (f, C.output) >> y
+
+    fcn = makefcn(y, NodeStorage(), parameters=(A, B), restore=restore, cache=1024)
+    assert isinstance(fcn, MemoizedFunction)
+
+    res1 = fcn([2.0, 1.0])
+    assert allclose(res1, 3.0 * (2.0 * x + 1.0), rtol=0, atol=0)
+    ncalls = y.n_calls
+    res2 = fcn([2.0, 1.0])
+    assert res2 is not res1
+    assert allclose(res2, res1, rtol=0, atol=0)
+    assert y.n_calls == ncalls
+    out = zeros(5)
+    assert fcn([2.0, 1.0], out=out) is out
+    assert allclose(out, res1, rtol=0, atol=0)
+    assert (fcn.hits, fcn.misses, len(fcn), fcn.nbytes) == (2, 1, 1, x.nbytes)
+
+    fcn([1.0, 0.0])
+    assert (fcn.hits, fcn.misses, len(fcn)) == (2, 2, 2)
+
+    # the changes of the other inputs invalidate the cache
+    X.set(2.0 * x)
+    assert allclose(fcn([2.0, 1.0]), 3.0 * (4.0 * x + 1.0), rtol=0, atol=0)
+    assert (fcn.misses, len(fcn)) == (3, 1)
+    C.value = 1.0
+    assert allclose(fcn([2.0, 1.0]), 4.0 * x + 1.0, rtol=0, atol=0)
+    assert (fcn.misses, len(fcn)) == (4, 1)
+    fcn([2.0, 1.0])
+    assert fcn.hits == 3
+
+    fcn.restore()
+    assert (A.value, B.value) == (1.0, 2.0)
+
+
+def test_memoize_eviction():
+    x = arange(5, dtype="d")
+    with Graph(close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        A, B = pars.parameters
+        f = LinearFunction("ax+b")
+        A >> f("a")
+        B >> f("b")
+        Array("x", x) >> f
+
+    fcn = MemoizedFunction(
+        VectorFunction([f.outputs[0], A.output], [A, B]), maxbytes=2 * (x.nbytes + 8)
+    )
+    for value in (1.0, 2.0, 3.0):
+        res, a = fcn([value, 0.0])
+        assert allclose(res, value * x, rtol=0, atol=0)
+        assert a == value
+    assert fcn.stats() == {
+        "entries": 2,
+        "hits": 0,
+        "misses": 3,
+        "evictions": 1,
+        "nbytes": 2 * (x.nbytes + 8),
+        "maxbytes": 2 * (x.nbytes + 8),
+    }
+
+    # the least recently used entry is evicted
+    fcn([2.0, 0.0])
+    fcn([1.0, 0.0])
+    assert (fcn.hits, fcn.misses, fcn.evictions) == (1, 4, 2)
+    fcn([2.0, 0.0])
+    assert (fcn.hits, fcn.misses) == (2, 4)
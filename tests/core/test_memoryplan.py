@@ -0,0 +1,100 @@
+from numpy import allclose, exp, linspace, shares_memory, sin, sqrt
+from pytest import raises
+
+from dagflow.exception import CalculationError
+from dagflow.graph import Graph
+from dagflow.lib import Array, Exp, Sin, Square, Sqrt, Sum
+
+
+def _make_graph(debug_graph):
+    x = linspace(0.0, 1.0, 101)
+    with Graph(debug=debug_graph) as graph:
+        arr1 = Array("arr1", x)
+        arr2 = Array("arr2", 2.0 * x)
+        arr3 = Array("arr3", 1.0 - x)
+        sum1 = Sum("sum1")
+        square = Square("square")
+        sum2 = Sum("sum2")
+        root = Sqrt("sqrt")
+        (arr1, arr2) >> sum1
+        sum1 >> square
+        (square, arr3) >> sum2
+        sum2 >> root
+    return graph, (arr1, arr2, arr3), (sum1, square, sum2, root)
+
+
+def test_memoryplan(debug_graph):
+    graph, (arr1, arr2, arr3), (sum1, square, sum2, root) = _make_graph(debug_graph)
+    graph.close(memory_plan=True)
+
+    plan = graph.memory_plan
+    assert set(plan.outputs) == {sum1.outputs[0], square.outputs[0], sum2.outputs[0]}
+    assert plan.nbytes_allocated * 3 == plan.nbytes_planned * 2
+    assert shares_memory(sum2.outputs[0].data_unsafe, sum1.outputs[0].data_unsafe)
+
+    def expected():
+        a1, a2, a3 = (arr.outputs[0].data for arr in (arr1, arr2, arr3))
+        return sqrt((a1 + a2) ** 2 + a3)
+
+    assert allclose(root.outputs[0].data, expected())
+    assert graph.touch() == 0
+    assert all(node.n_calls == 1 for node in (sum1, square, sum2, root))
+    # the transient outputs share the buffers and may not be read
+    with raises(CalculationError):
+        sum1.outputs[0].data
+
+    # the square is not recomputed, sum1 is recomputed since sum2 has overwritten its buffer
+    arr3.outputs[0].set(arr3.outputs[0].data * 2)
+    assert graph.schedule.tainted() == [root]
+    assert graph.touch() == 1
+    assert allclose(root.outputs[0].data, expected())
+    assert [node.n_calls for node in (sum1, square, sum2, root)] == [2, 1, 2, 2]
+
+    arr1.outputs[0].set(arr1.outputs[0].data * 2)
+    assert graph.touch() == 1
+    assert allclose(root.outputs[0].data, expected())
+    assert [node.n_calls for node in (sum1, square, sum2, root)] == [3, 2, 3, 3]
+
+    graph.open()
+    assert graph.memory_plan is None
+    assert not shares_memory(sum2.outputs[0].data_unsafe, sum1.outputs[0].data_unsafe)
+    a1, a2, a3 = (arr.outputs[0].data for arr in (arr1, arr2, arr3))
+    assert allclose(sum2.outputs[0].data, (a1 + a2) ** 2 + a3)
+
+
+def test_memoryplan_keep(debug_graph):
+    graph, _, (sum1, square, sum2, _) = _make_graph(debug_graph)
+    graph.close(memory_plan=True, keep=[square.outputs[0]])
+
+    assert set(graph.memory_plan.outputs) == {sum1.outputs[0], sum2.outputs[0]}
+
+
+def test_memoryplan_pull(debug_graph):
+    """The consumer of a transient output pulls the parent, whose transient shares the buffer"""
+    x = linspace(0.1, 1.0, 11)
+    with Graph(debug=debug_graph) as graph:
+        arr1 = Array("arr1", x)
+        arr2 = Array("arr2", 2.0 * x)
+        root = Sqrt("sqrt")
+        square = Square("square")
+        sine = Sin("sin")
+        expo = Exp("exp")
+        result = Sum("sum")
+        arr1 >> root >> square >> sine
+        arr2 >> expo
+        (square, expo) >> result
+    graph.close(memory_plan=True)
+
+    # the square is not transient, the consumer of the exponent pulls it after the exponent
+    # is evaluated, while the square evaluates the root, which shares the buffer
+    plan = graph.memory_plan
+    assert set(plan.outputs) == {root.outputs[0], expo.outputs[0]}
+    assert shares_memory(root.outputs[0].data_unsafe, expo.outputs[0].data_unsafe)
+
+    def expected():
+        return sqrt(arr1.outputs[0].data) ** 2 + exp(arr2.outputs[0].data)
+
+    assert allclose(result.outputs[0].data, expected())
+    arr1.outputs[0].set(arr1.outputs[0].data * 2)
+    assert allclose(result.outputs[0].data, expected())
+    assert allclose(sine.outputs[0].data, sin(2 * x))
@@ -0,0 +1,81 @@
+from gc import collect
+from threading import enumerate as threads
+
+from numpy import allclose, linspace
+from pytest import mark
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Exp, Product, Sum
+from dagflow.parallel import ParallelExecutor
+
+
+def _make_graph(debug_graph, nbranches: int = 8, size: int = 1000):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        x = Array("x", linspace(0.0, 1.0, size))
+        total = Sum("total")
+        branches = []
+        for i in range(nbranches):
+            scale = Array(f"scale {i}", linspace(0.0, 1.0, size) * i)
+            prod = Product(f"product {i}")
+            exp = Exp(f"exp {i}")
+            (x, scale) >> prod
+            prod >> exp
+            exp >> total
+            branches.append((prod, exp))
+    return graph, x, total, branches
+
+
+@mark.parametrize("nthreads", (None, 1, 2, 4))
+def test_parallel_touch(debug_graph, nthreads):
+    graph, x, total, branches = _make_graph(debug_graph)
+    graph_ref, _, total_ref, _ = _make_graph(debug_graph)
+
+    graph.set_parallel(nthreads)
+    assert (graph.executor is None) == (nthreads == 1)
+
+    # the arrays, the branches and the total
+    assert graph.touch() == 1 + 3 * len(branches) + 1
+    assert not total.tainted
+    assert all(node.n_calls == 1 for branch in branches for node in branch)
+    assert allclose(total.outputs[0].data, total_ref.outputs[0].data, rtol=0, atol=0)
+
+    x.outputs[0].set(linspace(1.0, 2.0, x.outputs[0].dd.size))
+    assert graph.touch() == 1 + 2 * len(branches)
+    assert all(node.n_calls == 2 for branch in branches for node in branch)
+    assert graph.touch() == 0
+
+    graph.set_parallel(1)
+    assert graph.executor is None
+
+
+def _count_threads() -> int:
+    return sum(thread.name.startswith("dagflow") for thread in threads())
+
+
+def test_parallel_shutdown(debug_graph):
+    graph = _make_graph(debug_graph)[0]
+    nthreads = _count_threads()
+
+    graph.set_parallel(2)
+    executor = graph.executor
+    assert graph.touch() > 0
+    assert _count_threads() > nthreads
+
+    # the previous pool is shut down
+    graph.set_parallel(2)
+    assert graph.executor is not executor
+    assert executor._pool._shutdown
+    graph.set_parallel(False)
+    assert graph.executor is None
+    assert _count_threads() == nthreads
+
+    # the pool is shut down, when the executor is collected
+    graph.set_parallel(True)
+    pool = graph.executor._pool
+    del graph
+    collect()
+    assert pool._shutdown
+
+    with ParallelExecutor(2) as executor:
+        pool = executor._pool
+    assert pool._shutdown
@@ -0,0 +1,44 @@
+from json import load
+
+from numpy import arange
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Exp, Sum
+from dagflow.profiler import Profiler
+
+
+def test_profiler_01(debug_graph, tmp_path):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(10, dtype="d"), mode="store_weak")
+        fexp = Exp("exp")
+        add = Sum("add")
+        arr >> fexp
+        (fexp, arr) >> add
+
+    fcn = add.fcn
+    with Profiler(graph) as profiler:
+        assert add.fcn is not fcn
+        add.outputs[0].data
+        arr.outputs[0].set(arange(10, dtype="d") + 1)
+        add.outputs[0].data
+    assert add.fcn is fcn
+
+    profiles = {profile.node: profile for profile in profiler.profiles}
+    assert profiles[add].n_calls == 2
+    assert profiles[fexp].n_calls == 2
+    assert profiles[add].nbytes == 2 * 10 * 8
+    time_expected = profiles[add].time_self + profiles[fexp].time_inclusive
+    assert abs(profiles[add].time_inclusive - time_expected) < 1e-9
+
+    # exp is evaluated from the function of the sum
+    stacks = profiler.collapsed_stacks()
+    assert any(line.startswith("add") and ";exp" in line for line in stacks)
+    assert "add" in profiler.report()
+
+    profiler.dump_json(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json") as file:
+        data = load(file)
+    assert {node["name"] for node in data["nodes"]} >= {"add", "exp"}
+
+    profiler.dump_collapsed(tmp_path / "profile.txt")
+    assert (tmp_path / "profile.txt").read_text().splitlines() == stacks
@@ -0,0 +1,47 @@
+from numpy import allclose, arange, array, linspace, meshgrid
+from pytest import mark, raises
+
+from dagflow.exception import DagflowError
+from dagflow.graph import Graph
+from dagflow.lib import Array
+from dagflow.lib.LinearFunction import LinearFunction
+from dagflow.parameters import Parameters
+from dagflow.scan import scan
+from dagflow.storage import NodeStorage
+
+
+@mark.parametrize("nprocesses", (1, 3))
+def test_scan(nprocesses):
+    x = arange(5, dtype="d")
+    with Graph(close_on_exit=True) as graph:
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        A, B = pars.parameters
+        storage = NodeStorage({"parameters": {"a": A, "b": B}})
+        f = LinearFunction("ax+b")
+        A >> f("a")
+        B >> f("b")
+        Array("x", x) >> f
+
+    a, b = meshgrid(linspace(-1, 1, 7), linspace(0, 3, 5), indexing="ij")
+    points = array([a.ravel(), b.ravel()]).T
+    res = scan(
+        f, storage, ("parameters.a", "parameters.b"), points, nprocesses=nprocesses, chunksize=4
+    )
+
+    assert res.shape == (len(points), len(x))
+    for point, row in zip(points, res):
+        assert allclose(row, point[0] * x + point[1], rtol=0, atol=0)
+
+    # the parameters of the current process are not changed
+    assert A.value == 1.0
+    assert B.value == 2.0
+    assert allclose(f.outputs[0].data, x + 2.0, rtol=0, atol=0)
+
+    with raises(ValueError):
+        scan(f, storage, ("parameters.a", "parameters.b"), points[:, :1])
+
+    # the pool of the parallel executor is not forked
+    graph.set_parallel(2)
+    with raises(DagflowError):
+        scan(f, storage, ("parameters.a", "parameters.b"), points, nprocesses=2)
+    graph.set_parallel(1)
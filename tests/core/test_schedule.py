@@ -0,0 +1,65 @@
+from numpy import arange, array
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Product, Sum
+from dagflow.schedule import Schedule
+
+
+def _make_graph(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr1 = Array("arr1", arange(3, dtype="d"))  # [0, 1, 2]
+        arr2 = Array("arr2", array((3, 2, 1), dtype="d"))
+        arr3 = Array("unity", array((1, 1, 1), dtype="d"))
+        sum1 = Sum("sum1")
+        sum2 = Sum("sum2")
+        prod = Product("product")
+        (arr1, arr2, arr3) >> sum1  # [4, 4, 4]
+        (arr3, sum1) >> prod  # [4, 4, 4]
+        (arr1, prod) >> sum2  # [4, 5, 6]
+    return graph, (arr1, arr2, arr3), (sum1, prod, sum2)
+
+
+def test_schedule_order(debug_graph):
+    graph, arrays, (sum1, prod, sum2) = _make_graph(debug_graph)
+
+    schedule = graph.schedule
+    assert schedule is not None
+    assert len(schedule) == 6
+    for node in schedule:
+        for input in node.inputs.iter_all():
+            assert schedule.index(input.parent_node) < schedule.index(node)
+
+    partial = Schedule.from_targets(prod.outputs[0])
+    assert sum2 not in partial
+    assert all(node in partial for node in (sum1, prod, *arrays))
+
+
+def test_schedule_touch(debug_graph):
+    graph, (arr1, _, _), (sum1, prod, sum2) = _make_graph(debug_graph)
+
+    # the arrays are tainted after closing as well
+    assert graph.schedule.tainted()[-3:] == [sum1, prod, sum2]
+    assert graph.touch() == 6
+    assert not graph.schedule.tainted()
+    assert (sum2.outputs["result"].data == [4, 5, 6]).all()
+    assert graph.touch() == 0
+
+    arr1.outputs[0].set(array((1, 1, 1), dtype="d"))
+    assert graph.schedule.tainted() == [sum1, prod, sum2]
+    assert graph.touch() == 3
+    assert (sum2.outputs["result"].data == [6, 5, 4]).all()
+    assert all(node.n_calls == 2 for node in (sum1, prod, sum2))
+
+    graph.open()
+    assert graph.schedule is None
+
+
+def test_input_callbacks(debug_graph):
+    """Each parent is touched once, even if it is connected to several inputs"""
+    with Graph(debug=debug_graph, close_on_exit=True):
+        arr = Array("arr", arange(3, dtype="d"))
+        other = Array("other", arange(3, dtype="d"))
+        add = Sum("add")
+        (arr, other, arr) >> add
+    assert add._input_nodes_callbacks == [arr.touch, other.touch]
+    assert (add.outputs[0].data == 3 * arange(3)).all()
@@ -0,0 +1,152 @@
+from gc import collect
+
+from numpy import allclose, arange, exp, linspace, memmap
+from pytest import raises
+
+from dagflow.exception import DagflowError
+from dagflow.graph import Graph
+from dagflow.lib import Array, Copy, Exp, InterpolatorGroup, Sum, View
+from dagflow.snapshot import _root, load_snapshot, save_snapshot
+from dagflow.storage import NodeStorage
+
+
+def test_snapshot_01(debug_graph, tmp_path):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(10, dtype="d"), mode="store_weak")
+        view = View("view", arr.outputs[0], start=2, length=5)
+        fexp = Exp("exp")
+        add = Sum("add")
+        view >> fexp
+        (fexp, view) >> add
+    storage = NodeStorage({"nodes": {"add": add, "arr": arr}})
+    expected = exp(arange(2, 7)) + arange(2, 7)
+    assert allclose(add.outputs[0].data, expected)
+
+    filename = tmp_path / "graph.snapshot"
+    save_snapshot(filename, graph, storage)
+
+    graph2, storage2 = load_snapshot(filename)
+    add2 = storage2["nodes.add"]
+    arr2 = storage2["nodes.arr"]
+    assert graph2.closed
+    assert add2 in graph2._nodes_set
+    assert add2.labels.text == add.labels.text
+    assert add2.outputs[0].dd.shape == (5,)
+    assert isinstance(_root(arr2.outputs[0].data), memmap)
+    assert allclose(add2.outputs[0].data, expected)
+
+    # the view shares the data with the array after loading
+    arr2.outputs[0].set(arange(10, dtype="d") + 1)
+    assert allclose(add2.outputs[0].data, exp(arange(3, 8)) + arange(3, 8))
+    # the original graph and the file are not modified
+    assert allclose(add.outputs[0].data, expected)
+    graph3, _ = load_snapshot(filename)
+    assert allclose(graph3._nodes[0].outputs[0].data, arange(10))
+
+
+def test_snapshot_metanode(debug_graph, tmp_path):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        coarse = Array("coarse", linspace(0.0, 10.0, 11))
+        fine = Array("fine", linspace(-1.0, 11.0, 25))
+        yc = Array("yc", 2.0 * linspace(0.0, 10.0, 11) + 1.0)
+        metaint = InterpolatorGroup(method="linear")
+        coarse >> metaint.inputs["coarse"]
+        yc >> metaint.inputs[0]
+        fine >> metaint.inputs["fine"]
+    storage = NodeStorage({"nodes": {"interpolator": metaint}})
+    expected = 2.0 * linspace(-1.0, 11.0, 25) + 1.0
+    assert allclose(metaint.outputs[0].data, expected)
+
+    filename = tmp_path / "graph.snapshot"
+    save_snapshot(filename, graph, storage)
+    graph2, storage2 = load_snapshot(filename)
+    collect()
+
+    metaint2 = storage2["nodes.interpolator"]
+    assert metaint2 is not metaint
+    assert all(node.metanode is metaint2 for node in metaint2._nodes)
+    assert all(node in graph2._nodes_set for node in metaint2._nodes)
+    assert allclose(metaint2.outputs[0].data, expected)
+
+    yc2 = next(node for node in graph2._nodes if node.name == "yc")
+    yc2.outputs[0].set(3.0 * linspace(0.0, 10.0, 11))
+    assert allclose(metaint2.outputs[0].data, 3.0 * linspace(-1.0, 11.0, 25))
+
+
+def test_snapshot_deep(tmp_path):
+    """The graph, deeper than the recursion limit, is saved without the deep recursion"""
+    from sys import getrecursionlimit
+
+    depth = 2 * getrecursionlimit()
+    with Graph(close_on_exit=True) as graph:
+        prev = Array("arr", arange(3, dtype="d"))
+        for i in range(depth):
+            node = Copy(f"copy {i}")
+            prev >> node
+            prev = node
+    storage = NodeStorage({"nodes": {"last": prev}})
+
+    filename = tmp_path / "graph.snapshot"
+    save_snapshot(filename, graph, storage)
+    graph2, storage2 = load_snapshot(filename)
+    assert len(graph2._nodes) == depth + 1
+    graph2._nodes[0].outputs[0].set(arange(3, dtype="d") + 1)
+    assert graph2.touch() == depth
+    assert (storage2["nodes.last"].outputs[0].data == [1, 2, 3]).all()
+
+
+def test_snapshot_checks(tmp_path):
+    with Graph() as graph:
+        Array("arr", arange(3, dtype="d"))
+    with raises(DagflowError):
+        save_snapshot(tmp_path / "graph.snapshot", graph)
+
+
+_snapshot_save_code = """
+from sys import argv
+from numpy import array
+from dagflow.graph import Graph
+from dagflow.lib import Array, Sum
+from dagflow.snapshot import save_snapshot
+from dagflow.storage import NodeStorage
+
+with Graph(close_on_exit=True) as graph:
+    arr = Array("arr", array([1.0]))
+    sum1 = Sum("sum1")
+    sum2 = Sum("sum2")
+    arr >> sum1
+    (sum1, arr) >> sum2
+arr.outputs[0].set(array([2.0]))
+sum2.outputs[0].data
+save_snapshot(argv[1], graph, NodeStorage({"arr": arr, "sum": sum2}))
+"""
+
+_snapshot_load_code = """
+from sys import argv
+from numpy import array
+from dagflow.snapshot import load_snapshot
+
+_, storage = load_snapshot(argv[1])
+storage["arr"].outputs[0].set(array([5.0]))
+print(storage["sum"].outputs[0].data[0])
+"""
+
+
+def test_snapshot_process(tmp_path):
+    """The graph is saved and loaded in the new processes, the taint propagation is consistent"""
+    from os.path import dirname
+    from subprocess import run
+    from sys import executable
+
+    import dagflow
+
+    filename = str(tmp_path / "graph.snapshot")
+    for code in (_snapshot_save_code, _snapshot_load_code):
+        result = run(
+            [executable, "-c", code, filename],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=dirname(dirname(dagflow.__file__)),
+        )
+    assert float(result.stdout) == 10.0
@@ -0,0 +1,88 @@
+from numpy import arange, array, exp
+
+from dagflow.graph import Graph
+from dagflow.lib import Array, Exp, Sum
+from dagflow.parameters import Parameters
+
+
+def _make_diamonds(nlayers: int, debug_graph: bool = False):
+    """Make `nlayers` layers of two sums, each connected to both sums of the previous layer"""
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        arr = Array("arr", arange(3, dtype="d"), mode="store_weak")
+        prev = (arr, arr)
+        for i in range(nlayers):
+            layer = (Sum(f"sum {i}a"), Sum(f"sum {i}b"))
+            for node in layer:
+                prev >> node
+            prev = layer
+    return graph, arr, prev
+
+
+def test_taint_diamonds(debug_graph):
+    nlayers = 30
+    graph, arr, (head, tail) = _make_diamonds(nlayers, debug_graph)
+    graph.touch()
+    assert not head.tainted
+
+    output = arr.outputs[0]
+    output.set(array((1, 1, 1), dtype="d"))
+    assert output.n_tainted == 2 * nlayers
+    assert graph.schedule.tainted()[-2:] == [head, tail]
+
+    assert graph.touch() == 2 * nlayers
+    assert (head.outputs[0].data == 2**nlayers).all()
+
+    # each node is visited only once even with force
+    assert arr.taint_children(force=True) == 2 * nlayers
+    assert arr.taint_children() == 0
+
+
+def test_taint_counter_parameter(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        A, B = pars.parameters
+        sum1 = Sum("a+b")
+        (A.output, B.output) >> sum1
+        sum2 = Sum("a+b+a")
+        (sum1, A.output) >> sum2
+
+    assert sum2.outputs[0].data[0] == 4.0
+    A.value = 2.0
+    # both views, sum1 and sum2 are tainted
+    assert A.n_tainted == 4
+    assert sum2.outputs[0].data[0] == 6.0
+
+
+def test_taint_partial(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True):
+        arr1 = Array("arr1", arange(3, dtype="d"), mode="store_weak")
+        arr2 = Array("arr2", -arange(3, dtype="d"), mode="store_weak")
+        fexp = Exp("exp")
+        arr1 >> fexp
+        arr2 >> fexp
+        sum1 = Sum("sum1")
+        sum2 = Sum("sum2")
+        fexp.outputs[0] >> sum1
+        fexp.outputs[1] >> sum2
+
+    assert fexp.dependent_outputs(fexp.inputs[1]) == (fexp.outputs[1],)
+    sum1.touch()
+    sum2.touch()
+
+    arr2.outputs[0].set(array((1, 1, 1), dtype="d"))
+    assert fexp.tainted and fexp.fd.tainted_outputs == {fexp.outputs[1]}
+    assert sum2.tainted and not sum1.tainted
+    # the partially tainted node is stamped as well
+    assert fexp.fd.taint_generation == sum2.fd.taint_generation
+
+    # only the tainted pair is recomputed
+    out0 = fexp.outputs[0].data_unsafe
+    out0[:] = -1
+    assert (sum2.outputs[0].data == exp(1)).all()
+    assert (out0 == -1).all()
+    assert not fexp.tainted and fexp.fd.tainted_outputs is None
+
+    # the full taint recomputes all the pairs
+    fexp.taint()
+    assert sum1.tainted and sum2.tainted
+    assert (sum1.outputs[0].data == exp(arange(3))).all()
@@ -0,0 +1,51 @@
+from pytest import raises
+
+from dagflow.exception import DagflowError
+from dagflow.graph import Graph
+from dagflow.lib import Exp, Sum
+from dagflow.output import Output
+from dagflow.parameters import Parameters
+from dagflow.tracer import TaintTracer
+
+
+def test_tracer_01(debug_graph):
+    with Graph(debug=debug_graph, close_on_exit=True) as graph:
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"))
+        A, B = pars.parameters
+        sum1 = Sum("a+b")
+        (A.output, B.output) >> sum1
+        sum2 = Sum("a+b+a")
+        (sum1, A.output) >> sum2
+        expb = Exp("exp(b)")
+        B.output >> expb
+    graph.touch()
+
+    with TaintTracer(graph, [pars]) as tracer:
+        assert Output._taint_tracer is tracer
+        with raises(DagflowError):
+            TaintTracer(graph, [pars])
+
+        A.value = 2.0
+        assert A.n_tainted == 5
+        # both views share the common output and are tainted
+        assert sum2.outputs[0].data[0] == 6.0
+        B.value = 3.0
+        graph.touch()
+    assert Output._taint_tracer is None
+
+    trace_a, trace_b = tracer.traces[:2]
+    assert trace_a.n_changes == 1
+    assert trace_a.n_tainted == 5
+    # the views, sum1 and sum2, exp(b) is not evaluated
+    assert trace_a.n_evaluated == 4
+    assert sum2 in trace_a.evaluated and expb not in trace_a.evaluated
+
+    # exp(b) was already tainted
+    assert trace_b.n_changes == 1
+    assert trace_b.n_tainted == 4
+    assert trace_b.n_evaluated == 4
+    assert expb not in trace_b.evaluated
+
+    assert tracer.sorted("n_changes")[0].n_changes == 1
+    assert len(tracer.report().splitlines()) == 3
+    assert len(tracer.to_dict()["parameters"]) == 2
@@ -6,7 +6,7 @@ from pytest import mark
 from dagflow import lib
 from dagflow.graph import Graph
 from dagflow.graphviz import savegraph
-from dagflow.lib import Array, Division, Product, Sum
+from dagflow.lib import Array, Division, Product, Sum, WeightedSum
 
 
 @mark.parametrize("dtype", ("d", "f"))
@@ -64,6 +64,66 @@ def test_Product_01(testname, debug_graph, dtype):
     savegraph(graph, f"output/{testname}.png")
 
 
+@mark.parametrize("cls", (Sum, Product))
+def test_incremental_01(debug_graph, cls):
+    arrays_in = [linspace(1.0, 2.0, 5) * (i + 1) for i in range(6)]
+
+    with Graph(close_on_exit=True, debug=debug_graph):
+        arrays = tuple(Array(f"arr_{i}", array_in) for i, array_in in enumerate(arrays_in))
+        node = cls("node", incremental=3)
+        arrays >> node
+
+    def check():
+        res = numpy.sum(arrays_in, axis=0) if cls is Sum else numpy.prod(arrays_in, axis=0)
+        assert allclose(node.outputs[0].data, res, rtol=1e-12, atol=0)
+
+    check()
+    for step in range(8):
+        i = step % len(arrays)
+        arrays_in[i] = arrays_in[i] * 1.5 + step
+        arrays[i].outputs[0].set(arrays_in[i])
+        check()
+        # the full recomputation each 3 incremental steps
+        assert node._incremental_steps == (step + 1) % 4
+
+    # a zero in the previous value forces the full recomputation of the product
+    arrays_in[0] = arrays_in[0] * 0.0
+    arrays[0].outputs[0].set(arrays_in[0])
+    check()
+    arrays_in[0] = arrays_in[0] + 1.0
+    arrays[0].outputs[0].set(arrays_in[0])
+    check()
+
+
+@mark.parametrize("nweights", (1, 3))
+def test_incremental_WeightedSum(debug_graph, nweights):
+    arrays_in = [arange(4, dtype="d") * (i + 1) for i in range(3)]
+    weights_in = linspace(0.5, 1.5, nweights)
+
+    with Graph(close_on_exit=True, debug=debug_graph):
+        arrays = tuple(Array(f"arr_{i}", array_in) for i, array_in in enumerate(arrays_in))
+        weights = Array("weights", weights_in)
+        ws = WeightedSum("ws", incremental=10)
+        arrays >> ws
+        weights >> ws("weight")
+
+    def check():
+        w = weights_in if nweights > 1 else weights_in.repeat(3)
+        res = numpy.sum([array_in * weight for array_in, weight in zip(arrays_in, w)], axis=0)
+        assert allclose(ws.outputs[0].data, res, rtol=1e-12, atol=0)
+
+    check()
+    arrays_in[1] = arrays_in[1] + 2.0
+    arrays[1].outputs[0].set(arrays_in[1])
+    check()
+    assert ws._incremental_steps == 1
+
+    weights_in = weights_in * 2.0
+    weights.outputs[0].set(weights_in)
+    check()
+    assert ws._incremental_steps == 0
+
+
 @mark.parametrize("dtype", ("d", "f"))
 def test_Division_01(testname, debug_graph, dtype):
     arrays_in = tuple(arange(12, dtype=dtype) * i + 1 for i in (1, 2, 3))
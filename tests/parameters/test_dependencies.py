@@ -0,0 +1,71 @@
+from numpy import allclose, arange
+
+from dagflow.graph import Graph
+from dagflow.lib import Product, Sum
+from dagflow.lib.Array import Array
+from dagflow.lib.Jacobian import Jacobian
+from dagflow.parameters import Parameters
+from dagflow.tools.dependencies import ParameterDependencies
+from dagflow.tools.graphwalker import GraphWalker
+
+
+def test_parameter_dependencies():
+    x = arange(5, dtype="d")
+    with Graph(close_on_exit=True):
+        X = Array("x", x)
+        pars = Parameters.from_numbers(
+            [1.0, 2.0, 3.0, 4.0], names=list("abcd"), sigma=[0.1, 0.2, 0.3, 0.4]
+        )
+        A, B, C, _ = pars.outputs()
+        Y = Sum.from_args("ax+bx", Product.from_args("ax", A, X), Product.from_args("bx", B, X))
+        Z = Product.from_args("cx", C, X)
+
+        jacobian = Jacobian("jacobian", parameters=pars.parameters)
+        Y >> jacobian
+
+    a, b, c, d = pars.parameters
+    dependencies = ParameterDependencies(pars.parameters)
+    assert dependencies.parameters_of(Y.outputs[0]) == [a, b]
+    assert dependencies.parameters_of(Z.outputs[0]) == [c]
+    assert dependencies.parameters_of(X.outputs[0]) == []
+    assert d.output in dependencies.outputs_of(d)
+    assert Y.outputs[0] not in dependencies.outputs_of(d)
+    assert Y.outputs[0] in dependencies.outputs_of(a)
+    assert dependencies.depends(Z.outputs[0], c)
+    assert not dependencies.depends(Z.outputs[0], a)
+    assert dependencies.mask(Y.outputs[0]).tolist() == [True, True, False, False]
+    assert dependencies.mask(Y.outputs[0], [d, b]).tolist() == [False, True]
+
+    # the zero columns are not computed
+    assert jacobian.nonzero_columns().tolist() == [0, 1]
+    jac = jacobian.outputs[0].data
+    assert allclose(jac[:, :2], x[:, None], atol=1e-10, rtol=0)
+    assert (jac[:, 2:] == 0.0).all()
+
+
+def test_parameter_dependencies_correlated():
+    with Graph(close_on_exit=True):
+        X = Array("x", arange(5, dtype="d"))
+        pars = Parameters.from_numbers(
+            [1.0, 2.0, 3.0],
+            names=list("abc"),
+            sigma=[0.1, 0.2, 0.3],
+            correlation=[[1.0, 0.5, 0.0], [0.5, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        )
+        A, _, _ = pars.outputs()
+        Y = Product.from_args("ax", A, X)
+
+    # the values depend on all the normalized values of the correlated group
+    dependencies = ParameterDependencies(pars.norm_parameters + pars.parameters)
+    assert dependencies.parameters_of(Y.outputs[0]) == pars.norm_parameters + pars.parameters[:1]
+
+
+def test_graphwalker_nodes_sorted():
+    with Graph(close_on_exit=True):
+        X = Array("x", arange(5, dtype="d"))
+        Y = Sum.from_args("y", X, X)
+        Z = Product.from_args("z", X, Y)
+
+    order = GraphWalker(Z).nodes_sorted()
+    assert len(order) == 3
+    assert order.index(X) < order.index(Y) < order.index(Z)
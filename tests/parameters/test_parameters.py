@@ -1,11 +1,12 @@
-from pytest import mark
-from numpy import allclose, square
+from pytest import mark, raises
+from numpy import allclose, arange, exp, linspace, square
 
 from dagflow.exception import CriticalError
 from dagflow.graph import Graph
 from dagflow.graphviz import savegraph
-from dagflow.lib import Array
-from dagflow.parameters import GaussianParameters, Parameter
+from dagflow.lib import Array, Exp, Product, Sum
+from dagflow.parameters import GaussianParameters, Parameter, Parameters, ParametersSetter
+from dagflow.storage import NodeStorage
 
 
 @mark.parametrize("mode", ("single", "uncorr", "cov", "cov1d"))
@@ -120,3 +121,88 @@ def test_parameters_01():
         par.value = 4.0
         assert par.value == 4.0
     assert par.value == val_init
+
+
+def test_parameters_batch():
+    nbatch, n = 4, 5
+    x = arange(n, dtype="d")
+    with Graph(debug=False, close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"), batch=nbatch)
+        A, B = pars.parameters
+        ax = Product("a*x")
+        (A.output, Array("x", x)) >> ax
+        axb = Sum("a*x+b")
+        (ax, B.output) >> axb
+        res = Exp("exp(a*x+b)")
+        axb >> res
+
+    assert A.output.dd.shape == (nbatch, 1)
+    assert res.outputs[0].dd.shape == (nbatch, n)
+    assert allclose(res.outputs[0].data, exp(x + 2.0)[None, :], atol=0, rtol=0)
+
+    avals = linspace(0.0, 1.0, nbatch)
+    bvals = linspace(-1.0, 1.0, nbatch)
+    A.value = avals
+    B.value = bvals
+    assert allclose(A.value, avals, atol=0, rtol=0)
+    assert allclose(
+        res.outputs[0].data,
+        exp(avals[:, None] * x[None, :] + bvals[:, None]),
+        atol=0,
+        rtol=0,
+    )
+
+
+def test_parameters_set_values():
+    with Graph(debug=False, close_on_exit=True):
+        pars1 = Parameters.from_numbers(value=[1.0, 2.0, 3.0], names=("a", "b", "c"))
+        pars2 = Parameters.from_numbers(value=[4.0], names=("d",))
+        total = Sum("sum")
+        (*(par.output for par in pars1.parameters), pars2.parameters[0].output) >> total
+    storage = NodeStorage(
+        {name: par for name, par in zip("abcd", (*pars1.parameters, *pars2.parameters))}
+    )
+    assert total.outputs[0].data[0] == 10.0
+
+    assert pars1.set_values([2.0, 3.0, 4.0]) == 4  # the views and the sum
+    assert total.tainted
+    assert total.outputs[0].data[0] == 13.0
+    assert pars1.set_values([2.0, 3.0, 4.0], check_taint=True) == 0
+    assert not total.tainted
+
+    assert storage.set_parameters({"d": 1.0, "a": 0.0}) == 4
+    assert [par.value for par in storage.walkvalues()] == [0.0, 3.0, 4.0, 1.0]
+    assert total.outputs[0].data[0] == 8.0
+
+    setter = ParametersSetter(storage)
+    assert len(setter) == 4
+    assert setter([1.0, 1.0, 1.0, 1.0]) == 4
+    assert total.outputs[0].data[0] == 4.0
+    # only the first group is modified
+    assert setter([1.0, 1.0, 2.0, 1.0], check_taint=True) == 4
+    assert total.outputs[0].data[0] == 5.0
+
+    storage.set_vector([0.0, 1.0, 2.0, 3.0])
+    assert total.outputs[0].data[0] == 6.0
+
+    with raises(ValueError):
+        setter([1.0])
+    with raises(ValueError):
+        storage.set_parameters({"a": 1.0, ("a",): 2.0})
+
+
+def test_parameters_set_values_batch():
+    nbatch = 3
+    with Graph(debug=False, close_on_exit=True):
+        pars = Parameters.from_numbers(value=[1.0, 2.0], names=("a", "b"), batch=nbatch)
+        A, B = pars.parameters
+        total = Sum("a+b")
+        (A.output, B.output) >> total
+
+    avals = linspace(0.0, 1.0, nbatch)
+    pars.set_values([[1.0, 2.0]] * nbatch)
+    assert allclose(total.outputs[0].data, 3.0, atol=0, rtol=0)
+
+    ParametersSetter((B, A))([avals, 2 * avals])
+    assert allclose(A.value, 2 * avals, atol=0, rtol=0)
+    assert allclose(total.outputs[0].data.ravel(), 3 * avals, atol=0, rtol=0)